@@ -2,25 +2,135 @@
 """
 Generate a test PDF with an AcroForm signature field placeholder.
 
-Uses fpdf2 to create a valid one-page PDF, then uses pyHanko to add
-a pre-existing empty signature field named "Signature1".
+Starts from the pre-rendered one-page template in
+server/fixtures/base-template.pdf, then appends a PDF incremental update
+that adds a pre-existing empty signature field named "Signature1".
 
-Prerequisites (install once):
-  pip install fpdf2 pyHanko
+The template layout never changes, so it is rendered once with fpdf2 and
+committed.  To re-render it after editing the layout, run with
+``--template`` (requires fpdf2).
+
+The update is written by hand (same objects pyHanko's
+append_signature_field would emit: /AcroForm, a /Sig widget with an
+empty appearance, and the page's /Annots), so generating the fixture
+needs no PDF library at all.
+
+Prerequisites (only for --template):
+  pip install fpdf2
 
 Output: server/fixtures/test-document.pdf
 """
 
-import io
+import re
+import sys
 from pathlib import Path
 
-from fpdf import FPDF
-from pyhanko.pdf_utils.incremental_writer import IncrementalPdfFileWriter
-from pyhanko.sign.fields import SigFieldSpec, append_signature_field
-
+FIXTURES_DIR = Path(__file__).resolve().parent / "server" / "fixtures"
+TEMPLATE_PATH = FIXTURES_DIR / "base-template.pdf"
+OUTPUT_PATH = FIXTURES_DIR / "test-document.pdf"
+
+# ── Template layout (fpdf2 units: mm, top-left origin) ─────────────────────
+# fpdf2 default is A4 (210x297mm = 595.28x841.89pt).
+PAGE_H = 297.0
+RECT_X = 30        # signature placeholder box
+RECT_Y = 113       # pdf.get_y() after the metadata lines
+RECT_W = 150
+RECT_H = 50
+
+# ── Signature field box (PDF coords: pt, bottom-left origin) ───────────────
+# fpdf2 uses top-left origin (Y increases downward).
+# PDF spec uses bottom-left origin (Y increases upward).
+MM_TO_PT = 72.0 / 25.4  # exact: 1in = 25.4mm = 72pt
+PAGE_H_PT = PAGE_H * MM_TO_PT
+SIG_BOX_PT = (
+    RECT_X * MM_TO_PT,                             # x1
+    PAGE_H_PT - (RECT_Y + RECT_H) * MM_TO_PT,      # y1: bottom of rect
+    (RECT_X + RECT_W) * MM_TO_PT,                  # x2
+    PAGE_H_PT - RECT_Y * MM_TO_PT,                 # y2: top of rect
+)
+
+SIG_FIELD_NAME = "Signature1"
+
+# ── Minimal PDF plumbing for the incremental update ────────────────────────
+# The template is a small classic-xref file produced by fpdf2, so a couple of
+# regexes are enough to find the objects we need to amend.  Each object is
+# delimited by its own endobj first; its dictionary is parsed afterwards.
+_OBJ_RE = re.compile(rb"(?m)^(\d+) 0 obj\b(.*?)\bendobj", re.S)
+_TRAILER_RE = re.compile(rb"trailer\s*<<(.*?)>>\s*startxref\s*(\d+)", re.S)
+
+
+def _dict_objects(pdf: bytes) -> dict:
+    """Map object number → dictionary body for every plain dictionary object.
+
+    Stream objects (page contents, fonts) are skipped: only the catalog and
+    the page are amended, and a stream's dictionary is followed by its data.
+    """
+    objs = {}
+    for num, body in _OBJ_RE.findall(pdf):
+        body = body.strip()
+        if body.startswith(b"<<") and body.endswith(b">>"):
+            objs[int(num)] = body[2:-2]
+    return objs
+
+
+def _ref_num(dict_body: bytes, key: bytes) -> int:
+    return int(re.search(rb"/" + key + rb"\s+(\d+) 0 R", dict_body).group(1))
+
+
+def append_signature_field(base: bytes, name: str, box: tuple) -> bytes:
+    """Return *base* plus an incremental update adding an empty /Sig field."""
+    trailer, prev_xref = _TRAILER_RE.findall(base)[-1]
+    size = int(re.search(rb"/Size\s+(\d+)", trailer).group(1))
+    root_num = _ref_num(trailer, b"Root")
+    objs = _dict_objects(base)
+    page_num = next(
+        num for num, body in objs.items() if re.search(rb"/Type\s*/Page\b", body)
+    )
+
+    acroform_num, widget_num, ap_num = size, size + 1, size + 2
+    x1, y1, x2, y2 = box
+    rect = f"[{x1:.2f} {y1:.2f} {x2:.2f} {y2:.2f}]".encode()
+    bbox = f"[0 0 {x2 - x1:.2f} {y2 - y1:.2f}]".encode()
+
+    updated = {
+        root_num: objs[root_num].rstrip() + b"\n/AcroForm %d 0 R\n" % acroform_num,
+        page_num: objs[page_num].rstrip() + b"\n/Annots [%d 0 R]\n" % widget_num,
+        acroform_num: b"\n/Fields [%d 0 R]\n/SigFlags 1\n" % widget_num,
+        widget_num: (
+            b"\n/FT /Sig\n/T (" + name.encode("latin-1") + b")\n/Type /Annot"
+            b"\n/Subtype /Widget\n/F 132\n/Rect " + rect
+            + b"\n/P %d 0 R\n/AP <</N %d 0 R>>\n" % (page_num, ap_num)
+        ),
+    }
+
+    out = bytearray(base)
+    if not out.endswith(b"\n"):
+        out += b"\n"
+    offsets = {}
+    for num in sorted(updated):
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n<<%b>>\nendobj\n" % (num, updated[num])
+    offsets[ap_num] = len(out)
+    out += (
+        b"%d 0 obj\n<<\n/BBox %b\n/Resources <<>>\n/Type /XObject\n"
+        b"/Subtype /Form\n/Length 0\n>>\nstream\n\nendstream\nendobj\n"
+    ) % (ap_num, bbox)
+
+    xref_pos = len(out)
+    out += b"xref\n0 1\n0000000000 65535 f \n"
+    for num in sorted(offsets):
+        out += b"%d 1\n%010d 00000 n \n" % (num, offsets[num])
+    new_trailer = re.sub(rb"/Size\s+\d+", b"/Size %d" % (ap_num + 1), trailer)
+    out += b"trailer\n<<%b/Prev %b\n>>\nstartxref\n%d\n%%%%EOF\n" % (
+        new_trailer.rstrip() + b"\n", prev_xref, xref_pos,
+    )
+    return bytes(out)
+
+
+def render_base_template() -> bytearray:
+    """Lay out the one-page template with fpdf2 (only needed to re-render the fixture)."""
+    from fpdf import FPDF
 
-def main():
-    # ── Step 1: Create a basic valid PDF with fpdf2 ──────────────────────
     pdf = FPDF()
     pdf.set_auto_page_break(auto=False)
     pdf.add_page()
@@ -49,51 +159,41 @@ def main():
 
     # Signature placeholder area (visual hint)
     pdf.ln(20)
-    rect_y = pdf.get_y()  # capture Y in fpdf coords (top-left origin)
-    rect_h = 50
+    assert pdf.get_y() == RECT_Y, "layout changed — update RECT_Y"
     pdf.set_draw_color(180, 180, 180)
     pdf.set_fill_color(245, 245, 245)
-    pdf.rect(30, rect_y, 150, rect_h, style="DF")
-    pdf.set_xy(35, rect_y + 5)
+    pdf.rect(RECT_X, RECT_Y, RECT_W, RECT_H, style="DF")
+    pdf.set_xy(RECT_X + 5, RECT_Y + 5)
     pdf.set_font("Helvetica", "", 10)
     pdf.set_text_color(150, 150, 150)
     pdf.cell(0, 8, "[Digital Signature - Signature1]")
-    pdf.set_xy(35, pdf.get_y() + 12)
+    pdf.set_xy(RECT_X + 5, pdf.get_y() + 12)
     pdf.cell(0, 8, "This area will be filled by the signing process.")
 
-    base_pdf_bytes = pdf.output()
-
-    # ── Step 2: Add AcroForm signature field via pyHanko ─────────────────
-    # fpdf2 uses top-left origin (Y increases downward).
-    # PDF spec uses bottom-left origin (Y increases upward).
-    # Page height for A4 default = 841.89pt, for Letter = 792pt.
-    # fpdf2 default is A4 (210x297mm = 595.28x841.89pt).
-    page_h = pdf.h  # page height in points (fpdf2 units = mm by default → convert)
-    # fpdf2 default unit is mm; page_h is in mm. Convert to pt: 1mm = 2.835pt
-    page_h_pt = page_h * 2.835
-    # Convert fpdf2 rect coords (mm, top-left origin) to PDF coords (pt, bottom-left origin)
-    x1 = 30 * 2.835
-    y1 = page_h_pt - (rect_y + rect_h) * 2.835  # bottom of rect in PDF coords
-    x2 = (30 + 150) * 2.835
-    y2 = page_h_pt - rect_y * 2.835              # top of rect in PDF coords
-
-    input_buf = io.BytesIO(base_pdf_bytes)
-    writer = IncrementalPdfFileWriter(input_buf)
-    append_signature_field(writer, SigFieldSpec(
-        sig_field_name="Signature1",
-        box=(x1, y1, x2, y2),
-    ))
-
-    output_buf = io.BytesIO()
-    writer.write(output_buf)
-    final_bytes = output_buf.getvalue()
+    # fpdf2 >= 2.x already builds the document in a bytearray; hand that
+    # buffer back as-is instead of copying it into an immutable bytes.
+    return pdf.output()
 
-    # ── Step 3: Save ─────────────────────────────────────────────────────
-    out_path = Path(__file__).resolve().parent / "server" / "fixtures" / "test-document.pdf"
+
+def main():
+    if "--template" in sys.argv:
+        FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+        TEMPLATE_PATH.write_bytes(render_base_template())
+        print(f"Rendered base template: {TEMPLATE_PATH}")
+
+    out_path = OUTPUT_PATH
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_bytes(final_bytes)
-    print(f"Generated test PDF with AcroForm field 'Signature1'")
-    print(f"  Size: {len(final_bytes)} bytes")
+
+    # ── Step 1: Load the pre-rendered template ───────────────────────────
+    base = TEMPLATE_PATH.read_bytes()
+
+    # ── Step 2: Append the AcroForm signature field ──────────────────────
+    pdf_bytes = append_signature_field(base, SIG_FIELD_NAME, SIG_BOX_PT)
+
+    # ── Step 3: Save ─────────────────────────────────────────────────────
+    out_path.write_bytes(pdf_bytes)
+    print(f"Generated test PDF with AcroForm field '{SIG_FIELD_NAME}'")
+    print(f"  Size: {out_path.stat().st_size} bytes")
     print(f"  Path: {out_path}")
 
 
@@ -16,18 +16,35 @@ Works on Windows, macOS, and Linux.
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 import os
 import platform
 import shutil
 import sys
 from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # optional speed-up; stdlib json is fine for registration
+    import json
+
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
 
 HOST_NAME = "com.ase.signer"
 CHROME_EXTENSION_ID = "hjfiglgfjnfceahiccedeimkgabclkpc"
 FIREFOX_EXTENSION_ID = "signbridge@ase.ro"
 
 SYSTEM = platform.system()
+SCRIPT_DIR = Path(__file__).resolve().parent.parent  # host/
+_HOME = Path.home()
+
+if SYSTEM == "Windows":
+    import winreg
 
 # ─── Chrome-family manifest ─────────────────────────────────────────────────
 
@@ -57,119 +74,166 @@ def _firefox_manifest(exe_path: str) -> dict:
 
 # ─── Registration locations by browser and platform ─────────────────────────
 
-def _get_browser_targets() -> list[dict]:
-    """
-    Return a list of browser targets with their manifest paths and registry keys.
+class BrowserTarget(NamedTuple):
+    """A browser the host manifest is registered with."""
+
+    name: str                          # human-readable browser name
+    family: str                        # "chrome" or "firefox" (determines manifest format)
+    manifest_dir: Path | None = None   # directory where the manifest JSON goes (macOS/Linux)
+    registry_key: str | None = None    # Windows registry key (Windows only)
 
-    Each target is a dict with:
-      - name: human-readable browser name
-      - family: "chrome" or "firefox" (determines manifest format)
-      - manifest_dir: directory where the manifest JSON goes (macOS/Linux)
-      - registry_key: Windows registry key (Windows only)
+
+@functools.cache
+def _get_browser_targets() -> tuple[BrowserTarget, ...]:
+    """Return the browser targets with their manifest paths and registry keys.
+
+    The result only depends on the platform and home directory, so it is
+    built once per process and shared by register() and unregister().
     """
-    targets = []
+    targets: tuple[BrowserTarget, ...] = ()
 
     if SYSTEM == "Windows":
-        targets = [
-            {
-                "name": "Chrome",
-                "family": "chrome",
-                "registry_key": rf"Software\Google\Chrome\NativeMessagingHosts\{HOST_NAME}",
-            },
-            {
-                "name": "Edge",
-                "family": "chrome",
-                "registry_key": rf"Software\Microsoft\Edge\NativeMessagingHosts\{HOST_NAME}",
-            },
-            {
-                "name": "Brave",
-                "family": "chrome",
-                "registry_key": rf"Software\BraveSoftware\Brave-Browser\NativeMessagingHosts\{HOST_NAME}",
-            },
-            {
-                "name": "Firefox",
-                "family": "firefox",
-                "registry_key": rf"Software\Mozilla\NativeMessagingHosts\{HOST_NAME}",
-            },
-        ]
+        targets = (
+            BrowserTarget(
+                name="Chrome",
+                family="chrome",
+                registry_key=rf"Software\Google\Chrome\NativeMessagingHosts\{HOST_NAME}",
+            ),
+            BrowserTarget(
+                name="Edge",
+                family="chrome",
+                registry_key=rf"Software\Microsoft\Edge\NativeMessagingHosts\{HOST_NAME}",
+            ),
+            BrowserTarget(
+                name="Brave",
+                family="chrome",
+                registry_key=rf"Software\BraveSoftware\Brave-Browser\NativeMessagingHosts\{HOST_NAME}",
+            ),
+            BrowserTarget(
+                name="Firefox",
+                family="firefox",
+                registry_key=rf"Software\Mozilla\NativeMessagingHosts\{HOST_NAME}",
+            ),
+        )
 
     elif SYSTEM == "Darwin":
-        home = Path.home()
-        targets = [
-            {
-                "name": "Chrome",
-                "family": "chrome",
-                "manifest_dir": home / "Library" / "Application Support" / "Google" / "Chrome" / "NativeMessagingHosts",
-            },
-            {
-                "name": "Edge",
-                "family": "chrome",
-                "manifest_dir": home / "Library" / "Application Support" / "Microsoft Edge" / "NativeMessagingHosts",
-            },
-            {
-                "name": "Brave",
-                "family": "chrome",
-                "manifest_dir": home / "Library" / "Application Support" / "BraveSoftware" / "Brave-Browser" / "NativeMessagingHosts",
-            },
-            {
-                "name": "Firefox",
-                "family": "firefox",
-                "manifest_dir": home / "Library" / "Application Support" / "Mozilla" / "NativeMessagingHosts",
-            },
-        ]
+        targets = (
+            BrowserTarget(
+                name="Chrome",
+                family="chrome",
+                manifest_dir=_HOME / "Library" / "Application Support" / "Google" / "Chrome" / "NativeMessagingHosts",
+            ),
+            BrowserTarget(
+                name="Edge",
+                family="chrome",
+                manifest_dir=_HOME / "Library" / "Application Support" / "Microsoft Edge" / "NativeMessagingHosts",
+            ),
+            BrowserTarget(
+                name="Brave",
+                family="chrome",
+                manifest_dir=_HOME / "Library" / "Application Support" / "BraveSoftware" / "Brave-Browser" / "NativeMessagingHosts",
+            ),
+            BrowserTarget(
+                name="Firefox",
+                family="firefox",
+                manifest_dir=_HOME / "Library" / "Application Support" / "Mozilla" / "NativeMessagingHosts",
+            ),
+        )
 
     elif SYSTEM == "Linux":
-        home = Path.home()
-        targets = [
-            {
-                "name": "Chrome",
-                "family": "chrome",
-                "manifest_dir": home / ".config" / "google-chrome" / "NativeMessagingHosts",
-            },
-            {
-                "name": "Chromium",
-                "family": "chrome",
-                "manifest_dir": home / ".config" / "chromium" / "NativeMessagingHosts",
-            },
-            {
-                "name": "Edge",
-                "family": "chrome",
-                "manifest_dir": home / ".config" / "microsoft-edge" / "NativeMessagingHosts",
-            },
-            {
-                "name": "Brave",
-                "family": "chrome",
-                "manifest_dir": home / ".config" / "BraveSoftware" / "Brave-Browser" / "NativeMessagingHosts",
-            },
-            {
-                "name": "Firefox",
-                "family": "firefox",
-                "manifest_dir": home / ".mozilla" / "native-messaging-hosts",
-            },
-        ]
+        targets = (
+            BrowserTarget(
+                name="Chrome",
+                family="chrome",
+                manifest_dir=_HOME / ".config" / "google-chrome" / "NativeMessagingHosts",
+            ),
+            BrowserTarget(
+                name="Chromium",
+                family="chrome",
+                manifest_dir=_HOME / ".config" / "chromium" / "NativeMessagingHosts",
+            ),
+            BrowserTarget(
+                name="Edge",
+                family="chrome",
+                manifest_dir=_HOME / ".config" / "microsoft-edge" / "NativeMessagingHosts",
+            ),
+            BrowserTarget(
+                name="Brave",
+                family="chrome",
+                manifest_dir=_HOME / ".config" / "BraveSoftware" / "Brave-Browser" / "NativeMessagingHosts",
+            ),
+            BrowserTarget(
+                name="Firefox",
+                family="firefox",
+                manifest_dir=_HOME / ".mozilla" / "native-messaging-hosts",
+            ),
+        )
 
     return targets
 
 
+# ─── Manifest file helpers ───────────────────────────────────────────────────
+
+def _write_manifest_file(path: Path, data: bytes) -> None:
+    """
+    Atomically write *data* to *path*.
+
+    The bytes go to a sibling temp file through a raw descriptor and are
+    then moved into place with ``os.replace``, so a browser (or registry
+    entry) never sees a half-written manifest.  If writing fails, the temp
+    file is removed and the existing manifest is left untouched.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        try:
+            # os.write may write less than asked; loop until all is out.
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    os.replace(tmp, path)
+
+
 # ─── Windows registry helpers ───────────────────────────────────────────────
 
-def _windows_set_registry(key_path: str, manifest_path: str) -> bool:
-    """Write the manifest path to the Windows registry (HKCU)."""
+def _windows_set_registry(entries: list[tuple[str, str]]) -> list[bool]:
+    """
+    Write manifest paths to the Windows registry (HKCU).
+
+    *entries* is a list of ``(key_path, manifest_path)`` pairs.  The HKCU
+    root handle is acquired once and shared by every subkey write.
+    Returns one success flag per entry.
+    """
     try:
-        import winreg
-        key = winreg.CreateKey(winreg.HKEY_CURRENT_USER, key_path)
-        winreg.SetValueEx(key, "", 0, winreg.REG_SZ, manifest_path)
-        winreg.CloseKey(key)
-        return True
+        root = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
     except Exception as exc:
-        print(f"  ✗ Registry write failed: {exc}")
-        return False
+        print(f"  ✗ Registry open failed: {exc}")
+        return [False] * len(entries)
+
+    results: list[bool] = []
+    try:
+        for key_path, manifest_path in entries:
+            try:
+                key = winreg.CreateKey(root, key_path)
+                winreg.SetValueEx(key, "", 0, winreg.REG_SZ, manifest_path)
+                winreg.CloseKey(key)
+                results.append(True)
+            except Exception as exc:
+                print(f"  ✗ Registry write failed: {exc}")
+                results.append(False)
+    finally:
+        winreg.CloseKey(root)
+    return results
 
 
 def _windows_delete_registry(key_path: str) -> bool:
     """Delete a registry key (HKCU)."""
     try:
-        import winreg
         winreg.DeleteKey(winreg.HKEY_CURRENT_USER, key_path)
         return True
     except FileNotFoundError:
@@ -183,9 +247,10 @@ def _windows_delete_registry(key_path: str) -> bool:
 
 def register(exe_path: str) -> None:
     """Register the native messaging host for all detected browsers."""
-    exe_path = str(Path(exe_path).resolve())
+    exe = Path(exe_path).resolve()
+    exe_path = str(exe)
 
-    if not Path(exe_path).exists():
+    if not exe.is_file():
         print(f"WARNING: Executable not found at {exe_path}")
         print("  Registration will proceed, but the browser won't be able to launch it.")
         print()
@@ -198,38 +263,56 @@ def register(exe_path: str) -> None:
     print(f"Platform:   {SYSTEM}")
     print()
 
-    for target in targets:
-        name = target["name"]
-        family = target["family"]
+    # Chrome-family manifests are byte-identical, as are Firefox ones —
+    # serialise each family once and reuse it for every browser.
+    manifest_bytes_by_family = {
+        "chrome": _dumps(_chrome_manifest(exe_path)),
+        "firefox": _dumps(_firefox_manifest(exe_path)),
+    }
 
-        manifest = _chrome_manifest(exe_path) if family == "chrome" else _firefox_manifest(exe_path)
-        manifest_json = json.dumps(manifest, indent=2)
+    if SYSTEM == "Windows":
+        # Write every manifest file to a shared location first, then point
+        # the registry at them in a single batched pass — the registry never
+        # references a manifest that hasn't been fully written.
+        planned = [
+            (
+                target.name,
+                manifest_dir / f"{HOST_NAME}.{target.name.lower()}.json",
+                manifest_bytes_by_family[target.family],
+                target.registry_key,
+            )
+            for target in targets
+        ]
 
-        if SYSTEM == "Windows":
-            # Write manifest file to a shared location
-            manifest_file = manifest_dir / f"{HOST_NAME}.{name.lower()}.json"
-            manifest_dir.mkdir(parents=True, exist_ok=True)
-            manifest_file.write_text(manifest_json, encoding="utf-8")
+        manifest_dir.mkdir(parents=True, exist_ok=True)
+        for _, manifest_file, manifest_bytes, _ in planned:
+            _write_manifest_file(manifest_file, manifest_bytes)
 
-            # Write registry entry pointing to the manifest
-            reg_key = target["registry_key"]
-            if _windows_set_registry(reg_key, str(manifest_file)):
+        results = _windows_set_registry(
+            [(reg_key, str(manifest_file)) for _, manifest_file, _, reg_key in planned]
+        )
+        for (name, manifest_file, _, _), ok in zip(planned, results):
+            if ok:
                 print(f"  ✓ {name}: registered (registry + {manifest_file.name})")
             else:
                 print(f"  ✗ {name}: registration failed")
+        return
 
-        else:
-            # macOS / Linux: write manifest directly to the browser's expected directory
-            target_dir = target["manifest_dir"]
-            manifest_file = target_dir / f"{HOST_NAME}.json"
+    for target in targets:
+        name = target.name
+        manifest_bytes = manifest_bytes_by_family[target.family]
 
-            try:
-                target_dir.mkdir(parents=True, exist_ok=True)
-                manifest_file.write_text(manifest_json, encoding="utf-8")
-                manifest_file.chmod(0o644)
-                print(f"  ✓ {name}: {manifest_file}")
-            except Exception as exc:
-                print(f"  ✗ {name}: {exc}")
+        # macOS / Linux: write manifest directly to the browser's expected directory
+        target_dir = target.manifest_dir
+        manifest_file = target_dir / f"{HOST_NAME}.json"
+
+        try:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            _write_manifest_file(manifest_file, manifest_bytes)
+            manifest_file.chmod(0o644)
+            print(f"  ✓ {name}: {manifest_file}")
+        except Exception as exc:
+            print(f"  ✗ {name}: {exc}")
 
 
 def unregister() -> None:
@@ -241,17 +324,17 @@ def unregister() -> None:
     print()
 
     for target in targets:
-        name = target["name"]
+        name = target.name
 
         if SYSTEM == "Windows":
-            reg_key = target["registry_key"]
+            reg_key = target.registry_key
             _windows_delete_registry(reg_key)
             manifest_file = manifest_dir / f"{HOST_NAME}.{name.lower()}.json"
             if manifest_file.exists():
                 manifest_file.unlink()
             print(f"  ✓ {name}: unregistered")
         else:
-            target_dir = target["manifest_dir"]
+            target_dir = target.manifest_dir
             manifest_file = target_dir / f"{HOST_NAME}.json"
             if manifest_file.exists():
                 manifest_file.unlink()
@@ -263,7 +346,7 @@ def unregister() -> None:
 def _get_manifest_storage_dir() -> Path:
     """On Windows, return a shared directory for manifest files."""
     if SYSTEM == "Windows":
-        app_data = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+        app_data = Path(os.environ.get("LOCALAPPDATA", _HOME / "AppData" / "Local"))
         return app_data / "SignBridge"
     return Path()  # Not used on non-Windows
 
@@ -272,20 +355,18 @@ def _get_manifest_storage_dir() -> Path:
 
 def _find_default_exe() -> str | None:
     """Try to find the built SignBridge executable."""
-    script_dir = Path(__file__).resolve().parent.parent  # host/
-
     # Built executable
     if SYSTEM == "Windows":
         candidates = [
-            script_dir / "dist" / "SignBridge" / "SignBridge.exe",
+            SCRIPT_DIR / "dist" / "SignBridge" / "SignBridge.exe",
         ]
     else:
         candidates = [
-            script_dir / "dist" / "SignBridge" / "SignBridge",
+            SCRIPT_DIR / "dist" / "SignBridge" / "SignBridge",
         ]
 
     for c in candidates:
-        if c.exists():
+        if c.is_file():
             return str(c)
 
     # Development mode: use python -m signbridge
@@ -8,20 +8,22 @@ Usage:
 
 import sys
 
-from signbridge.utils.logging_setup import setup_logging
-from signbridge.config import APP_NAME, APP_VERSION
-
 
 def main() -> None:
-    logger = setup_logging()
-    logger.info("Starting %s v%s", APP_NAME, APP_VERSION)
-    logger.info("Python %s on %s", sys.version, sys.platform)
+    from signbridge.config import APP_NAME, APP_VERSION
 
-    # Simple CLI args
+    # Simple CLI args — answered before logging is set up so `--version`
+    # doesn't pay for handler/log-directory initialisation.
     if "--version" in sys.argv:
         print(f"{APP_NAME} v{APP_VERSION}")
         sys.exit(0)
 
+    from signbridge.utils.logging_setup import setup_logging
+
+    logger = setup_logging()
+    logger.info("Starting %s v%s", APP_NAME, APP_VERSION)
+    logger.info("Python %s on %s", sys.version, sys.platform)
+
     # Launch GUI
     try:
         from signbridge.gui.app import run_gui
@@ -2,10 +2,12 @@
 SignBridge configuration — paths, constants, and platform detection.
 """
 
+import functools
 import os
 import sys
 import platform
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 # ─── App identity ───────────────────────────────────────────────────────────
@@ -14,10 +16,14 @@ APP_VERSION = "1.0.0"
 HOST_NAME = "com.ase.signer"
 PROTOCOL_VERSION = "1.0"
 
+# ─── Platform ───────────────────────────────────────────────────────────────
+# Resolved once at import — platform.system() is not free.
+SYSTEM = platform.system()
+
 # ─── Supported data types (Standard §4) ────────────────────────────────────
-SUPPORTED_DATA_TYPES = {"text", "xml", "json", "pdf", "binary"}
-INLINE_ALLOWED_TYPES = {"text", "xml", "json"}
-REMOTE_ONLY_TYPES = {"pdf", "binary"}
+SUPPORTED_DATA_TYPES = frozenset({"text", "xml", "json", "pdf", "binary"})
+INLINE_ALLOWED_TYPES = frozenset({"text", "xml", "json"})
+REMOTE_ONLY_TYPES = frozenset({"pdf", "binary"})
 
 # ─── Maximum payload size for inline content (1 MB, Standard §4.1) ─────────
 MAX_INLINE_SIZE_BYTES = 1 * 1024 * 1024
@@ -41,17 +47,39 @@ PKCS11_LIBS = {
 }
 
 # ─── Content-Type mapping (Standard §8.3) ──────────────────────────────────
-SIGNED_CONTENT_TYPE_MAP = {
+SIGNED_CONTENT_TYPE_MAP = MappingProxyType({
     "string": "text/plain",
     "pdf": "application/pdf",
     "xml": "application/xml",
     "binary": "application/octet-stream",
-}
+})
 
 # ─── Network defaults ──────────────────────────────────────────────────────
 HTTP_TIMEOUT_DOWNLOAD = 60   # seconds
 HTTP_TIMEOUT_UPLOAD = 120    # seconds
 HTTP_TIMEOUT_CALLBACK = 30   # seconds
+MAX_DOWNLOAD_SIZE = 256 * 1024 * 1024  # bytes per downloadUrl body
+DOWNLOAD_CHUNK_SIZE = 64 * 1024        # bytes per streamed read
+DOWNLOAD_SPOOL_SIZE = 8 * 1024 * 1024  # streamed downloads spill to disk past this
+UPLOAD_MAX_RETRIES = 3       # extra attempts after a transient upload failure
+UPLOAD_BACKOFF_BASE = 0.5    # seconds; doubled per attempt, ±50% jitter
+UPLOAD_BACKOFF_CAP = 10.0    # seconds; also bounds a server's Retry-After
+
+# Per-host protection for uploads and callbacks (network/reliability.py).
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive transient failures that open it
+CIRCUIT_COOLDOWN = 30.0        # seconds before a trial call is let through
+HOST_MAX_CONCURRENT = 8        # calls in flight per host and stage
+
+# ─── Processing ─────────────────────────────────────────────────────────────
+# Objects of one request processed concurrently.  Downloads, uploads and
+# callbacks overlap; signing itself is serialised on the token session.
+ENGINE_MAX_WORKERS = 4
+
+# ─── Certificate cache ──────────────────────────────────────────────────────
+# Per-token index of certificate serial/thumbprint → CKA_ID, so warm starts
+# can fetch the one certificate they need instead of enumerating the card.
+CERT_CACHE_DIR = Path.home() / ".signbridge" / "cert-cache"
+CERT_CACHE_TTL = 7 * 24 * 3600  # seconds
 
 # ─── Logging ────────────────────────────────────────────────────────────────
 LOG_DIR = Path.home() / ".signbridge" / "logs"
@@ -116,48 +144,88 @@ _SYSTEM_PATHS: dict[str, dict[str, list[str]]] = {
     },
 }
 
+# Only the current platform's entries are ever consulted — specialise both
+# tables once at import and drop the other platforms' search paths.
+_LIBS_FOR_PLATFORM: tuple[tuple[str, str], ...] = tuple(PKCS11_LIBS.get(SYSTEM, ()))
+_PATHS_FOR_PLATFORM: dict[str, tuple[Path, ...]] = {
+    lib: tuple(Path(p) for p in paths)
+    for lib, paths in _SYSTEM_PATHS.get(SYSTEM, {}).items()
+}
+del _SYSTEM_PATHS
 
-def _find_library(lib_filename: str) -> Optional[Path]:
-    """Locate a single PKCS#11 library file across known paths."""
-    system = platform.system()
+_BUNDLE_DIR: Optional[Path] = Path(sys._MEIPASS) if is_frozen() else None  # type: ignore[attr-defined]
+_DEV_LIBS_DIR = Path(__file__).resolve().parent.parent / "libs"
 
-    # 1. System-known paths
-    candidates = _SYSTEM_PATHS.get(system, {}).get(lib_filename, [])
-    for candidate in candidates:
-        p = Path(candidate)
-        if p.exists():
-            return p
 
-    # 2. PyInstaller bundle
-    if is_frozen():
-        bundled = Path(sys._MEIPASS) / lib_filename  # type: ignore[attr-defined]
-        if bundled.exists():
-            return bundled
+# Windows and (default) macOS filesystems compare names case-insensitively.
+_CASE_INSENSITIVE_FS = SYSTEM in ("Windows", "Darwin")
 
-    # 3. libs/ directory (development)
-    libs_dir = Path(__file__).resolve().parent.parent / "libs"
-    dev_path = libs_dir / lib_filename
-    if dev_path.exists():
-        return dev_path
 
+def _fold(name: str) -> str:
+    return name.casefold() if _CASE_INSENSITIVE_FS else name
+
+
+def _dir_entries(directory: Path, listings: dict[Path, frozenset[str]]) -> frozenset[str]:
+    """
+    Return the (case-folded) file names in *directory*, listing it at most
+    once per discovery pass.  Missing/unreadable directories are empty.
+    """
+    names = listings.get(directory)
+    if names is None:
+        try:
+            with os.scandir(directory) as it:
+                names = frozenset(_fold(e.name) for e in it)
+        except OSError:
+            names = frozenset()
+        listings[directory] = names
+    return names
+
+
+def _find_library(
+    lib_filename: str,
+    listings: dict[Path, frozenset[str]],
+) -> Optional[Path]:
+    """
+    Locate a single PKCS#11 library file across known paths.
+
+    Instead of one ``stat()`` per candidate, each parent directory is
+    listed once via ``os.scandir`` and shared through *listings* across
+    all lookups of the same discovery pass.
+    """
+    candidates = list(_PATHS_FOR_PLATFORM.get(lib_filename, ()))  # 1. System-known paths
+    if _BUNDLE_DIR is not None:
+        candidates.append(_BUNDLE_DIR / lib_filename)          # 2. PyInstaller bundle
+    candidates.append(_DEV_LIBS_DIR / lib_filename)            # 3. libs/ directory (development)
+
+    for candidate in candidates:
+        if _fold(candidate.name) in _dir_entries(candidate.parent, listings):
+            return candidate
     return None
 
 
-def get_pkcs11_library_paths() -> list[tuple[str, Path]]:
+@functools.lru_cache(maxsize=None)
+def get_pkcs11_library_paths() -> tuple[tuple[str, Path], ...]:
     """
     Locate ALL available PKCS#11 vendor libraries for the current platform.
 
-    Returns a list of ``(vendor_name, path)`` tuples for every library that
+    Returns a tuple of ``(vendor_name, path)`` pairs for every library that
     was found.  SignBridge will attempt to load each and merge their slots.
+
+    The result is cached for the lifetime of the process (installed vendor
+    libraries don't move); call :func:`clear_pkcs11_cache` to re-probe.
     """
-    system = platform.system()
-    libs = PKCS11_LIBS.get(system, [])
+    listings: dict[Path, frozenset[str]] = {}
     found: list[tuple[str, Path]] = []
-    for vendor_name, lib_filename in libs:
-        path = _find_library(lib_filename)
+    for vendor_name, lib_filename in _LIBS_FOR_PLATFORM:
+        path = _find_library(lib_filename, listings)
         if path is not None:
             found.append((vendor_name, path))
-    return found
+    return tuple(found)
+
+
+def clear_pkcs11_cache() -> None:
+    """Forget cached PKCS#11 library lookups (e.g. after installing middleware)."""
+    get_pkcs11_library_paths.cache_clear()
 
 
 def get_pkcs11_library_path() -> Optional[Path]:
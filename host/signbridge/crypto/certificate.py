@@ -8,14 +8,21 @@ Finds certificates on PKCS#11 tokens by serial number or thumbprint
 from __future__ import annotations
 
 import hashlib
-from typing import Optional
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Optional
 
 import pkcs11
 from pkcs11 import Attribute, ObjectClass, CertificateType, KeyType
+from asn1crypto import x509 as asn1_x509
 from cryptography import x509
-from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.x509.oid import ExtensionOID
 
+from signbridge.config import CERT_CACHE_DIR, CERT_CACHE_TTL
 from signbridge.utils.logging_setup import get_logger
 
 logger = get_logger("crypto.certificate")
@@ -41,62 +48,266 @@ def _has_digital_signature(cert: x509.Certificate) -> bool:
         return False
 
 
+# ── Minimal DER reader (serial number only) ────────────────────────────
+
+def _der_tlv(der: bytes, pos: int) -> tuple[int, int, int]:
+    """Decode the TLV header at *pos*; return (tag, content_start, content_end)."""
+    tag = der[pos]
+    length = der[pos + 1]
+    pos += 2
+    if length & 0x80:
+        n = length & 0x7F
+        if not 1 <= n <= 4:
+            raise ValueError("unsupported DER length encoding")
+        length = int.from_bytes(der[pos:pos + n], "big")
+        pos += n
+    end = pos + length
+    if end > len(der):
+        raise ValueError("truncated DER")
+    return tag, pos, end
+
+
+def _extract_der_serial(der: bytes) -> int:
+    """
+    Return the serialNumber of a DER X.509 certificate without a full parse.
+
+    Walks Certificate SEQUENCE → tbsCertificate SEQUENCE → optional
+    ``[0]`` version → serialNumber INTEGER.
+    """
+    try:
+        tag, pos, _ = _der_tlv(der, 0)
+        if tag != 0x30:
+            raise ValueError("not a DER SEQUENCE")
+        tag, pos, _ = _der_tlv(der, pos)
+        if tag != 0x30:
+            raise ValueError("tbsCertificate is not a SEQUENCE")
+        tag, start, end = _der_tlv(der, pos)
+        if tag == 0xA0:  # explicit version tag
+            tag, start, end = _der_tlv(der, end)
+    except IndexError:
+        raise ValueError("truncated DER") from None
+    if tag != 0x02 or start == end:
+        raise ValueError("malformed certificate serial number")
+    return int.from_bytes(der[start:end], "big", signed=True)
+
+
 class CertificateInfo:
-    """Lightweight wrapper around a PKCS#11 certificate with parsed X.509 metadata."""
+    """
+    Lightweight wrapper around a PKCS#11 certificate with parsed X.509 metadata.
+
+    Only the serial number is decoded up front (straight from the DER).  The
+    full X.509 parse behind ``x509_cert``, the common names and the
+    key-usage flags runs on first access, so certificates that are merely
+    compared against a certId never pay for it.
+    """
 
     __slots__ = (
-        "pkcs11_cert",
-        "x509_cert",
+        "handle",
+        "cert_id_attr",
+        "der_bytes",
         "serial_hex",
-        "thumbprint_hex",
-        "subject_cn",
-        "issuer_cn",
-        "is_signing_cert",
-        "is_auth_cert",
+        "_thumbprint_hex",
+        "_x509_cert",
+        "_asn1_cert",
+        "_subject_cn",
+        "_issuer_cn",
+        "_is_signing_cert",
+        "_is_auth_cert",
     )
 
     def __init__(self, pkcs11_cert: pkcs11.Certificate) -> None:
-        self.pkcs11_cert = pkcs11_cert
+        # Only the handle is kept: every attribute needed later (VALUE, ID)
+        # is read below, and cached entries shouldn't pin the wrapper object.
+        self.handle: int = pkcs11_cert.handle
+
+        # Read VALUE and ID in one C_GetAttributeValue round-trip; ID is needed
+        # later to locate the private key.  Some tokens reject the batched
+        # read, so fall back to reading each attribute on its own.
+        try:
+            attrs = pkcs11_cert.get_attributes([Attribute.VALUE, Attribute.ID])
+            der_bytes = attrs[Attribute.VALUE]
+            self.cert_id_attr: Optional[bytes] = attrs[Attribute.ID]
+        except Exception:
+            der_bytes = pkcs11_cert[Attribute.VALUE]
+            try:
+                self.cert_id_attr = pkcs11_cert[Attribute.ID]
+            except Exception:
+                self.cert_id_attr = None
 
-        # Parse the DER-encoded X.509 certificate
-        der_bytes = pkcs11_cert[Attribute.VALUE]
-        self.x509_cert = x509.load_der_x509_certificate(der_bytes)
+        # Raw DER (kept for hashing/CMS); only the serial is decoded now.
+        self.der_bytes = der_bytes
 
-        # Serial number as uppercase hex (used for certId matching)
-        self.serial_hex = format(self.x509_cert.serial_number, "X")
+        # Serial number as uppercase hex (used for certId matching); interned
+        # so index lookups against an interned needle compare by identity.
+        self.serial_hex = sys.intern("%X" % _extract_der_serial(der_bytes))
 
-        # SHA-1 thumbprint (alternative certId format)
-        self.thumbprint_hex = hashlib.sha1(
-            self.x509_cert.public_bytes(Encoding.DER)
-        ).hexdigest().upper()
+        # SHA-1 thumbprint (alternative certId format) — computed on first use,
+        # since most lookups match on the serial number.
+        self._thumbprint_hex: Optional[str] = None
 
-        # Subject and issuer common names
-        self.subject_cn = self._extract_cn(self.x509_cert.subject)
-        self.issuer_cn = self._extract_cn(self.x509_cert.issuer)
+        # Full X.509 parse — deferred, see _parse().
+        self._x509_cert: Optional[x509.Certificate] = None
 
-        # Key-usage flags
-        self.is_signing_cert = _has_non_repudiation(self.x509_cert)
-        self.is_auth_cert = (
-            _has_digital_signature(self.x509_cert)
-            and not self.is_signing_cert
-        )
+        # asn1crypto view handed to pyHanko — built on the first PDF signature.
+        self._asn1_cert: Optional[asn1_x509.Certificate] = None
+
+    def _parse(self) -> x509.Certificate:
+        """Parse the DER certificate and derive names and key-usage flags (once)."""
+        cert = self._x509_cert
+        if cert is None:
+            cert = x509.load_der_x509_certificate(self.der_bytes)
+
+            # Subject and issuer common names
+            self._subject_cn = self._extract_cn(cert.subject)
+            self._issuer_cn = self._extract_cn(cert.issuer)
+
+            # Key-usage flags
+            self._is_signing_cert = _has_non_repudiation(cert)
+            self._is_auth_cert = (
+                _has_digital_signature(cert)
+                and not self._is_signing_cert
+            )
+            self._x509_cert = cert
+        return cert
+
+    @property
+    def x509_cert(self) -> x509.Certificate:
+        return self._parse()
+
+    @property
+    def subject_cn(self) -> str:
+        self._parse()
+        return self._subject_cn
+
+    @property
+    def issuer_cn(self) -> str:
+        self._parse()
+        return self._issuer_cn
+
+    @property
+    def is_signing_cert(self) -> bool:
+        self._parse()
+        return self._is_signing_cert
+
+    @property
+    def is_auth_cert(self) -> bool:
+        self._parse()
+        return self._is_auth_cert
+
+    @property
+    def asn1_cert(self) -> asn1_x509.Certificate:
+        """The certificate as an ``asn1crypto`` object (parsed once from the token DER)."""
+        if self._asn1_cert is None:
+            self._asn1_cert = asn1_x509.Certificate.load(self.der_bytes)
+        return self._asn1_cert
+
+    @property
+    def thumbprint_hex(self) -> str:
+        """SHA-1 thumbprint of the DER certificate as uppercase hex."""
+        if self._thumbprint_hex is None:
+            # Identification only, not a security use — lets OpenSSL builds
+            # in FIPS mode (where SHA-1 is restricted) still compute it.
+            self._thumbprint_hex = hashlib.sha1(
+                self.der_bytes, usedforsecurity=False
+            ).hexdigest().upper()
+        return self._thumbprint_hex
 
     @staticmethod
     def _extract_cn(name: x509.Name) -> str:
-        """Extract the Common Name (CN) from an X.509 Name, or fall back to the full string."""
+        """Extract the Common Name (CN) from an X.509 Name, or fall back to the full string.
+
+        Interned: chains on one token repeat the same issuer/CA names (and a
+        self-signed cert has subject == issuer), so cached entries share them.
+        """
         try:
             cn_attrs = name.get_attributes_for_oid(x509.oid.NameOID.COMMON_NAME)
             if cn_attrs:
-                return str(cn_attrs[0].value)
+                return sys.intern(str(cn_attrs[0].value))
         except Exception:
             pass
-        return str(name)
+        return sys.intern(str(name))
 
     def __repr__(self) -> str:
         kind = "SIGN" if self.is_signing_cert else ("AUTH" if self.is_auth_cert else "OTHER")
         return f"CertificateInfo(cn={self.subject_cn!r}, serial={self.serial_hex}, {kind})"
 
 
+# ── Per-session parse cache ─────────────────────────────────────────────
+# Parsing a certificate means reading its VALUE from the card and decoding
+# the DER, so results are kept per open session, keyed by object handle.
+# python-pkcs11 sessions are hashable (token + session handle) but cannot be
+# weak-referenced, so entries are dropped explicitly via forget_session().
+
+class _SessionCertificates:
+    """Parsed certificates of one session plus lookup indexes over them."""
+
+    __slots__ = ("by_handle", "by_serial", "_by_thumbprint")
+
+    def __init__(self) -> None:
+        self.by_handle: dict[int, CertificateInfo] = {}
+        self.by_serial: dict[str, CertificateInfo] = {}
+        self._by_thumbprint: Optional[dict[str, CertificateInfo]] = None
+
+    def get(self, rc: pkcs11.Certificate) -> CertificateInfo:
+        """Return the parsed CertificateInfo for *rc*, parsing it on first use."""
+        ci = self.by_handle.get(rc.handle)
+        if ci is None:
+            ci = self.by_handle[rc.handle] = CertificateInfo(rc)
+            self.by_serial.setdefault(ci.serial_hex, ci)
+            self._by_thumbprint = None
+        return ci
+
+    def find_thumbprint(self, needle: str) -> Optional[CertificateInfo]:
+        """
+        Return the first parsed certificate whose thumbprint is *needle*.
+
+        Hashes certificates one at a time and stops at the first hit; only a
+        full miss (every certificate hashed) is turned into a dict index for
+        later calls.  Thumbprints are memoised on each CertificateInfo either way.
+        """
+        index = self._by_thumbprint
+        if index is not None:
+            return index.get(needle)
+        for ci in self.by_handle.values():
+            if ci.thumbprint_hex == needle:
+                return ci
+        index = {}
+        for ci in self.by_handle.values():
+            index.setdefault(ci.thumbprint_hex, ci)
+        self._by_thumbprint = index
+        return None
+
+
+_CERT_CACHE: dict[pkcs11.Session, _SessionCertificates] = {}
+
+# Private keys on the session: ({CKA_ID: key}, all keys in token order).
+_KEY_CACHE: dict[
+    pkcs11.Session,
+    tuple[dict[bytes, pkcs11.PrivateKey], list[pkcs11.PrivateKey]],
+] = {}
+
+
+def _session_certificates(session: pkcs11.Session) -> _SessionCertificates:
+    entry = _CERT_CACHE.get(session)
+    if entry is None:
+        entry = _CERT_CACHE[session] = _SessionCertificates()
+    return entry
+
+
+def forget_session(session: pkcs11.Session) -> None:
+    """Drop cached certificate and key data for *session* (call before closing it)."""
+    _CERT_CACHE.pop(session, None)
+    _KEY_CACHE.pop(session, None)
+
+
+def _list_raw_certificates(session: pkcs11.Session) -> list[pkcs11.Certificate]:
+    """Return the X.509 certificate object handles on the token (no attribute reads)."""
+    return list(session.get_objects({
+        Attribute.CLASS: ObjectClass.CERTIFICATE,
+        Attribute.CERTIFICATE_TYPE: CertificateType.X_509,
+    }))
+
+
 def find_certificates(
     session: pkcs11.Session,
     *,
@@ -111,35 +322,215 @@ def find_certificates(
         When True, only return certificates that have the *nonRepudiation*
         key-usage bit (i.e. signing-suitable certificates).
     """
-    raw_certs = list(session.get_objects({
-        Attribute.CLASS: ObjectClass.CERTIFICATE,
-        Attribute.CERTIFICATE_TYPE: CertificateType.X_509,
-    }))
+    raw_certs = _list_raw_certificates(session)
     logger.info("Found %d X.509 certificate(s) on token", len(raw_certs))
 
+    cache = _session_certificates(session)
+    # Checked once: the per-cert debug line would otherwise force a SHA-1
+    # thumbprint (and build its argument tuple) even with DEBUG disabled.
+    debug = logger.isEnabledFor(logging.DEBUG)
     results: list[CertificateInfo] = []
     for rc in raw_certs:
         try:
-            ci = CertificateInfo(rc)
+            ci = cache.get(rc)
             if signing_only and not ci.is_signing_cert:
+                if debug:
+                    logger.debug(
+                        "  Skipping non-signing certificate: CN=%s",
+                        ci.subject_cn,
+                    )
+                continue
+            results.append(ci)
+            if debug:
                 logger.debug(
-                    "  Skipping non-signing certificate: CN=%s",
+                    "  Certificate: CN=%s, serial=%s, thumbprint=%s, signing=%s",
                     ci.subject_cn,
+                    ci.serial_hex,
+                    ci.thumbprint_hex,
+                    ci.is_signing_cert,
                 )
-                continue
-            results.append(ci)
-            logger.debug(
-                "  Certificate: CN=%s, serial=%s, thumbprint=%s, signing=%s",
-                ci.subject_cn,
-                ci.serial_hex,
-                ci.thumbprint_hex,
-                ci.is_signing_cert,
-            )
         except Exception as exc:
             logger.warning("Failed to parse certificate: %s", exc)
     return results
 
 
+# ── On-disk certificate index ──────────────────────────────────────────
+# Stores only public identifiers (serial, thumbprint, CKA_ID) per token.
+# A hit is always confirmed against the live object on the card, so a
+# stale or tampered file can cost a lookup but never select a wrong cert.
+
+def _cache_file(token: pkcs11.Token) -> Path:
+    key = f"{token.serial!r}|{token.label.strip()}".encode("utf-8")
+    return CERT_CACHE_DIR / (hashlib.sha256(key).hexdigest()[:32] + ".json")
+
+
+def load_cached_certs(token: pkcs11.Token) -> list[dict]:
+    """
+    Return the cached certificate index for *token*.
+
+    Each entry is ``{"serial": str, "thumbprint": str, "id": hex str}``.
+    Missing, unreadable or expired (older than CERT_CACHE_TTL) caches
+    yield an empty list.
+    """
+    try:
+        with _cache_file(token).open("rb") as f:
+            data = json.load(f)
+        if time.time() - data["saved_at"] > CERT_CACHE_TTL:
+            return []
+        return list(data["certs"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+
+
+def save_cached_certs(
+    token: pkcs11.Token,
+    certs: Iterable[CertificateInfo],
+    cached: Optional[list[dict]] = None,
+) -> None:
+    """
+    Merge *certs* into the cached index for *token* (best effort, never raises).
+
+    *cached* is the index as already loaded by the caller, if any.  The
+    file is only rewritten when an entry is new or its id/thumbprint changed.
+    """
+    try:
+        entries = {e["serial"]: e for e in (load_cached_certs(token) if cached is None else cached)}
+        changed = False
+        for ci in certs:
+            if ci.cert_id_attr:
+                entry = {
+                    "serial": ci.serial_hex,
+                    "thumbprint": ci.thumbprint_hex,
+                    "id": ci.cert_id_attr.hex(),
+                }
+                if entries.get(ci.serial_hex) != entry:
+                    entries[ci.serial_hex] = entry
+                    changed = True
+        if not changed:
+            return
+        path = _cache_file(token)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"saved_at": time.time(), "certs": list(entries.values())}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)
+    except Exception as exc:
+        logger.debug("Could not write certificate cache: %s", exc)
+
+
+def _match_cached(entries: list[dict], needle: str) -> tuple[Optional[dict], str]:
+    """
+    Find an exact serial or thumbprint match among cached index entries.
+
+    Returns ``(entry, key)`` with the key that matched ("serial" or
+    "thumbprint"), or ``(None, "")``.  Partial-serial matches are left to
+    the live search: a certificate added to the token since the index was
+    written could match exactly.
+    """
+    for key in ("serial", "thumbprint"):
+        for e in entries:
+            if e.get(key) == needle:
+                return e, key
+    return None, ""
+
+
+def _find_via_cache(
+    session: pkcs11.Session,
+    cached: list[dict],
+    needle: str,
+) -> Optional[CertificateInfo]:
+    """Resolve *needle* through the loaded index *cached* with one targeted C_FindObjects."""
+    entry, key = _match_cached(cached, needle)
+    if entry is None:
+        return None
+    try:
+        cert_id_attr = bytes.fromhex(entry["id"])
+        raw_certs = list(session.get_objects({
+            Attribute.CLASS: ObjectClass.CERTIFICATE,
+            Attribute.CERTIFICATE_TYPE: CertificateType.X_509,
+            Attribute.ID: cert_id_attr,
+        }))
+    except Exception as exc:
+        logger.debug("Cached certificate lookup failed: %s", exc)
+        return None
+
+    cache = _session_certificates(session)
+    for rc in raw_certs:
+        try:
+            ci = cache.get(rc)
+        except Exception as exc:
+            logger.warning("Failed to parse certificate: %s", exc)
+            continue
+        # Confirm on the live certificate with the identifier that matched,
+        # so an entry pairing one cert's id with another's thumbprint misses.
+        live = ci.serial_hex if key == "serial" else ci.thumbprint_hex
+        if live == needle and _fully_parsed(ci):
+            logger.info("Certificate matched via cached index: %s", ci)
+            return ci
+    return None
+
+
+def _der_integer(value: int) -> bytes:
+    """DER-encode a non-negative int as an ASN.1 INTEGER (tag, length, value)."""
+    body = value.to_bytes(value.bit_length() // 8 + 1, "big")
+    n = len(body)
+    if n < 0x80:
+        return b"\x02" + bytes((n,)) + body
+    size = n.to_bytes((n.bit_length() + 7) // 8, "big")
+    return b"\x02" + bytes((0x80 | len(size),)) + size + body
+
+
+def find_certificate_by_serial_fast(
+    session: pkcs11.Session,
+    serial_hex: str,
+) -> Optional[CertificateInfo]:
+    """
+    Ask the token itself for the certificate with this serial number.
+
+    Uses a ``CKA_SERIAL_NUMBER`` search template (DER INTEGER), so the match
+    happens on the card in a single C_FindObjects — no enumeration and no
+    parsing of other certificates.  CKA_SERIAL_NUMBER is optional in
+    PKCS#11, so a token that leaves it empty simply yields None and the
+    caller should fall back to find_certificate_by_id().
+    """
+    needle = serial_hex.strip().upper()
+    try:
+        value = int(needle, 16)
+    except ValueError:
+        return None
+    if value < 0:
+        return None
+
+    try:
+        raw_certs = list(session.get_objects({
+            Attribute.CLASS: ObjectClass.CERTIFICATE,
+            Attribute.CERTIFICATE_TYPE: CertificateType.X_509,
+            Attribute.SERIAL_NUMBER: _der_integer(value),
+        }))
+    except Exception as exc:
+        logger.debug("CKA_SERIAL_NUMBER search not supported: %s", exc)
+        return None
+
+    cache = _session_certificates(session)
+    for rc in raw_certs:
+        try:
+            ci = cache.get(rc)
+        except Exception as exc:
+            logger.warning("Failed to parse certificate: %s", exc)
+            continue
+        # Confirm: some tokens ignore or mis-store the template attribute.
+        if ci.serial_hex == needle and _fully_parsed(ci):
+            logger.info("Certificate matched by serial (token-side search): %s", ci)
+            return ci
+    return None
+
+
+# Length of a SHA-1 thumbprint in hex digits.
+_THUMBPRINT_HEX_LEN = 40
+
+
 def find_certificate_by_id(
     session: pkcs11.Session,
     cert_id: str,
@@ -152,33 +543,100 @@ def find_certificate_by_id(
       2. Exact match on SHA-1 thumbprint (hex, case-insensitive)
       3. Substring match on serial (for partial serial numbers)
 
+    The on-disk index for the token is consulted first; on a hit only that
+    certificate is read from the card.  Next, unless the needle has the
+    length of a thumbprint, the token is asked to match the serial itself
+    (find_certificate_by_serial_fast).  Otherwise all
+    certificates are searched (see _find_on_token).  After a live match the
+    matched certificate is added to the index if it is new or changed.
+
     Returns None if no match found.
     """
-    certs = find_certificates(session)
-    needle = cert_id.strip().upper()
+    needle = sys.intern(cert_id.strip().upper())
+    try:
+        token: Optional[pkcs11.Token] = session.token
+    except Exception:
+        token = None
 
-    # 1. Exact serial match
-    for ci in certs:
-        if ci.serial_hex == needle:
-            logger.info("Certificate matched by serial: %s", ci)
+    cached: list[dict] = []
+    if token is not None:
+        cached = load_cached_certs(token)
+        ci = _find_via_cache(session, cached, needle)
+        if ci is not None:
             return ci
 
+    # A 40-hex-digit needle is almost always a SHA-1 thumbprint, which the
+    # token-side serial search cannot match; skip that round-trip (a serial
+    # of that length is still found by _find_on_token).
+    ci = None
+    if len(needle) != _THUMBPRINT_HEX_LEN:
+        ci = find_certificate_by_serial_fast(session, needle)
+    if ci is None:
+        ci = _find_on_token(session, cert_id, needle)
+    if ci is not None and token is not None:
+        save_cached_certs(token, (ci,), cached)
+    return ci
+
+
+def _find_on_token(
+    session: pkcs11.Session,
+    cert_id: str,
+    needle: str,
+) -> Optional[CertificateInfo]:
+    """
+    Search the certificates on the token for *needle*.
+
+    One streaming pass per match kind over the token's certificates:
+    candidates are compared on the DER-decoded serial first, stopping at
+    the first hit; only if none matches are the (already read) certificates
+    hashed, again stopping at the first thumbprint hit.  The full X.509
+    parse only runs for the certificate that is returned.
+    """
+    raw_certs = _list_raw_certificates(session)
+    cache = _session_certificates(session)
+
+    # 1. Exact serial match — read not-yet-seen certs only until a hit
+    ci = cache.by_serial.get(needle)
+    if ci is None:
+        for rc in raw_certs:
+            if rc.handle in cache.by_handle:
+                continue
+            try:
+                if cache.get(rc).serial_hex == needle:
+                    ci = cache.by_serial[needle]
+                    break
+            except Exception as exc:
+                logger.warning("Failed to parse certificate: %s", exc)
+    if ci is not None and _fully_parsed(ci):
+        logger.info("Certificate matched by serial: %s", ci)
+        return ci
+
     # 2. Exact thumbprint match
-    for ci in certs:
-        if ci.thumbprint_hex == needle:
-            logger.info("Certificate matched by thumbprint: %s", ci)
-            return ci
+    ci = cache.find_thumbprint(needle)
+    if ci is not None and _fully_parsed(ci):
+        logger.info("Certificate matched by thumbprint: %s", ci)
+        return ci
 
     # 3. Substring serial match (legacy compatibility)
-    for ci in certs:
-        if needle in ci.serial_hex:
+    for ci in cache.by_handle.values():
+        if needle in ci.serial_hex and _fully_parsed(ci):
             logger.info("Certificate matched by partial serial: %s", ci)
             return ci
 
-    logger.warning("No certificate matching certId=%r among %d certificates", cert_id, len(certs))
+    logger.warning("No certificate matching certId=%r among %d certificates", cert_id, len(raw_certs))
     return None
 
 
+def _fully_parsed(ci: CertificateInfo) -> bool:
+    """Run the deferred X.509 parse; False (with a warning) if the DER is unusable."""
+    try:
+        ci.x509_cert
+    except Exception as exc:
+        logger.warning("Failed to parse certificate: %s", exc)
+        return False
+    return True
+
+
 def find_private_key(
     session: pkcs11.Session,
     cert_info: CertificateInfo,
@@ -189,19 +647,13 @@ def find_private_key(
     Matches by PKCS#11 ID attribute.  Falls back to returning the first
     private key on the token regardless of key type.
     """
-    try:
-        cert_id_attr = cert_info.pkcs11_cert[Attribute.ID]
-    except Exception:
-        cert_id_attr = None
+    keys_by_id, keys = _private_key_index(session)
+    cert_id_attr = cert_info.cert_id_attr
 
     # Strategy 1: match by ID attribute (key type agnostic)
     if cert_id_attr is not None:
-        keys = list(session.get_objects({
-            Attribute.CLASS: ObjectClass.PRIVATE_KEY,
-            Attribute.ID: cert_id_attr,
-        }))
-        if keys:
-            key = keys[0]
+        key = keys_by_id.get(cert_id_attr)
+        if key is not None:
             try:
                 kt = key[Attribute.KEY_TYPE]
                 logger.info("Private key found by ID attribute match (type=%s)", kt)
@@ -210,9 +662,6 @@ def find_private_key(
             return key
 
     # Strategy 2: first private key of any type
-    keys = list(session.get_objects({
-        Attribute.CLASS: ObjectClass.PRIVATE_KEY,
-    }))
     if keys:
         key = keys[0]
         try:
@@ -224,3 +673,28 @@ def find_private_key(
 
     logger.warning("No private key found on token")
     return None
+
+
+def _private_key_index(
+    session: pkcs11.Session,
+) -> tuple[dict[bytes, pkcs11.PrivateKey], list[pkcs11.PrivateKey]]:
+    """
+    Enumerate the session's private keys once and index them by CKA_ID.
+
+    One C_FindObjects sequence serves every later find_private_key() call
+    on the same session.  Keys whose ID cannot be read are still kept for
+    the first-key fallback.
+    """
+    entry = _KEY_CACHE.get(session)
+    if entry is None:
+        keys = list(session.get_objects({
+            Attribute.CLASS: ObjectClass.PRIVATE_KEY,
+        }))
+        keys_by_id: dict[bytes, pkcs11.PrivateKey] = {}
+        for key in keys:
+            try:
+                keys_by_id.setdefault(bytes(key[Attribute.ID]), key)
+            except Exception:
+                pass
+        entry = _KEY_CACHE[session] = (keys_by_id, keys)
+    return entry
@@ -7,6 +7,8 @@ available tokens across all of them, and opening authenticated sessions.
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -66,9 +68,21 @@ class PKCS11Manager:
                 "Place a vendor library in host/libs/ or install the HSM middleware."
             )
 
-        for vendor_name, path in detected:
+        # dlopen + C_Initialize of each vendor library is independent and can
+        # take hundreds of ms, so open them concurrently; registration below
+        # stays in detection order so ._libs / ._lib are deterministic.
+        with ThreadPoolExecutor(
+            max_workers=len(detected),
+            thread_name_prefix="pkcs11-load",
+        ) as pool:
+            futures = [
+                pool.submit(self._open_library, vendor_name, str(path))
+                for vendor_name, path in detected
+            ]
+
+        for (vendor_name, path), future in zip(detected, futures):
             try:
-                self._load_single(vendor_name, str(path))
+                self._register(vendor_name, future.result(), str(path))
             except Exception as exc:
                 # One library failing shouldn't prevent the others from loading.
                 logger.warning(
@@ -85,8 +99,20 @@ class PKCS11Manager:
 
     def _load_single(self, vendor_name: str, lib_path: str) -> None:
         """Load one PKCS#11 library and register it."""
+        self._register(vendor_name, self._open_library(vendor_name, lib_path), lib_path)
+
+    @staticmethod
+    def _open_library(vendor_name: str, lib_path: str) -> pkcs11.lib:  # type: ignore[type-arg]
+        """dlopen + C_Initialize one library (thread-safe; does not touch the manager)."""
         logger.info("Loading PKCS#11 library [%s]: %s", vendor_name, lib_path)
-        loaded = pkcs11.lib(lib_path)
+        # pkcs11.lib() memoises per path for the whole process (and only
+        # re-runs C_Initialize after an explicit unload), so re-creating a
+        # manager or reloading does not dlopen/initialise the vendor library
+        # again — no extra cache is needed here.
+        return pkcs11.lib(lib_path)
+
+    def _register(self, vendor_name: str, loaded: pkcs11.lib, lib_path: str) -> None:  # type: ignore[type-arg]
+        """Add an opened library to the manager."""
         self._libs.append((vendor_name, loaded, lib_path))
 
         # Keep ._lib pointing to the first successfully loaded library
@@ -110,21 +136,48 @@ class PKCS11Manager:
         Slots from different vendor libraries are merged into a single list.
         Non-accessible slots (e.g. QSCD with restricted PIN) are skipped
         with a warning rather than raising an error.
+
+        Libraries are independent, so with more than one loaded they are
+        queried concurrently (wall time ≈ slowest reader instead of the sum).
+        Slots *within* one library are still read sequentially, since not
+        every vendor library is safe to call from several threads at once.
         """
         self._ensure_loaded()
-        all_slots: list[pkcs11.Slot] = []
 
-        for vendor_name, lib, lib_path in self._libs:
-            try:
-                slots = lib.get_slots(token_present=True)
-                logger.info(
-                    "[%s] Found %d slot(s) with tokens",
-                    vendor_name,
-                    len(slots),
-                )
-                for slot in slots:
-                    try:
-                        token = slot.get_token()
+        if len(self._libs) == 1:
+            vendor_name, lib, _ = self._libs[0]
+            per_lib = [self._enumerate_lib(vendor_name, lib)]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=len(self._libs),
+                thread_name_prefix="pkcs11-slots",
+            ) as pool:
+                per_lib = list(pool.map(
+                    lambda entry: self._enumerate_lib(entry[0], entry[1]),
+                    self._libs,
+                ))
+
+        # Keep library load order regardless of which finished first.
+        all_slots: list[pkcs11.Slot] = [slot for slots in per_lib for slot in slots]
+        logger.info("Total token slots across all libraries: %d", len(all_slots))
+        return all_slots
+
+    @staticmethod
+    def _enumerate_lib(vendor_name: str, lib: pkcs11.lib) -> list[pkcs11.Slot]:  # type: ignore[type-arg]
+        """Return the readable token slots of one library (never raises)."""
+        found: list[pkcs11.Slot] = []
+        debug = logger.isEnabledFor(logging.DEBUG)
+        try:
+            slots = lib.get_slots(token_present=True)
+            logger.info(
+                "[%s] Found %d slot(s) with tokens",
+                vendor_name,
+                len(slots),
+            )
+            for slot in slots:
+                try:
+                    token = slot.get_token()
+                    if debug:
                         logger.debug(
                             "  [%s] Slot %s: label=%r, manufacturer=%r, model=%r",
                             vendor_name,
@@ -133,23 +186,21 @@ class PKCS11Manager:
                             token.manufacturer_id,
                             token.model,
                         )
-                        all_slots.append(slot)
-                    except Exception as exc:
-                        logger.warning(
-                            "  [%s] Slot %s: skipped (cannot read token: %s)",
-                            vendor_name,
-                            slot.slot_id,
-                            exc,
-                        )
-            except Exception as exc:
-                logger.warning(
-                    "[%s] Failed to enumerate slots: %s",
-                    vendor_name,
-                    exc,
-                )
-
-        logger.info("Total token slots across all libraries: %d", len(all_slots))
-        return all_slots
+                    found.append(slot)
+                except Exception as exc:
+                    logger.warning(
+                        "  [%s] Slot %s: skipped (cannot read token: %s)",
+                        vendor_name,
+                        slot.slot_id,
+                        exc,
+                    )
+        except Exception as exc:
+            logger.warning(
+                "[%s] Failed to enumerate slots: %s",
+                vendor_name,
+                exc,
+            )
+        return found
 
     def get_all_slots(self) -> list[pkcs11.Slot]:
         """Return all slots (including empty) from every loaded library."""
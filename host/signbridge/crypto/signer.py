@@ -13,16 +13,47 @@ Supported:
 
 from __future__ import annotations
 
-import base64
 import hashlib
 import io
-from typing import TYPE_CHECKING
+import logging
+import threading
+from binascii import b2a_base64
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterator
 
 import pkcs11
+import pkcs11.exceptions
+from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
 from pkcs11 import Attribute, KeyType, Mechanism
 
+from signbridge.config import SUPPORTED_DATA_TYPES
 from signbridge.utils.logging_setup import get_logger
 
+# PDF and XML backends are imported once here rather than on every call.  A
+# missing package only disables its dataType; sign_pdf / sign_xml report it.
+try:
+    from pyhanko.sign import signers as _pyhanko_signers
+    from pyhanko.sign.fields import SigFieldSpec, append_signature_field
+    from pyhanko.sign.pkcs11 import PKCS11Signer
+    from pyhanko.pdf_utils.incremental_writer import IncrementalPdfFileWriter
+    _PYHANKO_IMPORT_ERROR: ImportError | None = None
+except ImportError as exc:
+    _pyhanko_signers = None
+    _PYHANKO_IMPORT_ERROR = exc
+
+try:
+    from lxml import etree
+    from signxml import XMLSigner
+    from signxml.algorithms import (
+        CanonicalizationMethod,
+        DigestAlgorithm,
+        SignatureConstructionMethod,
+        SignatureMethod,
+    )
+    _SIGNXML_IMPORT_ERROR: ImportError | None = None
+except ImportError as exc:
+    XMLSigner = None
+    _SIGNXML_IMPORT_ERROR = exc
+
 if TYPE_CHECKING:
     from signbridge.crypto.certificate import CertificateInfo
 
@@ -49,10 +80,95 @@ def _is_ecc_key(private_key: pkcs11.PrivateKey) -> bool:
         return False
 
 
+# ─── Hashing ────────────────────────────────────────────────────────────────
+
+# Payload types the signers accept.  hashlib reads any of them in place, so a
+# caller holding a slice of a larger buffer can pass a memoryview instead of
+# copying it into a new bytes object.
+BytesLike = bytes | bytearray | memoryview
+
+
+def _as_bytes(data: BytesLike) -> bytes:
+    """
+    *data* as ``bytes`` (copied only if it isn't already).
+
+    Needed wherever the whole message goes to the token: python-pkcs11
+    treats any non-``bytes`` argument to ``sign()`` as an iterator of chunks.
+    """
+    return data if isinstance(data, bytes) else bytes(data)
+
+
+def _sha256_digest(data: BytesLike) -> bytes:
+    """
+    Host-side SHA-256 used before handing a digest to the token.
+
+    hashlib's sha256 is OpenSSL's EVP implementation, which already picks
+    the SHA-NI / ARMv8 SHA2 code path at runtime when the CPU has it (and
+    releases the GIL on large inputs), so no separate accelerated binding
+    is needed.
+    """
+    return hashlib.sha256(data).digest()
+
+
+# Read size for streamed payloads (matches hashlib.file_digest's buffer).
+_STREAM_CHUNK_SIZE = 1 << 18
+
+
+def _iter_chunks(fp: BinaryIO) -> Iterator[bytes]:
+    """Yield *fp* in ``_STREAM_CHUNK_SIZE`` blocks until EOF."""
+    return iter(lambda: fp.read(_STREAM_CHUNK_SIZE), b"")
+
+
+def _sha256_file_digest(fp: BinaryIO) -> bytes:
+    """
+    SHA-256 of everything left in *fp*, read in fixed-size blocks.
+
+    On Python 3.11+ ``hashlib.file_digest`` does the loop in C (reading
+    straight into a reusable buffer); 3.10 gets the equivalent Python loop.
+    """
+    if hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(fp, "sha256").digest()
+    h = hashlib.sha256()
+    for chunk in _iter_chunks(fp):
+        h.update(chunk)
+    return h.digest()
+
+
+# DER DigestInfo header for SHA-256 (RFC 8017 §9.2 note 1); prepended to a
+# 32-byte digest it forms the input to a raw CKM_RSA_PKCS signature.
+SHA256_DIGESTINFO_PREFIX = bytes.fromhex("3031300d060960864801650304020105000420")
+
+_RAW_MECH_UNSUPPORTED = (
+    pkcs11.exceptions.MechanismInvalid,
+    pkcs11.exceptions.MechanismParamInvalid,
+    pkcs11.exceptions.FunctionNotSupported,
+)
+
+
+def _rsa_sign_sha256(
+    private_key: pkcs11.PrivateKey,
+    data: BytesLike,
+) -> bytes:
+    """
+    RSASSA-PKCS1-v1_5 / SHA-256 signature over *data*.
+
+    The digest is computed on the host and the token only performs the raw
+    RSA operation (CKM_RSA_PKCS over DigestInfo), so nothing is hashed
+    on-chip.  Tokens that don't offer CKM_RSA_PKCS fall back to
+    CKM_SHA256_RSA_PKCS over the data itself — the same signature value.
+    """
+    digest = _sha256_digest(data)
+    try:
+        return private_key.sign(SHA256_DIGESTINFO_PREFIX + digest, mechanism=Mechanism.RSA_PKCS)
+    except _RAW_MECH_UNSUPPORTED:
+        logger.debug("CKM_RSA_PKCS not available; falling back to CKM_SHA256_RSA_PKCS")
+        return private_key.sign(_as_bytes(data), mechanism=Mechanism.SHA256_RSA_PKCS)
+
+
 # ─── Public API ─────────────────────────────────────────────────────────────
 
 def sign_text(
-    data: str | bytes,
+    data: str | BytesLike,
     private_key: pkcs11.PrivateKey,
 ) -> bytes:
     """
@@ -64,25 +180,40 @@ def sign_text(
     if isinstance(data, str):
         data = data.encode("utf-8")
 
-    logger.debug("Signing text (%d bytes)", len(data))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Signing text (%d bytes)", len(data))
 
     try:
         if _is_ecc_key(private_key):
             # ECDSA_SHA256 hashes internally — pass raw data.
-            signature = private_key.sign(data, mechanism=Mechanism.ECDSA_SHA256)
+            signature = private_key.sign(_as_bytes(data), mechanism=Mechanism.ECDSA_SHA256)
             logger.info("Text signed with ECDSA-SHA256 (%d byte signature)", len(signature))
         else:
-            # RSA — pre-hash then sign with SHA256_RSA_PKCS.
-            digest = hashlib.sha256(data).digest()
-            signature = private_key.sign(digest, mechanism=Mechanism.SHA256_RSA_PKCS)
+            # RSA — hash on the host, raw RSA on the token.
+            signature = _rsa_sign_sha256(private_key, data)
             logger.info("Text signed with RSA-SHA256 (%d byte signature)", len(signature))
         return bytes(signature)
     except Exception as exc:
         raise SigningError("SIGN_FAILED", f"PKCS#11 text signing failed: {exc}") from exc
 
 
+# One PKCS11Signer per (session, certificate object handle): pyHanko resolves
+# the key handle and certificate material on first use, so later PDFs signed
+# with the same certificate on the same session skip that setup.  Keyed on
+# the handle rather than CKA_ID, which is None for every certificate whose ID
+# could not be read.  Sessions can't be weak-referenced; callers drop entries
+# with forget_pdf_signers() before closing a session.
+_SIGNER_CACHE: dict[tuple[pkcs11.Session, int], "PKCS11Signer"] = {}
+
+
+def forget_pdf_signers(session: pkcs11.Session) -> None:
+    """Drop cached PDF signers bound to *session* (call before closing it)."""
+    for key in [k for k in _SIGNER_CACHE if k[0] == session]:
+        del _SIGNER_CACHE[key]
+
+
 def sign_pdf(
-    pdf_bytes: bytes,
+    pdf_bytes: BytesLike,
     private_key: pkcs11.PrivateKey,
     cert_info: "CertificateInfo",
     session: pkcs11.Session,
@@ -93,36 +224,29 @@ def sign_pdf(
 
     Returns the signed PDF bytes.
     """
-    try:
-        from pyhanko.sign import signers
-        from pyhanko.sign.fields import SigFieldSpec, append_signature_field
-        from pyhanko.sign.pkcs11 import PKCS11Signer
-        from pyhanko.pdf_utils.incremental_writer import IncrementalPdfFileWriter
-        from pkcs11 import Attribute as P11Attribute
-        from asn1crypto import x509 as asn1_x509
-        from cryptography.hazmat.primitives.serialization import Encoding
-    except ImportError as exc:
-        raise SigningError("INTERNAL_ERROR", f"pyHanko not installed: {exc}") from exc
+    if _pyhanko_signers is None:
+        raise SigningError(
+            "INTERNAL_ERROR", f"pyHanko not installed: {_PYHANKO_IMPORT_ERROR}"
+        ) from _PYHANKO_IMPORT_ERROR
 
     try:
         # Build a PKCS#11 signer reusing the already-authenticated session.
         # The cert and private key were already verified in _sign_worker.
         # Link them via CKA_ID (the standard PKCS#11 mechanism to associate
         # a certificate with its private key), NOT by label which can differ.
-        try:
-            cert_id_bytes = bytes(cert_info.pkcs11_cert[P11Attribute.ID])
-        except Exception:
-            cert_id_bytes = None
+        cert_id_bytes = cert_info.cert_id_attr
 
         # Provide the certificate directly so pyHanko doesn't re-discover it.
-        cert_der = cert_info.x509_cert.public_bytes(Encoding.DER)
-        asn1_cert = asn1_x509.Certificate.load(cert_der)
-
-        signer = PKCS11Signer(
-            pkcs11_session=session,
-            signing_cert=asn1_cert,
-            key_id=cert_id_bytes,
-        )
+        # Parsed once per CertificateInfo from the token DER (no re-encode),
+        # so repeat PDFs with the same certificate reuse it.
+        cache_key = (session, cert_info.handle)
+        signer = _SIGNER_CACHE.get(cache_key)
+        if signer is None:
+            signer = _SIGNER_CACHE[cache_key] = PKCS11Signer(
+                pkcs11_session=session,
+                signing_cert=cert_info.asn1_cert,
+                key_id=cert_id_bytes,
+            )
 
         pdf_reader = IncrementalPdfFileWriter(io.BytesIO(pdf_bytes))
 
@@ -139,9 +263,9 @@ def sign_pdf(
         except Exception:
             logger.debug("Signature field %r already exists, reusing it", sig_field)
 
-        result = signers.sign_pdf(
+        result = _pyhanko_signers.sign_pdf(
             pdf_reader,
-            signers.PdfSignatureMetadata(
+            _pyhanko_signers.PdfSignatureMetadata(
                 field_name=sig_field,
                 reason=f"Signed by SignBridge",
                 location="SignBridge",
@@ -149,9 +273,11 @@ def sign_pdf(
             signer=signer,
         )
 
-        signed_bytes = result.getbuffer()
+        # getvalue() is a single copy out of the BytesIO (bytes(getbuffer())
+        # went through a memoryview and also pinned the buffer while alive).
+        signed_bytes = result.getvalue()
         logger.info("PDF signed successfully (%d bytes → %d bytes)", len(pdf_bytes), len(signed_bytes))
-        return bytes(signed_bytes)
+        return signed_bytes
 
     except SigningError:
         raise
@@ -159,33 +285,113 @@ def sign_pdf(
         raise SigningError("SIGN_FAILED", f"PDF signing failed: {exc}") from exc
 
 
+def _sign_sha256_digest(
+    private_key: pkcs11.PrivateKey,
+    ecc: bool,
+    digest: bytes,
+    message: Callable[[], bytes | Iterator[bytes]] | None,
+) -> bytes:
+    """
+    Sign a host-computed SHA-256 *digest* with the raw mechanism
+    (CKM_RSA_PKCS over DigestInfo, or CKM_ECDSA).
+
+    Tokens without it get the full message from *message()* — ``bytes`` or
+    an iterator of chunks for a multi-part operation — under
+    CKM_SHA256_RSA_PKCS / CKM_ECDSA_SHA256.  With *message* None the
+    mechanism error propagates.
+    """
+    if ecc:
+        raw_input, raw_mech, full_mech = digest, Mechanism.ECDSA, Mechanism.ECDSA_SHA256
+    else:
+        raw_input, raw_mech, full_mech = (
+            SHA256_DIGESTINFO_PREFIX + digest, Mechanism.RSA_PKCS, Mechanism.SHA256_RSA_PKCS,
+        )
+    try:
+        signature = private_key.sign(raw_input, mechanism=raw_mech)
+    except _RAW_MECH_UNSUPPORTED:
+        if message is None:
+            raise
+        logger.debug("%s not available; signing the full message with %s", raw_mech.name, full_mech.name)
+        signature = private_key.sign(message(), mechanism=full_mech)
+    logger.info(
+        "Binary signed with %s (%d byte signature)",
+        "ECDSA-SHA256" if ecc else "RSA-SHA256", len(signature),
+    )
+    return bytes(signature)
+
+
 def sign_binary(
-    data: bytes,
+    data: BytesLike,
     private_key: pkcs11.PrivateKey,
 ) -> bytes:
     """
     Sign raw binary data.
 
     Returns the raw signature bytes.
-    Process: PKCS#11 sign (RSA-SHA256 or ECDSA-SHA256).
+    Process: host SHA-256 straight from *data*'s buffer → PKCS#11 raw
+    RSA/ECDSA over the digest (see :func:`sign_binary_stream`).
     """
-    logger.debug("Signing binary (%d bytes)", len(data))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Signing binary (%d bytes)", len(data))
 
     try:
-        if _is_ecc_key(private_key):
-            signature = private_key.sign(data, mechanism=Mechanism.ECDSA_SHA256)
-            logger.info("Binary signed with ECDSA-SHA256 (%d byte signature)", len(signature))
-        else:
-            digest = hashlib.sha256(data).digest()
-            signature = private_key.sign(digest, mechanism=Mechanism.SHA256_RSA_PKCS)
-            logger.info("Binary signed with RSA-SHA256 (%d byte signature)", len(signature))
-        return bytes(signature)
+        return _sign_sha256_digest(
+            private_key, _is_ecc_key(private_key), _sha256_digest(data), lambda: _as_bytes(data),
+        )
     except Exception as exc:
         raise SigningError("SIGN_FAILED", f"PKCS#11 binary signing failed: {exc}") from exc
 
 
+def sign_binary_stream(
+    fp: BinaryIO,
+    private_key: pkcs11.PrivateKey,
+) -> bytes:
+    """
+    Sign everything remaining in the binary file object *fp*.
+
+    The payload is hashed in blocks on the host, so it never has to be held
+    in memory as one ``bytes``; only the 32-byte digest goes to the token
+    (CKM_RSA_PKCS over DigestInfo, or CKM_ECDSA).  If the token lacks the
+    raw mechanism and *fp* is seekable, the stream is rewound and fed to
+    CKM_SHA256_RSA_PKCS / CKM_ECDSA_SHA256 as a multi-part operation.
+
+    Returns the raw signature bytes (RSA-SHA256 or ECDSA-SHA256 r || s).
+    """
+    try:
+        ecc = _is_ecc_key(private_key)
+        message = None
+        if fp.seekable():
+            start = fp.tell()
+
+            def message() -> Iterator[bytes]:
+                fp.seek(start)
+                return _iter_chunks(fp)
+
+        return _sign_sha256_digest(private_key, ecc, _sha256_file_digest(fp), message)
+    except Exception as exc:
+        raise SigningError("SIGN_FAILED", f"PKCS#11 binary signing failed: {exc}") from exc
+
+
+# Parser for incoming XML: no ID index (signxml resolves reference URIs by
+# XPath, never getElementById) and no libxml2 size caps for large documents.
+# Entity handling stays at lxml's default (internal entities only): signxml
+# re-serializes the root element without its DTD, so unresolved references
+# would not survive.  lxml parsers must not be shared between threads, so
+# each signing thread keeps its own instance.
+_xml_parsers = threading.local()
+
+
+def _xml_parser() -> "etree.XMLParser":
+    parser = getattr(_xml_parsers, "parser", None)
+    if parser is None:
+        parser = _xml_parsers.parser = etree.XMLParser(
+            collect_ids=False, huge_tree=True,
+        )
+    return parser
+
+
 def sign_xml(
-    data: bytes,
+    data: BytesLike,
     private_key: pkcs11.PrivateKey,
     cert_info: "CertificateInfo",
     xpath: str | None = None,
@@ -227,29 +433,24 @@ def sign_xml(
     bytes
         The complete XML document with the embedded ``<ds:Signature>``.
     """
-    try:
-        from lxml import etree
-        from signxml import XMLSigner
-        from signxml.algorithms import (
-            CanonicalizationMethod,
-            DigestAlgorithm,
-            SignatureConstructionMethod,
-            SignatureMethod,
-        )
-    except ImportError as exc:
-        raise SigningError("INTERNAL_ERROR", f"signxml not installed: {exc}") from exc
+    if XMLSigner is None:
+        raise SigningError(
+            "INTERNAL_ERROR", f"signxml not installed: {_SIGNXML_IMPORT_ERROR}"
+        ) from _SIGNXML_IMPORT_ERROR
 
     try:
         # ── Detect key type ───────────────────────────────────────────
         ecc = _is_ecc_key(private_key)
         sig_method = SignatureMethod.ECDSA_SHA256 if ecc else SignatureMethod.RSA_SHA256
-        sign_mechanism = Mechanism.ECDSA_SHA256 if ecc else Mechanism.SHA256_RSA_PKCS
-        logger.debug("XML signing with %s", "ECDSA-SHA256" if ecc else "RSA-SHA256")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("XML signing with %s", "ECDSA-SHA256" if ecc else "RSA-SHA256")
 
         # ── PKCS#11 key proxy ─────────────────────────────────────────
         # signxml calls  key.sign(data, padding=…, algorithm=…)  using
         # pure duck-typing (no isinstance check).  We delegate to the
-        # hardware token which hashes + signs on-chip.
+        # hardware token: RSA hashes SignedInfo on the host and sends only
+        # the DigestInfo for a raw CKM_RSA_PKCS operation; ECDSA signs
+        # with CKM_ECDSA_SHA256.
         #
         # ECDSA format note:
         #   PKCS#11 returns raw (r || s) concatenated bytes.
@@ -260,17 +461,16 @@ def sign_xml(
             """Minimal proxy so signxml can call .sign() on a PKCS#11 key."""
 
             def sign(self, data: bytes, **_kw: object) -> bytes:
+                if not ecc:
+                    return bytes(_rsa_sign_sha256(private_key, data))
                 raw = bytes(
-                    private_key.sign(data, mechanism=sign_mechanism)
+                    private_key.sign(data, mechanism=Mechanism.ECDSA_SHA256)
                 )
-                if ecc:
-                    # Convert raw (r || s) → DER-encoded ASN.1
-                    from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
-                    half = len(raw) // 2
-                    r = int.from_bytes(raw[:half], byteorder="big")
-                    s = int.from_bytes(raw[half:], byteorder="big")
-                    return encode_dss_signature(r, s)
-                return raw
+                # Convert raw (r || s) → DER-encoded ASN.1
+                half = len(raw) // 2
+                r = int.from_bytes(raw[:half], byteorder="big")
+                s = int.from_bytes(raw[half:], byteorder="big")
+                return encode_dss_signature(r, s)
 
             @property
             def key_size(self) -> int:
@@ -279,7 +479,7 @@ def sign_xml(
         proxy_key = _PKCS11KeyProxy()
 
         # ── Parse XML ─────────────────────────────────────────────────
-        root = etree.fromstring(data)
+        root = etree.fromstring(data, _xml_parser())
 
         # ── Signature placement via xpath ─────────────────────────────
         if xpath:
@@ -292,11 +492,11 @@ def sign_xml(
 
                 if local_name == "Signature":
                     # Matched element IS a Signature (placeholder) — reuse it.
+                    # One lxml call drops its children, text and attributes
+                    # (ds:Signature allows only Id, which is set below).
+                    target.clear(keep_tail=True)
                     target.tag = f"{{{ns_dsig}}}Signature"
                     target.set("Id", "placeholder")
-                    for child in list(target):
-                        target.remove(child)
-                    target.text = None
                     logger.debug("Reusing existing Signature element at xpath=%r", xpath)
                 else:
                     # Matched element is the parent — insert placeholder as child.
@@ -347,7 +547,7 @@ def sign_xml(
 # ─── Dispatcher ─────────────────────────────────────────────────────────────
 
 def sign_content(
-    data: bytes,
+    data: BytesLike,
     data_type: str,
     private_key: pkcs11.PrivateKey,
     cert_info: "CertificateInfo",
@@ -361,8 +561,8 @@ def sign_content(
 
     Parameters
     ----------
-    data : bytes
-        The raw content to sign.
+    data : bytes | bytearray | memoryview
+        The raw content to sign (any buffer; hashed in place where possible).
     data_type : str
         One of: text, json, pdf, binary, xml.
     private_key : pkcs11.PrivateKey
@@ -382,26 +582,40 @@ def sign_content(
     bytes
         The signed output (signature string for text/json, signed PDF for pdf, etc.).
     """
-    if data_type in ("text", "json"):
-        sig_bytes = sign_text(data, private_key)
-        # For text/json, the "signed content" uploaded is the base64 signature
-        return base64.b64encode(sig_bytes)
-
-    elif data_type == "pdf":
-        return sign_pdf(
-            data,
-            private_key,
-            cert_info,
-            session,
-            label=pdf_label or "Digital Signature",
-        )
+    # Reject unknown types with a set probe before anything else runs
+    # (no KeyError to raise and translate on malformed requests).
+    if data_type not in SUPPORTED_DATA_TYPES:
+        raise SigningError("UNSUPPORTED_TYPE", f"Unsupported dataType: {data_type}")
+    return _DISPATCH[data_type](
+        data, private_key, cert_info, session, pdf_label, xml_xpath, xml_id_attribute,
+    )
 
-    elif data_type == "binary":
-        sig_bytes = sign_binary(data, private_key)
-        return sig_bytes
 
-    elif data_type == "xml":
-        return sign_xml(data, private_key, cert_info, xml_xpath, xml_id_attribute)
+# Per-dataType handlers, all taking sign_content's positional arguments.
 
-    else:
-        raise SigningError("UNSUPPORTED_TYPE", f"Unsupported dataType: {data_type}")
+def _sign_textish(data, private_key, _cert_info, _session, _pdf_label, _xpath, _id_attr) -> bytes:
+    # For text/json, the "signed content" uploaded is the base64 signature
+    # (binascii directly: same output as base64.b64encode, minus the wrapper).
+    return b2a_base64(sign_text(data, private_key), newline=False)
+
+
+def _sign_pdf(data, private_key, cert_info, session, pdf_label, _xpath, _id_attr) -> bytes:
+    return sign_pdf(data, private_key, cert_info, session, label=pdf_label or "Digital Signature")
+
+
+def _sign_binary(data, private_key, _cert_info, _session, _pdf_label, _xpath, _id_attr) -> bytes:
+    return sign_binary(data, private_key)
+
+
+def _sign_xml(data, private_key, cert_info, _session, _pdf_label, xpath, id_attr) -> bytes:
+    return sign_xml(data, private_key, cert_info, xpath, id_attr)
+
+
+# Keys must match config.SUPPORTED_DATA_TYPES.
+_DISPATCH: dict[str, Callable[..., bytes]] = {
+    "text": _sign_textish,
+    "json": _sign_textish,
+    "pdf": _sign_pdf,
+    "binary": _sign_binary,
+    "xml": _sign_xml,
+}
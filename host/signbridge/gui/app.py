@@ -11,11 +11,17 @@ Responsibilities:
 
 from __future__ import annotations
 
+import os
+import re
+import stat
 import sys
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any, Optional
 
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, QTimer, QMetaObject, QSocketNotifier, pyqtSignal, pyqtSlot, QObject
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -27,23 +33,24 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QProgressBar,
-    QTextEdit,
+    QPlainTextEdit,
     QGroupBox,
     QMessageBox,
     QSplitter,
 )
-from PyQt6.QtGui import QFont, QTextCursor, QIcon
+from PyQt6.QtGui import QFont, QIcon
 
 from signbridge.config import APP_NAME, APP_VERSION, resource_path
 from signbridge.crypto.pkcs11_manager import PKCS11Manager
-from signbridge.crypto.certificate import find_certificates, find_certificate_by_id, find_private_key, CertificateInfo
+from signbridge.crypto.certificate import find_certificates, find_certificate_by_id, find_private_key, forget_session, CertificateInfo
+from signbridge.crypto.signer import forget_pdf_signers
 
 try:
     import pkcs11.exceptions as pkcs11_exc
 except ImportError:
     pkcs11_exc = None  # type: ignore[assignment]
-from signbridge.messaging.native_io import read_message, write_message
-from signbridge.messaging.request_parser import parse_request, RequestValidationError
+from signbridge.messaging.native_io import FrameDecoder, decode_frame, read_message, write_message
+from signbridge.messaging.request_parser import parse_request, RequestValidationError, SignRequest
 from signbridge.messaging.response_builder import build_request_error
 from signbridge.processing.engine import process_request
 from signbridge.processing.object_resolver import resolve_objects
@@ -52,17 +59,47 @@ from signbridge.utils.logging_setup import get_logger
 
 logger = get_logger("gui.app")
 
+# Lines kept in the Activity Log view; older lines are dropped from the top.
+LOG_VIEW_MAX_LINES = 2000
+
+# How often buffered log lines are written to the view.
+LOG_FLUSH_INTERVAL_MS = 50
+
+# Minimum spacing of progress-bar signals from the sign worker (20 Hz); ticks
+# in between are parked and picked up by the log-flush timer.
+PROGRESS_EMIT_INTERVAL_NS = 50_000_000
+
+# Token-label keywords for _is_signing_slot (labels are upper-cased first).
+# "SIGN" already covers SIGNATURE / SIGNING; SEMNARE is Romanian for signing.
+_SIGNING_LABEL_RE = re.compile(r"SIGN|SEMNARE")
+_AUTH_ONLY_LABEL_RE = re.compile(r"PKI APPLICATION")
+
+# Request-level error callbacks are independent POSTs, so they go out in
+# parallel; the caller waits at most ERROR_CALLBACK_WAIT_S for them.
+_CALLBACK_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="error-callback")
+ERROR_CALLBACK_WAIT_S = 10
+
+# Bytes requested per os.read() on a non-blocking stdin.
+STDIN_READ_CHUNK = 64 * 1024
+
+# Frames read by the stdin notifier (on the GUI thread) are JSON-decoded and
+# validated here instead; one worker keeps them in arrival order.
+_PARSE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="request-parse")
+
+# Token polling: relaxed while a signing token is present, brisk while the
+# user may be about to insert one.
+TOKEN_REFRESH_IDLE_MS = 15000
+TOKEN_REFRESH_FAST_MS = 2000
+
 
 # ─── Thread-safe signal bridge ──────────────────────────────────────────────
 
 class _Signals(QObject):
     """Qt signals for cross-thread communication."""
-    message_received = pyqtSignal(dict)
     progress_update = pyqtSignal(str, int, str)  # object_id, percent, message
     signing_complete = pyqtSignal(dict)            # response dict
     signing_error = pyqtSignal(str)                # error message
-    log_message = pyqtSignal(str)
-    tokens_refreshed = pyqtSignal(list)            # list of signing-capable slots
+    tokens_refreshed = pyqtSignal(list)            # [(slot, label)] of signing-capable slots
 
 
 # ─── Main window ────────────────────────────────────────────────────────────
@@ -75,17 +112,45 @@ class SignBridgeWindow(QMainWindow):
         self._signals = _Signals()
         self._pkcs11 = PKCS11Manager()
 
+        # Activity-log entries (stamp, text, %-args) waiting for the next
+        # flush (any thread appends, the GUI thread drains — deque
+        # append/popleft are atomic).  Entries also wait here while the
+        # window is minimized or hidden; the cap matches the view, so
+        # nothing the view would still show is dropped, and entries pushed
+        # out of the cap are never formatted.
+        self._log_buffer: deque[tuple[str, str, tuple[Any, ...]]] = deque(maxlen=LOG_VIEW_MAX_LINES)
+        # (epoch second, "HH:MM:SS") of the last stamped line — one tuple so
+        # threads always see a matching pair.
+        self._log_stamp: tuple[int, str] = (0, "")
+        # Latest progress tick the sign worker did not emit, and the last
+        # one the GUI thread applied (only the worker writes the former).
+        self._pending_progress: tuple[str, int, str] | None = None
+        self._applied_progress: tuple[str, int, str] | None = None
+
         # State
         self._current_request: dict[str, Any] | None = None
+        self._current_parsed: SignRequest | None = None
+        # (raw message, SignRequest or RequestValidationError) pairs from
+        # the stdin reader; one queued _drain_mailbox call per burst.
+        self._msg_mailbox: deque[tuple[dict[str, Any], Any]] = deque()
+        self._mailbox_drain_scheduled = False
         self._slots: list = []
         self._cancel_requested = False
         self._response_sent = False
         self._signing_in_progress = False
         self._token_refresh_in_progress = False
+        self._refresh_timer: QTimer | None = None
+        # (slot_id, label) pairs behind the current combo contents; a refresh
+        # that finds the same set leaves the combo alone.
+        self._last_slot_fingerprint: tuple[tuple[int, str], ...] | None = None
+        # No signing token seen yet (or one just vanished) → poll fast.
+        self._token_absent = True
 
         self._init_ui()
         self._connect_signals()
-        self._init_pkcs11()
+        # Vendor middleware can take hundreds of ms to dlopen/C_Initialize;
+        # load it from the event loop so the window paints first.
+        QTimer.singleShot(0, self._init_pkcs11)
         self._start_stdin_listener()
         self._setup_token_refresh()
 
@@ -198,22 +263,29 @@ class SignBridgeWindow(QMainWindow):
         log_group = QGroupBox("Activity Log")
         log_layout = QVBoxLayout(log_group)
 
-        self._log_text = QTextEdit()
+        # Plain-text widget (no rich-text layout per line), capped so a long
+        # session can't grow the document without bound.
+        self._log_text = QPlainTextEdit()
         self._log_text.setReadOnly(True)
+        self._log_text.setMaximumBlockCount(LOG_VIEW_MAX_LINES)
         self._log_text.setFont(QFont("Consolas", 9))
         self._log_text.setStyleSheet("background-color: #1e1e2e; color: #cdd6f4;")
         log_layout.addWidget(self._log_text)
 
+        # Buffered lines are written to the view in one block per tick.
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_timer.timeout.connect(self._flush_progress)
+        self._log_flush_timer.start(LOG_FLUSH_INTERVAL_MS)
+
         root_layout.addWidget(log_group, stretch=1)
 
     # ── Signal wiring ───────────────────────────────────────────────────
 
     def _connect_signals(self) -> None:
-        self._signals.message_received.connect(self._handle_message)
         self._signals.progress_update.connect(self._on_progress)
         self._signals.signing_complete.connect(self._on_signing_complete)
         self._signals.signing_error.connect(self._on_signing_error)
-        self._signals.log_message.connect(self._append_log)
         self._signals.tokens_refreshed.connect(self._on_tokens_refreshed)
 
     # ── PKCS#11 init ────────────────────────────────────────────────────
@@ -231,15 +303,22 @@ class SignBridgeWindow(QMainWindow):
             self._log(f"[ERROR] PKCS#11 init failed: {exc}")
 
     def _setup_token_refresh(self) -> None:
-        """Refresh token list every 5 seconds (enumeration runs off-thread)."""
+        """Poll the token list periodically (enumeration runs off-thread)."""
         self._refresh_timer = QTimer(self)
         self._refresh_timer.timeout.connect(self._refresh_tokens)
-        self._refresh_timer.start(5000)
+        self._refresh_timer.start(
+            TOKEN_REFRESH_FAST_MS if self._token_absent else TOKEN_REFRESH_IDLE_MS
+        )
 
     def _refresh_tokens(self) -> None:
         """Kick off a background token enumeration (non-blocking)."""
         if not self._pkcs11.is_loaded:
             return
+        if self._refresh_timer is not None:
+            # Adopt the pace decided by the previous enumeration.
+            interval = TOKEN_REFRESH_FAST_MS if self._token_absent else TOKEN_REFRESH_IDLE_MS
+            if self._refresh_timer.interval() != interval:
+                self._refresh_timer.setInterval(interval)
         if self._token_refresh_in_progress:
             return  # previous refresh still running — skip this tick
         self._token_refresh_in_progress = True
@@ -251,10 +330,32 @@ class SignBridgeWindow(QMainWindow):
     def _token_refresh_worker(self) -> None:
         """Background thread: enumerate PKCS#11 slots (slow I/O)."""
         try:
-            all_slots = self._pkcs11.get_token_slots()
-            signing_slots = [s for s in all_slots if self._is_signing_slot(s)]
+            # Each slot's token info (C_GetTokenInfo) is read exactly once
+            # per pass; everything downstream works from these labels.
+            # Single fused filter+map pass with the bound methods hoisted.
+            signing_slots: list[tuple[Any, str]] = []
+            append = signing_slots.append
+            is_signing_slot = self._is_signing_slot
+            for slot in self._pkcs11.get_token_slots():
+                try:
+                    label = slot.get_token().label.strip()
+                except Exception:
+                    continue  # can't even read the token → skip
+                if is_signing_slot(label.upper()):
+                    append((slot, label))
+            fingerprint = tuple(sorted(
+                (slot.slot_id, label) for slot, label in signing_slots
+            ))
+            self._token_absent = not signing_slots
+            if fingerprint == self._last_slot_fingerprint:
+                return  # same tokens as last time — nothing to redraw
+            self._last_slot_fingerprint = fingerprint
             self._signals.tokens_refreshed.emit(signing_slots)
         except Exception as exc:
+            if pkcs11_exc is not None and isinstance(
+                exc, (pkcs11_exc.TokenNotPresent, pkcs11_exc.DeviceRemoved)
+            ):
+                self._token_absent = True
             logger.debug("Token refresh error: %s", exc)
         finally:
             self._token_refresh_in_progress = False
@@ -271,12 +372,11 @@ class SignBridgeWindow(QMainWindow):
         self._token_combo.clear()
 
         restored = False
-        for idx, slot in enumerate(self._slots):
-            token = slot.get_token()
-            label = token.label.strip()
+        for idx, entry in enumerate(self._slots):
+            slot, label = entry
             slot_key = (slot.slot_id, label)
             display = f"{label} (slot {slot.slot_id})"
-            self._token_combo.addItem(display, slot)
+            self._token_combo.addItem(display, entry)
 
             if not restored and prev_key is not None and slot_key == prev_key:
                 self._token_combo.setCurrentIndex(idx)
@@ -287,19 +387,18 @@ class SignBridgeWindow(QMainWindow):
 
     def _selected_token_key(self) -> tuple[int, str] | None:
         """Return a stable (slot_id, label) key for the currently selected token."""
-        slot = self._token_combo.currentData()
-        if slot is None:
-            return None
-        try:
-            return (slot.slot_id, slot.get_token().label.strip())
-        except Exception:
+        entry = self._token_combo.currentData()
+        if entry is None:
             return None
+        slot, label = entry
+        return (slot.slot_id, label)
 
     @staticmethod
-    def _is_signing_slot(slot: Any) -> bool:
+    def _is_signing_slot(label: str) -> bool:
         """
-        Heuristic filter: return True if the token in *slot* is likely
-        a signing-capable token (non-repudiation / advanced signature).
+        Heuristic filter: return True if the token labelled *label* (already
+        stripped and upper-cased) is likely a signing-capable token
+        (non-repudiation / advanced signature).
 
         Known patterns:
           • RO eID "ADVANCED SIGNATURE PIN" → True
@@ -307,17 +406,13 @@ class SignBridgeWindow(QMainWindow):
           • SafeNet eToken → True (generic device, all are signing)
           • Everything else → True (default include)
         """
-        try:
-            label = slot.get_token().label.strip().upper()
-        except Exception:
-            return False  # can't even read the token → skip
-
-        # Explicit signing indicator keywords
-        if any(kw in label for kw in ("SIGNATURE", "SEMNARE", "SIGNING", "SIGN")):
+        # Explicit signing indicator keywords (one scan for all of them)
+        if _SIGNING_LABEL_RE.search(label):
             return True
 
-        # Known auth-only pattern (RO eID authentication slot)
-        if "PKI APPLICATION" in label and "SIGNATURE" not in label:
+        # Known auth-only pattern (RO eID authentication slot); a label that
+        # also says SIGNATURE was already accepted above.
+        if _AUTH_ONLY_LABEL_RE.search(label):
             return False
 
         # Default: include (SafeNet eToken, generic HSMs, etc.)
@@ -326,58 +421,141 @@ class SignBridgeWindow(QMainWindow):
     # ── Stdin listener (background thread) ──────────────────────────────
 
     def _start_stdin_listener(self) -> None:
-        """Start a background thread that listens for native messages on stdin."""
-        t = threading.Thread(target=self._stdin_loop, daemon=True, name="stdin-listener")
-        t.start()
+        """
+        Start listening for native messages on stdin.
+
+        Where stdin is a pipe or socket (how browsers launch the host) on a
+        POSIX system, the Qt event loop watches the fd directly via
+        QSocketNotifier — no extra thread, no cross-thread signal per
+        message.  Otherwise (Windows, or a terminal in development) a
+        background thread blocks in read_message().
+        """
+        if not self._start_stdin_notifier():
+            t = threading.Thread(target=self._stdin_loop, daemon=True, name="stdin-listener")
+            t.start()
         self._log("Listening for extension messages…")
 
+    def _start_stdin_notifier(self) -> bool:
+        """Switch stdin to non-blocking and watch it from the event loop (POSIX pipes only)."""
+        if sys.platform == "win32":
+            return False
+        try:
+            fd = sys.stdin.fileno()
+            mode = os.fstat(fd).st_mode
+            if not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)):
+                # A tty shares its file description with stdout; making it
+                # non-blocking would make our own writes fail with EAGAIN.
+                return False
+            os.set_blocking(fd, False)
+        except (AttributeError, OSError, ValueError):
+            return False
+
+        self._stdin_fd = fd
+        self._stdin_decoder = FrameDecoder()
+        self._stdin_notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+        self._stdin_notifier.activated.connect(self._on_stdin_ready)
+        return True
+
+    def _on_stdin_ready(self) -> None:
+        """Main thread: drain readable stdin and queue every complete frame for parsing."""
+        while True:
+            try:
+                chunk = os.read(self._stdin_fd, STDIN_READ_CHUNK)
+            except BlockingIOError:
+                return  # drained — wait for the next notification
+            except OSError as exc:
+                logger.error("Failed to read native message: %s", exc)
+                chunk = b""
+
+            if not chunk:
+                if self._stdin_decoder.pending:
+                    logger.error("stdin closed with %d byte(s) of an incomplete frame", self._stdin_decoder.pending)
+                self._stop_stdin_notifier("[INFO] Extension disconnected (stdin closed)")
+                return
+
+            try:
+                frames = self._stdin_decoder.feed_frames(chunk)
+            except ValueError as exc:
+                logger.error("%s", exc)
+                self._stop_stdin_notifier(f"[ERROR] Invalid native message ({exc}); no longer reading stdin")
+                return
+            for body in frames:
+                _PARSE_POOL.submit(self._decode_and_emit, body)
+
+    def _stop_stdin_notifier(self, reason: str) -> None:
+        self._stdin_notifier.setEnabled(False)
+        self._log(reason)
+
     def _stdin_loop(self) -> None:
         """Background thread: read messages from stdin and emit Qt signal."""
         while True:
             msg = read_message()
             if msg is None:
                 # stdin closed → extension disconnected
-                self._signals.log_message.emit("[INFO] Extension disconnected (stdin closed)")
+                self._log("[INFO] Extension disconnected (stdin closed)")
                 break
-            self._signals.message_received.emit(msg)
+            self._parse_and_emit(msg)
+
+    def _decode_and_emit(self, body: bytes) -> None:
+        """Parse worker: JSON-decode and validate one frame in a single hop."""
+        msg = decode_frame(body)
+        if msg is not None:
+            self._parse_and_emit(msg)
+
+    def _parse_and_emit(self, msg: dict[str, Any]) -> None:
+        """Worker thread: validate *msg* and hand both forms to the main thread."""
+        try:
+            parsed: SignRequest | RequestValidationError = parse_request(msg)
+        except RequestValidationError as exc:
+            parsed = exc
+        # Only one reader produces at a time, so the flag needs no lock: a
+        # message appended after the drain cleared it is still picked up by
+        # that drain, at worst followed by one empty extra call.
+        self._msg_mailbox.append((msg, parsed))
+        if not self._mailbox_drain_scheduled:
+            self._mailbox_drain_scheduled = True
+            QMetaObject.invokeMethod(self, "_drain_mailbox", Qt.ConnectionType.QueuedConnection)
+
+    @pyqtSlot()
+    def _drain_mailbox(self) -> None:
+        """Main thread: handle every message the reader has queued."""
+        self._mailbox_drain_scheduled = False
+        mailbox = self._msg_mailbox
+        while mailbox:
+            self._handle_message(*mailbox.popleft())
 
     # ── Message handling (main thread) ──────────────────────────────────
 
-    def _handle_message(self, msg: dict[str, Any]) -> None:
-        """Handle a message received from the extension (runs on Qt main thread)."""
-        self._log(f"[RECV] Message received: requestId={msg.get('requestId', '?')}")
+    def _handle_message(self, msg: dict[str, Any], request: SignRequest | RequestValidationError) -> None:
+        """Handle a message received from the extension (runs on Qt main thread).
+
+        *request* is the already-parsed form of *msg*, or the validation
+        error parsing it raised.
+        """
+        self._log("[RECV] Message received: requestId=%s", msg.get("requestId", "?"))
         self._flash_window()
 
-        # Try to parse
-        try:
-            request = parse_request(msg)
-        except RequestValidationError as exc:
-            self._log(f"[ERROR] Validation failed: {exc.code} — {exc.message}")
+        if isinstance(request, RequestValidationError):
+            self._log("[ERROR] Validation failed: %s — %s", request.code, request.message)
             error_resp = build_request_error(
                 request_id=msg.get("requestId"),
-                code=exc.code,
-                message=exc.message,
+                code=request.code,
+                message=request.message,
                 metadata=msg.get("metadata"),
             )
             write_message(error_resp)
             return
 
         self._current_request = msg
+        self._current_parsed = request
         self._response_sent = False
         self._status_label.setText(
             f"Signing request received: {request.app_id} — "
-            f"{self._count_objects(request)} object(s)"
+            f"{request.total_object_count} object(s)"
         )
         self._status_label.setStyleSheet("color: #2563eb; font-size: 12px; padding: 4px;")
         self._update_ui_state()
 
-    def _count_objects(self, request: Any) -> int:
-        if request.objects:
-            return len(request.objects)
-        if request.object_groups:
-            return sum(len(g.objects) for g in request.object_groups)
-        return 0
-
     # ── Sign action ─────────────────────────────────────────────────────
 
     def _on_sign_clicked(self) -> None:
@@ -386,12 +564,13 @@ class SignBridgeWindow(QMainWindow):
             QMessageBox.warning(self, "PIN Required", "Please enter your HSM token PIN.")
             return
 
-        slot = self._token_combo.currentData()
-        if slot is None:
+        entry = self._token_combo.currentData()
+        if entry is None:
             QMessageBox.warning(self, "No Token", "No HSM token selected.")
             return
+        slot = entry[0]
 
-        if self._current_request is None:
+        if self._current_request is None or self._current_parsed is None:
             QMessageBox.warning(self, "No Request", "No signing request pending.")
             return
 
@@ -407,25 +586,22 @@ class SignBridgeWindow(QMainWindow):
         # Run signing in background thread
         t = threading.Thread(
             target=self._sign_worker,
-            args=(self._current_request, pin, slot),
+            args=(self._current_request, self._current_parsed, pin, slot),
             daemon=True,
             name="sign-worker",
         )
         t.start()
 
-    def _sign_worker(self, raw_request: dict, pin: str, slot: Any) -> None:
+    def _sign_worker(self, raw_request: dict, request: SignRequest, pin: str, slot: Any) -> None:
         """Background thread: perform the signing workflow."""
         session = None
         try:
-            # Parse request
-            request = parse_request(raw_request)
-
             # Open HSM session
-            self._signals.log_message.emit("[SIGN] Opening HSM session…")
+            self._log("[SIGN] Opening HSM session…")
             session = self._pkcs11.open_session(slot, pin)
 
             # Find certificate
-            self._signals.log_message.emit(f"[SIGN] Looking for certificate: {request.cert.cert_id}")
+            self._log("[SIGN] Looking for certificate: %s", request.cert.cert_id)
             cert_info = find_certificate_by_id(session, request.cert.cert_id)
             if cert_info is None:
                 msg = f"Certificate not found on token: {request.cert.cert_id}"
@@ -435,10 +611,10 @@ class SignBridgeWindow(QMainWindow):
                     message=msg,
                     metadata=raw_request.get("metadata"),
                 )
-                self._send_error_callbacks_for_all(raw_request, "CERT_NOT_FOUND", msg)
+                self._send_error_callbacks_for_all(request, "CERT_NOT_FOUND", msg)
                 self._signals.signing_complete.emit(error_resp)
                 return
-            self._signals.log_message.emit(f"[SIGN] Certificate found: {cert_info.subject_cn}")
+            self._log("[SIGN] Certificate found: %s", cert_info.subject_cn)
 
             # Find private key
             priv_key = find_private_key(session, cert_info)
@@ -450,14 +626,29 @@ class SignBridgeWindow(QMainWindow):
                     message=msg,
                     metadata=raw_request.get("metadata"),
                 )
-                self._send_error_callbacks_for_all(raw_request, "CERT_NOT_FOUND", msg)
+                self._send_error_callbacks_for_all(request, "CERT_NOT_FOUND", msg)
                 self._signals.signing_complete.emit(error_resp)
                 return
-            self._signals.log_message.emit("[SIGN] Private key found")
+            self._log("[SIGN] Private key found")
+
+            # Process all objects.  Every new (object, message) line goes
+            # straight to the log; the bar/label signal is rate-limited and
+            # the final 100% tick is always sent.
+            last_emit_ns = 0
+            last_line: tuple[str, str] | None = None
 
-            # Process all objects
             def progress_fn(obj_id: str, pct: int, msg: str) -> None:
-                self._signals.progress_update.emit(obj_id, pct, msg)
+                nonlocal last_emit_ns, last_line
+                if obj_id and (obj_id, msg) != last_line:
+                    last_line = (obj_id, msg)
+                    self._log("  [%d%%] %s", pct, msg)
+                now = time.monotonic_ns()
+                if pct >= 100 or now - last_emit_ns >= PROGRESS_EMIT_INTERVAL_NS:
+                    last_emit_ns = now
+                    self._pending_progress = None
+                    self._signals.progress_update.emit(obj_id, pct, msg)
+                else:
+                    self._pending_progress = (obj_id, pct, msg)
 
             def cancel_check() -> bool:
                 return self._cancel_requested
@@ -509,20 +700,22 @@ class SignBridgeWindow(QMainWindow):
                     code = "SIGN_FAILED"
                     msg = f"PKCS#11 error: {exc}"
 
-            self._signals.log_message.emit(f"[ERROR] {code}: {msg}")
+            self._log("[ERROR] %s: %s", code, msg)
             error_resp = build_request_error(
                 request_id=raw_request.get("requestId"),
                 code=code,
                 message=msg,
                 metadata=raw_request.get("metadata"),
             )
-            self._send_error_callbacks_for_all(raw_request, code, msg)
+            self._send_error_callbacks_for_all(request, code, msg)
             self._signals.signing_complete.emit(error_resp)
         finally:
             if session is not None:
+                forget_session(session)
+                forget_pdf_signers(session)
                 try:
                     session.close()
-                    self._signals.log_message.emit("[SIGN] HSM session closed")
+                    self._log("[SIGN] HSM session closed")
                 except Exception:
                     pass
 
@@ -531,19 +724,24 @@ class SignBridgeWindow(QMainWindow):
     def _on_progress(self, object_id: str, percent: int, message: str) -> None:
         self._progress_bar.setValue(percent)
         self._progress_label.setText(message)
-        if object_id:
-            self._log(f"  [{percent}%] {message}")
+
+    def _flush_progress(self) -> None:
+        """Apply the latest rate-limited progress tick, if there is a new one."""
+        pending = self._pending_progress
+        if pending is not None and pending is not self._applied_progress:
+            self._applied_progress = pending
+            self._on_progress(*pending)
 
     def _on_signing_complete(self, response: dict) -> None:
         self._response_sent = True
-        self._log(f"[DONE] Signing complete: status={response.get('status')}")
+        self._log("[DONE] Signing complete: status=%s", response.get("status"))
 
         # Log individual errors
         for err in response.get("errors", []):
             obj_id = err.get("id", "request")
             code = err.get("code", "UNKNOWN")
             msg = err.get("message", "")
-            self._log(f"[ERROR] [{obj_id}] {code}: {msg}")
+            self._log("[ERROR] [%s] %s: %s", obj_id, code, msg)
 
         # v1.0.3: No stdout response — results are delivered via callbacks
         self._log("[DONE] Results delivered via callbacks (fire-and-forget)")
@@ -564,10 +762,14 @@ class SignBridgeWindow(QMainWindow):
             self._status_label.setText(f"✗ Signing failed — {errors_count} error(s)")
             self._status_label.setStyleSheet("color: #dc2626; font-size: 12px; padding: 4px;")
 
+        # A tick parked by a worker that stopped early must not move the
+        # bar back after this.
+        self._applied_progress = self._pending_progress
         self._progress_bar.setValue(100)
         self._cancel_btn.setEnabled(False)
         self._signing_in_progress = False
         self._current_request = None
+        self._current_parsed = None
         self._update_ui_state()
 
         # Auto-close after delay
@@ -582,6 +784,7 @@ class SignBridgeWindow(QMainWindow):
         self._cancel_btn.setEnabled(False)
         self._signing_in_progress = False
         self._current_request = None
+        self._current_parsed = None
         self._update_ui_state()
         QTimer.singleShot(4000, self.close)
 
@@ -598,21 +801,45 @@ class SignBridgeWindow(QMainWindow):
         has_request = self._current_request is not None
         self._sign_btn.setEnabled(has_token and has_request and not self._signing_in_progress)
 
-    def _log(self, text: str) -> None:
-        """Append a line to the activity log (must be called from main thread)."""
-        from datetime import datetime
-        ts = datetime.now().strftime("%H:%M:%S")
-        self._log_text.append(f"[{ts}] {text}")
-        self._log_text.moveCursor(QTextCursor.MoveOperation.End)
+    def _log(self, text: str, *args: Any) -> None:
+        """Queue a line for the activity log (safe to call from any thread).
 
-    def _append_log(self, text: str) -> None:
-        """Thread-safe log via signal."""
-        self._log(text)
+        Like ``logging``, *args* are %-formatted into *text* lazily — only
+        when the line is actually written to the view.
+        """
+        # Lines are stamped when queued, not when flushed; the formatted
+        # time is reused for every line logged within the same second.
+        now = int(time.time())
+        stamp = self._log_stamp
+        if stamp[0] != now:
+            stamp = self._log_stamp = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        self._log_buffer.append((stamp[1], text, args))
+
+    def _flush_log(self) -> None:
+        """Write all queued log lines to the view in one append (main thread)."""
+        buf = self._log_buffer
+        count = len(buf)
+        if not count:
+            return
+        if self.isMinimized() or not self._log_text.isVisible():
+            # Nobody can see the view — keep the lines for the first tick
+            # after the window is shown again.
+            return
+        # Take only what was queued at entry; lines appended meanwhile by
+        # other threads wait for the next tick.
+        popleft = buf.popleft
+        lines = []
+        for _ in range(count):
+            stamp, text, args = popleft()
+            lines.append(f"[{stamp}] {text % args}" if args else f"[{stamp}] {text}")
+        # One document insert per flush; appendPlainText keeps the view
+        # pinned to the bottom when it already is.
+        self._log_text.appendPlainText("\n".join(lines))
 
     # ── v1.0.3: Callback delivery for request-level errors ─────────────
 
     def _send_error_callbacks_for_all(
-        self, raw_request: dict, code: str, message: str
+        self, request: SignRequest, code: str, message: str
     ) -> None:
         """Send error callbacks for ALL objects in the request.
 
@@ -622,32 +849,41 @@ class SignBridgeWindow(QMainWindow):
         about failures.
 
         Best-effort: individual callback failures are logged but do not
-        propagate.  If the request cannot be parsed (malformed JSON), no
-        callbacks are sent.
+        propagate.  If the objects cannot be resolved, no callbacks are
+        sent.  The POSTs run concurrently; this waits up to
+        ERROR_CALLBACK_WAIT_S for them (so closeEvent still delivers them
+        before the window goes away).
         """
         try:
-            request = parse_request(raw_request)
             resolved = resolve_objects(request)
-            for obj in resolved:
-                try:
-                    send_error_callback(
-                        url=obj.callback_on_error,
-                        object_id=obj.id,
-                        request_id=request.request_id,
-                        error_code=code,
-                        error_message=message,
-                        metadata=request.metadata,
-                        headers=obj.callback_headers,
-                    )
-                    logger.info(
-                        "Error callback sent for %s: %s", obj.id, code
-                    )
-                except Exception as exc:
-                    logger.warning(
-                        "Error callback failed for %s: %s", obj.id, exc
-                    )
+            pending = {
+                _CALLBACK_POOL.submit(
+                    send_error_callback,
+                    url=obj.ctx.callback_on_error,
+                    object_id=obj.id,
+                    request_id=request.request_id,
+                    error_code=code,
+                    error_message=message,
+                    metadata=request.metadata,
+                    headers=obj.ctx.callback_headers,
+                ): obj.id
+                for obj in resolved
+            }
         except Exception as exc:
             logger.warning("Could not send error callbacks: %s", exc)
+            return
+
+        done, not_done = wait(pending, timeout=ERROR_CALLBACK_WAIT_S)
+        for future in done:
+            exc = future.exception()
+            if exc is None:
+                logger.info("Error callback sent for %s: %s", pending[future], code)
+            else:
+                logger.warning("Error callback failed for %s: %s", pending[future], exc)
+        for future in not_done:
+            logger.warning(
+                "Error callback for %s still pending after %ds", pending[future], ERROR_CALLBACK_WAIT_S
+            )
 
     def closeEvent(self, event) -> None:
         """Handle window close with a pending request (v1.0.3).
@@ -655,42 +891,28 @@ class SignBridgeWindow(QMainWindow):
         Sends CANCELLED_BY_USER error callbacks for all objects so the
         caller's backend is notified even though the host is shutting down.
         """
-        if self._current_request is not None and not self._response_sent:
+        if self._current_parsed is not None and not self._response_sent:
             self._log("[USER] Window closed with pending request — sending CANCELLED_BY_USER callbacks")
             self._cancel_requested = True
             self._response_sent = True
             self._send_error_callbacks_for_all(
-                self._current_request,
+                self._current_parsed,
                 "CANCELLED_BY_USER",
                 "User closed the signing application",
             )
         super().closeEvent(event)
 
     def _flash_window(self) -> None:
-        """Flash the window and bring it to front."""
+        """Bring the window to front and flash its taskbar entry."""
         self.activateWindow()
         self.raise_()
         self.setWindowState(
             self.windowState() & ~Qt.WindowState.WindowMinimized
             | Qt.WindowState.WindowActive
         )
-
-        original_title = self.windowTitle()
-        flash_count = 0
-
-        def flash() -> None:
-            nonlocal flash_count
-            if flash_count < 6:
-                if flash_count % 2 == 0:
-                    self.setWindowTitle("★ SIGNING REQUEST RECEIVED ★")
-                else:
-                    self.setWindowTitle(original_title)
-                flash_count += 1
-                QTimer.singleShot(400, flash)
-            else:
-                self.setWindowTitle(original_title)
-
-        flash()
+        # Native attention request (FlashWindowEx on Windows, dock bounce on
+        # macOS, urgency hint on X11) — no timer-driven title toggling.
+        QApplication.alert(self, 2500)
 
 
 # ─── Application entry point ───────────────────────────────────────────────
@@ -7,10 +7,12 @@ IMPORTANT: stdout is reserved exclusively for native messaging.
 """
 
 import json
+import logging
 import struct
 import sys
 from typing import Any
 
+from signbridge.utils.json_codec import json_dumps, json_loads
 from signbridge.utils.logging_setup import get_logger
 
 logger = get_logger("messaging.native_io")
@@ -18,6 +20,29 @@ logger = get_logger("messaging.native_io")
 # Chrome enforces a 1 MB limit on native messaging payloads.
 MAX_MESSAGE_SIZE = 1024 * 1024
 
+# Little-endian uint32 length prefix, compiled once.
+_LEN = struct.Struct("<I")
+
+
+# ─── Blocking reader ────────────────────────────────────────────────────────
+# read_message() has a single caller thread, so every frame is read into the
+# same preallocated buffer and parsed in place — no per-message bytes copy.
+_READ_BUF = bytearray(MAX_MESSAGE_SIZE)
+_READ_VIEW = memoryview(_READ_BUF)
+
+
+def _read_exact(view: memoryview) -> int:
+    """Fill *view* from stdin, retrying short reads; returns bytes read (< len on EOF)."""
+    readinto = sys.stdin.buffer.readinto
+    want = len(view)
+    got = 0
+    while got < want:
+        n = readinto(view[got:])
+        if not n:
+            break
+        got += n
+    return got
+
 
 def read_message() -> dict[str, Any] | None:
     """
@@ -27,12 +52,12 @@ def read_message() -> dict[str, Any] | None:
     """
     try:
         # Read the 4-byte length prefix
-        raw_length = sys.stdin.buffer.read(4)
-        if len(raw_length) < 4:
-            logger.info("stdin closed (read %d bytes of length prefix)", len(raw_length))
+        prefix = _READ_VIEW[:4]
+        got = _read_exact(prefix)
+        if got < 4:
+            logger.info("stdin closed (read %d bytes of length prefix)", got)
             return None
-
-        msg_length = struct.unpack("<I", raw_length)[0]
+        msg_length = _LEN.unpack_from(_READ_BUF)[0]
 
         if msg_length == 0:
             logger.warning("Received zero-length message")
@@ -42,18 +67,20 @@ def read_message() -> dict[str, Any] | None:
             logger.error("Message too large: %d bytes (max %d)", msg_length, MAX_MESSAGE_SIZE)
             return None
 
-        # Read exactly msg_length bytes
-        raw_body = sys.stdin.buffer.read(msg_length)
-        if len(raw_body) < msg_length:
+        # Read exactly msg_length bytes (over the prefix — it's been decoded)
+        raw_body = _READ_VIEW[:msg_length]
+        got = _read_exact(raw_body)
+        if got < msg_length:
             logger.error(
                 "Truncated message: expected %d bytes, got %d",
                 msg_length,
-                len(raw_body),
+                got,
             )
             return None
 
-        message = json.loads(raw_body.decode("utf-8"))
-        logger.debug("← Received message (%d bytes): requestId=%s", msg_length, message.get("requestId", "?"))
+        message = json_loads(raw_body)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("← Received message (%d bytes): requestId=%s", msg_length, message.get("requestId", "?"))
         return message
 
     except json.JSONDecodeError as exc:
@@ -64,6 +91,87 @@ def read_message() -> dict[str, Any] | None:
         return None
 
 
+class FrameDecoder:
+    """
+    Incremental decoder for native-messaging frames.
+
+    For callers that read stdin in whatever chunks are available (e.g. a
+    non-blocking fd driven by the GUI event loop) instead of blocking in
+    :func:`read_message`.  Bytes are buffered until a whole frame is in.
+    """
+
+    __slots__ = ("_buf",)
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes not yet forming a complete frame."""
+        return len(self._buf)
+
+    def feed(self, data: bytes) -> list[dict[str, Any]]:
+        """
+        Add *data* and return every message it completes (possibly none).
+
+        A frame whose body is not valid JSON is logged and skipped — the
+        framing itself is still intact.  A zero or oversized length prefix
+        means the stream can't be resynchronised, so ``ValueError`` is raised.
+        """
+        messages: list[dict[str, Any]] = []
+        for body in self.feed_frames(data):
+            message = decode_frame(body)
+            if message is not None:
+                messages.append(message)
+        return messages
+
+    def feed_frames(self, data: bytes) -> list[bytes]:
+        """
+        Like :meth:`feed`, but return the raw frame bodies undecoded.
+
+        Lets the caller run :func:`decode_frame` elsewhere (e.g. on the
+        same worker that validates the request), keeping only the framing
+        on the reading thread.
+        """
+        buf = self._buf
+        buf += data
+        frames: list[bytes] = []
+        while len(buf) >= 4:
+            msg_length = _LEN.unpack_from(buf)[0]
+            if msg_length == 0:
+                raise ValueError("Received zero-length message")
+            if msg_length > MAX_MESSAGE_SIZE:
+                raise ValueError(
+                    f"Message too large: {msg_length} bytes (max {MAX_MESSAGE_SIZE})"
+                )
+            end = 4 + msg_length
+            if len(buf) < end:
+                break
+            frames.append(bytes(buf[4:end]))
+            del buf[:end]
+        return frames
+
+
+def decode_frame(body: bytes) -> dict[str, Any] | None:
+    """
+    Decode one frame body from :meth:`FrameDecoder.feed_frames`.
+
+    Returns the message dict, or None (logged) if the body is not a JSON
+    object.
+    """
+    try:
+        message = json_loads(body)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        logger.error("Invalid JSON in native message: %s", exc)
+        return None
+    if not isinstance(message, dict):
+        logger.error("Native message is not a JSON object: %s", type(message).__name__)
+        return None
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("← Received message (%d bytes): requestId=%s", len(body), message.get("requestId", "?"))
+    return message
+
+
 def write_message(message: dict[str, Any]) -> bool:
     """
     Write a single native-messaging frame to stdout.
@@ -71,7 +179,7 @@ def write_message(message: dict[str, Any]) -> bool:
     Returns True on success, False on error.
     """
     try:
-        encoded = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        encoded = json_dumps(message)
 
         if len(encoded) > MAX_MESSAGE_SIZE:
             logger.error(
@@ -81,11 +189,14 @@ def write_message(message: dict[str, Any]) -> bool:
             )
             return False
 
-        sys.stdout.buffer.write(struct.pack("<I", len(encoded)))
-        sys.stdout.buffer.write(encoded)
-        sys.stdout.buffer.flush()
+        # Prefix and body go out in one write: one trip through the pipe,
+        # and a concurrent writer can never land between the two halves.
+        out = sys.stdout.buffer
+        out.write(_LEN.pack(len(encoded)) + encoded)
+        out.flush()
 
-        logger.debug("→ Sent message (%d bytes): status=%s", len(encoded), message.get("status", "?"))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("→ Sent message (%d bytes): status=%s", len(encoded), message.get("status", "?"))
         return True
 
     except Exception as exc:
@@ -8,6 +8,7 @@ consumption.  Does NOT resolve object groups — that's object_resolver's job.
 from __future__ import annotations
 
 import dataclasses as dc
+import sys
 from typing import Any
 
 from signbridge.config import (
@@ -20,6 +21,17 @@ from signbridge.utils.logging_setup import get_logger
 
 logger = get_logger("messaging.request_parser")
 
+# Valid content / group modes (Standard §5, §7).  The data-type sets come
+# from config, already frozensets.
+CONTENT_MODES = frozenset({"inline", "remote"})
+
+# Stand-in for an absent per-object sub-object; only ever read, so one
+# instance is shared instead of a fresh {} per object.
+_ABSENT: dict[str, Any] = {}
+
+# Per-object placeholder in objectGroups[] URL templates (Standard §7).
+OBJECT_ID_PLACEHOLDER = "<objectId>"
+
 
 # ─── Error raised on validation failure ─────────────────────────────────────
 
@@ -34,20 +46,20 @@ class RequestValidationError(Exception):
 
 # ─── Typed data structures ──────────────────────────────────────────────────
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class CertSelector:
     cert_id: str
     label: str | None = None
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class ContentInline:
     mode: str  # "inline"
     encoding: str
     content: str
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class ContentRemote:
     mode: str  # "remote"
     download_url: str
@@ -55,18 +67,18 @@ class ContentRemote:
     headers: dict[str, str] = dc.field(default_factory=dict)
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class PdfOptions:
     label: str
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class XmlOptions:
     xpath: str
     id_attribute: str | None = None
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class UploadConfig:
     upload_url: str
     http_method: str = "POST"
@@ -74,15 +86,21 @@ class UploadConfig:
     signed_content_type: str = "string"
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class CallbacksConfig:
     on_success: str
     on_error: str
     progress: str | None = None
     headers: dict[str, str] = dc.field(default_factory=dict)
+    # JSON Content-Type merged with *headers* once, reused by every
+    # callback POST for the objects this config covers.
+    post_headers: dict[str, str] = dc.field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "post_headers", {"Content-Type": "application/json", **self.headers})
 
-@dc.dataclass(frozen=True)
+
+@dc.dataclass(frozen=True, slots=True)
 class SignObject:
     """A single object extracted from the top-level objects[] array."""
     id: str
@@ -94,7 +112,7 @@ class SignObject:
     xml_options: XmlOptions | None = None
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class GroupInlineObject:
     """An object inside an inline objectGroup."""
     id: str
@@ -102,13 +120,13 @@ class GroupInlineObject:
     value: str
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class GroupRemoteObject:
     """An object inside a remote objectGroup (id only)."""
     id: str
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class ObjectGroup:
     """A single group from objectGroups[] (Standard §7)."""
     data_type: str
@@ -120,9 +138,13 @@ class ObjectGroup:
     callbacks: CallbacksConfig
     upload: UploadConfig
     objects: list[GroupInlineObject] | list[GroupRemoteObject]
+    # download_url split around its placeholder, so each object's URL is
+    # prefix + id + suffix.  None unless the placeholder occurs exactly once.
+    download_url_prefix: str | None = dc.field(default=None, repr=False, compare=False)
+    download_url_suffix: str | None = dc.field(default=None, repr=False, compare=False)
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class SignRequest:
     """Fully parsed and validated sign request (Standard §9)."""
     protocol_version: str
@@ -133,6 +155,9 @@ class SignRequest:
     correlation_id: str | None = None
     objects: list[SignObject] | None = None
     object_groups: list[ObjectGroup] | None = None
+    # Number of objects across objects[] or every group, counted at parse
+    # time so the engine knows the total without walking the request.
+    total_object_count: int = dc.field(default=0, repr=False, compare=False)
 
 
 # ─── Parser ─────────────────────────────────────────────────────────────────
@@ -163,7 +188,7 @@ def parse_request(raw: dict[str, Any]) -> SignRequest:
     if not isinstance(cert_raw, dict):
         raise RequestValidationError("BAD_REQUEST", "Missing or invalid cert object")
     cert = CertSelector(
-        cert_id=_require_str(cert_raw, "certId", "cert.certId"),
+        cert_id=_require_str(cert_raw, "certId", "cert"),
         label=cert_raw.get("label"),
     )
 
@@ -184,11 +209,13 @@ def parse_request(raw: dict[str, Any]) -> SignRequest:
         if not isinstance(raw_objs, list) or len(raw_objs) == 0:
             raise RequestValidationError("BAD_REQUEST", "objects must be a non-empty array")
         objects = [_parse_object(o, i) for i, o in enumerate(raw_objs)]
+        total_object_count = len(objects)
     else:
         raw_groups = raw["objectGroups"]
         if not isinstance(raw_groups, list) or len(raw_groups) == 0:
             raise RequestValidationError("BAD_REQUEST", "objectGroups must be a non-empty array")
         object_groups = [_parse_group(g, i) for i, g in enumerate(raw_groups)]
+        total_object_count = sum(len(group.objects) for group in object_groups)
 
     return SignRequest(
         protocol_version=pv,
@@ -199,17 +226,36 @@ def parse_request(raw: dict[str, Any]) -> SignRequest:
         correlation_id=correlation_id,
         objects=objects,
         object_groups=object_groups,
+        total_object_count=total_object_count,
     )
 
 
 # ─── Private helpers ────────────────────────────────────────────────────────
 
-def _require_str(d: dict, key: str, label: str | None = None) -> str:
+def _require_str(d: dict, key: str, where: str | None = None, section: str = "") -> str:
+    """
+    Return ``d[key]`` if it is a non-empty string, else raise BAD_REQUEST.
+
+    The field path in the error is ``{where}{section}.{key}`` (just *key*
+    without *where*) and is only formatted when there is an error, so
+    callers pass the pieces instead of a prebuilt label.
+    """
     val = d.get(key)
-    name = label or key
-    if not isinstance(val, str) or not val:
-        raise RequestValidationError("BAD_REQUEST", f"Missing or empty required field: {name}")
-    return val
+    if type(val) is str and val:  # JSON strings are exact str
+        return val
+    name = f"{where}{section}.{key}" if where is not None else key
+    raise RequestValidationError("BAD_REQUEST", f"Missing or empty required field: {name}")
+
+
+def _intern(val: Any) -> Any:
+    """
+    Intern a str drawn from a small vocabulary (dataType, mode, encoding).
+
+    Thousands of parsed objects then share one string object per value,
+    and later comparisons against the config literals hit the identity
+    fast path.  Non-str values pass through for the caller to reject.
+    """
+    return sys.intern(val) if type(val) is str else val
 
 
 def _parse_content(raw: dict, obj_label: str) -> ContentInline | ContentRemote:
@@ -221,13 +267,13 @@ def _parse_content(raw: dict, obj_label: str) -> ContentInline | ContentRemote:
     if mode == "inline":
         return ContentInline(
             mode="inline",
-            encoding=raw.get("encoding", "utf8"),
-            content=_require_str(raw, "content", f"{obj_label}.content.content"),
+            encoding=_intern(raw.get("encoding", "utf8")),
+            content=_require_str(raw, "content", obj_label, ".content"),
         )
     elif mode == "remote":
         return ContentRemote(
             mode="remote",
-            download_url=_require_str(raw, "downloadUrl", f"{obj_label}.content.downloadUrl"),
+            download_url=_require_str(raw, "downloadUrl", obj_label, ".content"),
             http_method=raw.get("httpMethod", "GET"),
             headers=raw.get("headers") or {},
         )
@@ -239,10 +285,10 @@ def _parse_upload(raw: Any, label: str) -> UploadConfig:
     if not isinstance(raw, dict):
         raise RequestValidationError("BAD_REQUEST", f"{label}: upload must be an object")
     return UploadConfig(
-        upload_url=_require_str(raw, "uploadUrl", f"{label}.upload.uploadUrl"),
+        upload_url=_require_str(raw, "uploadUrl", label, ".upload"),
         http_method=raw.get("httpMethod", "POST"),
         headers=raw.get("headers") or {},
-        signed_content_type=_require_str(raw, "signedContentType", f"{label}.upload.signedContentType"),
+        signed_content_type=_require_str(raw, "signedContentType", label, ".upload"),
     )
 
 
@@ -250,8 +296,8 @@ def _parse_callbacks(raw: Any, label: str) -> CallbacksConfig:
     if not isinstance(raw, dict):
         raise RequestValidationError("BAD_REQUEST", f"{label}: callbacks must be an object")
     return CallbacksConfig(
-        on_success=_require_str(raw, "onSuccess", f"{label}.callbacks.onSuccess"),
-        on_error=_require_str(raw, "onError", f"{label}.callbacks.onError"),
+        on_success=_require_str(raw, "onSuccess", label, ".callbacks"),
+        on_error=_require_str(raw, "onError", label, ".callbacks"),
         progress=raw.get("progress"),
         headers=raw.get("headers") or {},
     )
@@ -260,14 +306,14 @@ def _parse_callbacks(raw: Any, label: str) -> CallbacksConfig:
 def _parse_pdf_options(raw: Any, label: str) -> PdfOptions:
     if not isinstance(raw, dict):
         raise RequestValidationError("BAD_REQUEST", f"{label}: pdfOptions must be an object")
-    return PdfOptions(label=_require_str(raw, "label", f"{label}.pdfOptions.label"))
+    return PdfOptions(label=_require_str(raw, "label", label, ".pdfOptions"))
 
 
 def _parse_xml_options(raw: Any, label: str) -> XmlOptions:
     if not isinstance(raw, dict):
         raise RequestValidationError("BAD_REQUEST", f"{label}: xmlOptions must be an object")
     return XmlOptions(
-        xpath=_require_str(raw, "xpath", f"{label}.xmlOptions.xpath"),
+        xpath=_require_str(raw, "xpath", label, ".xmlOptions"),
         id_attribute=raw.get("idAttribute"),
     )
 
@@ -278,13 +324,13 @@ def _parse_object(raw: Any, idx: int) -> SignObject:
     if not isinstance(raw, dict):
         raise RequestValidationError("BAD_REQUEST", f"{label} must be an object")
 
-    obj_id = _require_str(raw, "id", f"{label}.id")
-    data_type = _require_str(raw, "dataType", f"{label}.dataType")
+    obj_id = _require_str(raw, "id", label)
+    data_type = sys.intern(_require_str(raw, "dataType", label))
 
     if data_type not in SUPPORTED_DATA_TYPES:
         raise RequestValidationError("UNSUPPORTED_TYPE", f"{label}: unsupported dataType '{data_type}'")
 
-    content = _parse_content(raw.get("content", {}), label)
+    content = _parse_content(raw.get("content", _ABSENT), label)
 
     # Enforce remote-only rule for pdf/binary (Standard §4.2)
     if data_type in REMOTE_ONLY_TYPES and isinstance(content, ContentInline):
@@ -326,12 +372,12 @@ def _parse_group(raw: Any, idx: int) -> ObjectGroup:
     if not isinstance(raw, dict):
         raise RequestValidationError("BAD_REQUEST", f"{label} must be an object")
 
-    data_type = _require_str(raw, "dataType", f"{label}.dataType")
+    data_type = sys.intern(_require_str(raw, "dataType", label))
     if data_type not in SUPPORTED_DATA_TYPES:
         raise RequestValidationError("UNSUPPORTED_TYPE", f"{label}: unsupported dataType '{data_type}'")
 
-    mode = _require_str(raw, "mode", f"{label}.mode")
-    if mode not in ("inline", "remote"):
+    mode = sys.intern(_require_str(raw, "mode", label))
+    if mode not in CONTENT_MODES:
         raise RequestValidationError("BAD_REQUEST", f"{label}: mode must be 'inline' or 'remote'")
 
     # Enforce remote-only for pdf/binary
@@ -342,15 +388,22 @@ def _parse_group(raw: Any, idx: int) -> ObjectGroup:
         )
 
     download_url: str | None = None
+    download_url_prefix: str | None = None
+    download_url_suffix: str | None = None
     download_headers: dict[str, str] = {}
 
     if mode == "remote":
-        download_url = _require_str(raw, "downloadUrl", f"{label}.downloadUrl")
-        if "<objectId>" not in download_url:
+        download_url = _require_str(raw, "downloadUrl", label)
+        cut = download_url.find(OBJECT_ID_PLACEHOLDER)
+        if cut < 0:
             raise RequestValidationError(
                 "BAD_REQUEST",
                 f"{label}: downloadUrl must contain <objectId> placeholder",
             )
+        end = cut + len(OBJECT_ID_PLACEHOLDER)
+        if download_url.find(OBJECT_ID_PLACEHOLDER, end) < 0:
+            download_url_prefix = download_url[:cut]
+            download_url_suffix = download_url[end:]
         download_headers = raw.get("downloadHeaders") or {}
 
     callbacks = _parse_callbacks(raw.get("callbacks"), label)
@@ -374,30 +427,40 @@ def _parse_group(raw: Any, idx: int) -> ObjectGroup:
     if not isinstance(raw_objects, list) or len(raw_objects) == 0:
         raise RequestValidationError("BAD_REQUEST", f"{label}: objects must be a non-empty array")
 
+    # Groups can hold hundreds of objects: the per-item loops check fields
+    # inline and only build the "objectGroups[i].objects[j]" label when
+    # there is an error to report.
     objects: list[GroupInlineObject] | list[GroupRemoteObject]
     if mode == "inline":
         inline_objs: list[GroupInlineObject] = []
         for j, ro in enumerate(raw_objects):
-            olabel = f"{label}.objects[{j}]"
             if not isinstance(ro, dict):
-                raise RequestValidationError("BAD_REQUEST", f"{olabel} must be an object")
-            oid = _require_str(ro, "id", f"{olabel}.id")
+                raise RequestValidationError("BAD_REQUEST", f"{label}.objects[{j}] must be an object")
+            oid = ro.get("id")
+            if type(oid) is not str or not oid:
+                _require_str(ro, "id", f"{label}.objects[{j}]")  # raises
             c = ro.get("content")
             if not isinstance(c, dict):
-                raise RequestValidationError("BAD_REQUEST", f"{olabel}: content is required for inline mode")
+                raise RequestValidationError(
+                    "BAD_REQUEST", f"{label}.objects[{j}]: content is required for inline mode"
+                )
+            value = c.get("value")
+            if type(value) is not str or not value:
+                _require_str(c, "value", f"{label}.objects[{j}]", ".content")  # raises
             inline_objs.append(GroupInlineObject(
                 id=oid,
-                encoding=c.get("encoding", "utf8"),
-                value=_require_str(c, "value", f"{olabel}.content.value"),
+                encoding=_intern(c.get("encoding", "utf8")),
+                value=value,
             ))
         objects = inline_objs
     else:
         remote_objs: list[GroupRemoteObject] = []
         for j, ro in enumerate(raw_objects):
-            olabel = f"{label}.objects[{j}]"
             if not isinstance(ro, dict):
-                raise RequestValidationError("BAD_REQUEST", f"{olabel} must be an object")
-            oid = _require_str(ro, "id", f"{olabel}.id")
+                raise RequestValidationError("BAD_REQUEST", f"{label}.objects[{j}] must be an object")
+            oid = ro.get("id")
+            if type(oid) is not str or not oid:
+                _require_str(ro, "id", f"{label}.objects[{j}]")  # raises
             remote_objs.append(GroupRemoteObject(id=oid))
         objects = remote_objs
 
@@ -411,4 +474,6 @@ def _parse_group(raw: Any, idx: int) -> ObjectGroup:
         callbacks=callbacks,
         upload=upload,
         objects=objects,
+        download_url_prefix=download_url_prefix,
+        download_url_suffix=download_url_suffix,
     )
@@ -83,7 +83,7 @@ class ResponseBuilder:
         self.metadata = metadata
         self.results: list[ObjectResult] = []
         self.errors: list[ObjectError] = []
-        self._start_ms = time.monotonic()
+        self._start_ns = time.monotonic_ns()
 
     # ── Accumulation ────────────────────────────────────────────────────
 
@@ -97,7 +97,7 @@ class ResponseBuilder:
 
     def build(self) -> dict[str, Any]:
         """Build the final response dict (Standard §10.1)."""
-        elapsed_ms = int((time.monotonic() - self._start_ms) * 1000)
+        elapsed_ms = (time.monotonic_ns() - self._start_ns) // 1_000_000
 
         # Determine overall status (Standard §10.3)
         if len(self.errors) == 0:
@@ -3,20 +3,43 @@ Callback dispatcher — POSTs JSON payloads to callback endpoints.
 
 Standard §8.4–8.6: The native host POSTs status updates to
 onSuccess, onError, and progress endpoints.
+
+The ``headers`` argument of each sender is the complete set of request
+headers (normally ``CallbacksConfig.post_headers``, which already carries
+the JSON Content-Type); it is passed through without copying.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any
+import logging
+import time
+from typing import Any, Mapping
+
+from urllib3.util import Retry
 
 import requests
 
 from signbridge.config import HTTP_TIMEOUT_CALLBACK
+from signbridge.network.reliability import CircuitOpenError, HostGuards
+from signbridge.network.session import make_session
+from signbridge.utils.json_codec import json_dumps
 from signbridge.utils.logging_setup import get_logger
 
 logger = get_logger("network.callbacks")
 
+# One keep-alive session for every callback POST: a request's progress,
+# success and error callbacks usually hit the same few endpoints.  Sized for
+# the parallel error-callback fan-out.  Retries only cover failed connects
+# (urllib3 never re-sends a POST after it went out).
+_SESSION = make_session(32, Retry(total=2, backoff_factor=0.1))
+
+# Headers used when a caller passes none.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Circuit breaker + bulkhead per callback host (separate from the upload
+# stage's): a dead endpoint costs each later callback nothing, not a timeout.
+_GUARDS = HostGuards()
+
 
 class CallbackError(Exception):
     """Raised when a callback POST fails."""
@@ -27,9 +50,58 @@ class CallbackError(Exception):
         self.message = message
 
 
+# (epoch second, formatted timestamp) of the last _now_iso() call — one
+# tuple so concurrent callers always see a matching pair.
+_last_iso: tuple[int, str] = (0, "")
+
+
 def _now_iso() -> str:
     """Current UTC timestamp in ISO 8601 format."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    global _last_iso
+    # Second precision: the formatted string is reused within the second.
+    now = int(time.time())
+    cached = _last_iso
+    if cached[0] != now:
+        cached = _last_iso = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return cached[1]
+
+
+def _post(url: str, body: bytes, headers: Mapping[str, str] | None) -> requests.Response:
+    """
+    POST *body* through the shared session, behind the host's circuit
+    breaker and bulkhead.  Raises CircuitOpenError while the host's circuit
+    is open; connection failures and 5xx responses count against it.
+    """
+    host, breaker, bulkhead = _GUARDS.for_url(url)
+    if not breaker.allow():
+        raise CircuitOpenError(host)
+    with bulkhead:
+        try:
+            resp = _SESSION.post(
+                url,
+                data=body,
+                headers=headers or _JSON_HEADERS,
+                timeout=HTTP_TIMEOUT_CALLBACK,
+            )
+        except Exception:
+            breaker.record_failure()
+            raise
+    if resp.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return resp
+
+
+def progress_body_prefix(request_id: str, metadata: dict[str, Any]) -> bytes:
+    """
+    Serialise the request-wide part of every progress payload, once.
+
+    Returns ``{"requestId":…,"metadata":…`` without the closing brace, for
+    :func:`send_progress`'s *body_prefix*; the metadata object can be
+    large and is otherwise re-encoded on each of an object's updates.
+    """
+    return json_dumps({"requestId": request_id, "metadata": metadata})[:-1]
 
 
 def send_progress(
@@ -40,7 +112,8 @@ def send_progress(
     percent_complete: int,
     message: str,
     metadata: dict[str, Any],
-    headers: dict[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
+    body_prefix: bytes | None = None,
 ) -> None:
     """
     POST a progress callback (Standard §8.5 — Progress).
@@ -48,25 +121,33 @@ def send_progress(
     Raises CallbackError if the endpoint returns non-2xx.
     Per Standard §8.6: if progress returns non-2xx, the native host
     cancels signing for that object.
+
+    *body_prefix*, from :func:`progress_body_prefix` for the same
+    request_id and metadata, lets only the per-update fields be encoded.
     """
-    payload = {
-        "objectId": object_id,
-        "requestId": request_id,
-        "status": status,
-        "percentComplete": percent_complete,
-        "message": message,
-        "metadata": metadata,
-    }
+    if body_prefix is not None:
+        body = b"".join((
+            body_prefix,
+            b',"objectId":', json_dumps(object_id),
+            b',"status":', json_dumps(status),
+            b',"percentComplete":%d' % percent_complete,
+            b',"message":', json_dumps(message),
+            b"}",
+        ))
+    else:
+        body = json_dumps({
+            "objectId": object_id,
+            "requestId": request_id,
+            "status": status,
+            "percentComplete": percent_complete,
+            "message": message,
+            "metadata": metadata,
+        })
 
     logger.debug("→ Progress callback: %s %d%% — %s", object_id, percent_complete, message)
 
     try:
-        resp = requests.post(
-            url,
-            json=payload,
-            headers={"Content-Type": "application/json", **(headers or {})},
-            timeout=HTTP_TIMEOUT_CALLBACK,
-        )
+        resp = _post(url, body, headers)
         if resp.status_code < 200 or resp.status_code >= 300:
             raise CallbackError(
                 "PROGRESS_ENDPOINT_FAILED",
@@ -85,7 +166,7 @@ def send_success(
     upload_status_code: int,
     upload_response_body: str,
     metadata: dict[str, Any],
-    headers: dict[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
 ) -> str:
     """
     POST a success callback (Standard §8.5 — Success).
@@ -108,13 +189,9 @@ def send_success(
     logger.info("→ Success callback: %s", object_id)
 
     try:
-        resp = requests.post(
-            url,
-            json=payload,
-            headers={"Content-Type": "application/json", **(headers or {})},
-            timeout=HTTP_TIMEOUT_CALLBACK,
-        )
-        if resp.status_code < 200 or resp.status_code >= 300:
+        resp = _post(url, json_dumps(payload), headers)
+        if (resp.status_code < 200 or resp.status_code >= 300) and logger.isEnabledFor(logging.WARNING):
+            # resp.text decodes the whole body — only when it will be logged.
             logger.warning(
                 "Success callback returned HTTP %d (non-fatal): %s",
                 resp.status_code,
@@ -133,7 +210,7 @@ def send_error(
     error_code: str,
     error_message: str,
     metadata: dict[str, Any],
-    headers: dict[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
 ) -> str:
     """
     POST an error callback (Standard §8.5 — Error).
@@ -156,13 +233,8 @@ def send_error(
     logger.info("→ Error callback: %s — %s: %s", object_id, error_code, error_message)
 
     try:
-        resp = requests.post(
-            url,
-            json=payload,
-            headers={"Content-Type": "application/json", **(headers or {})},
-            timeout=HTTP_TIMEOUT_CALLBACK,
-        )
-        if resp.status_code < 200 or resp.status_code >= 300:
+        resp = _post(url, json_dumps(payload), headers)
+        if (resp.status_code < 200 or resp.status_code >= 300) and logger.isEnabledFor(logging.WARNING):
             logger.warning(
                 "Error callback returned HTTP %d (non-fatal): %s",
                 resp.status_code,
@@ -7,13 +7,32 @@ Standard §5.4: The downloadUrl endpoint MUST return raw bytes directly
 
 from __future__ import annotations
 
-import requests
+import logging
+import tempfile
+from typing import IO, Callable, Mapping, TypeVar
 
-from signbridge.config import HTTP_TIMEOUT_DOWNLOAD
+import requests
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util import Retry
+
+from signbridge.config import (
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_SPOOL_SIZE,
+    HTTP_TIMEOUT_DOWNLOAD,
+    MAX_DOWNLOAD_SIZE,
+)
+from signbridge.network.session import make_session
 from signbridge.utils.logging_setup import get_logger
 
 logger = get_logger("network.downloader")
 
+# Keep-alive session for downloadUrl fetches — remote objects and groups
+# typically come from one host.  Its own session so the download timeout
+# and retry profile stay independent of the callbacks'.
+_SESSION = make_session(32, Retry(total=2, backoff_factor=0.1))
+
+_Body = TypeVar("_Body")
+
 
 class DownloadError(Exception):
     """Raised when a content download fails."""
@@ -27,18 +46,24 @@ class DownloadError(Exception):
 def download_content(
     url: str,
     method: str = "GET",
-    headers: dict[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
     timeout: int = HTTP_TIMEOUT_DOWNLOAD,
-) -> bytes:
+) -> memoryview:
     """
     Download raw content from a URL.
 
+    The body is streamed into a single buffer — preallocated from
+    Content-Length when the server sends one — instead of being assembled
+    by ``resp.content``, so a large PDF is held in memory only once.  The
+    buffer is returned as a view, which the signers (and hashlib) read in
+    place.
+
     Parameters
     ----------
     url : str
         The download URL (must be HTTPS in production).
     method : str
-        HTTP method (default GET).
+        HTTP method, upper-case (default GET).
     headers : dict | None
         Authentication / custom headers.
     timeout : int
@@ -46,52 +71,145 @@ def download_content(
 
     Returns
     -------
-    bytes
+    memoryview
         The raw response body.
 
     Raises
     ------
     DownloadError
-        On any failure (network, HTTP status, timeout).
+        On any failure (network, HTTP status, timeout, body larger than
+        MAX_DOWNLOAD_SIZE).
+    """
+    return _fetch(url, method, headers, timeout, _read_body)
+
+
+def download_to_file(
+    url: str,
+    method: str = "GET",
+    headers: Mapping[str, str] | None = None,
+    timeout: int = HTTP_TIMEOUT_DOWNLOAD,
+) -> IO[bytes]:
     """
-    logger.info("Downloading content: %s %s", method, _redact_url(url))
+    Download raw content into a spooled temporary file.
+
+    For consumers that read the payload in blocks (e.g. hash-then-sign):
+    the body stays in memory up to DOWNLOAD_SPOOL_SIZE and spills to disk
+    beyond it, so a large download never needs a buffer of its own size.
+    Same parameters and errors as :func:`download_content`.
+
+    Returns
+    -------
+    binary file object
+        Positioned at the start of the body; the caller closes it.
+    """
+    return _fetch(url, method, headers, timeout, _spool_body)
+
+
+def _fetch(
+    url: str,
+    method: str,
+    headers: Mapping[str, str] | None,
+    timeout: int,
+    read: Callable[[requests.Response], tuple[_Body, int]],
+) -> _Body:
+    """Issue the download and hand the streaming response to *read* (→ body, size)."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Downloading content: %s %s", method, _redact_url(url))
 
     try:
-        resp = requests.request(
-            method=method.upper(),
+        with _SESSION.request(
+            method=method,
             url=url,
             headers=headers or {},
             timeout=timeout,
-            stream=False,
-        )
-
-        if resp.status_code < 200 or resp.status_code >= 300:
-            raise DownloadError(
-                "DOWNLOAD_FAILED",
-                f"HTTP {resp.status_code} from downloadUrl: {resp.text[:200]}",
+            stream=True,
+        ) as resp:
+            if resp.status_code < 200 or resp.status_code >= 300:
+                raise DownloadError(
+                    "DOWNLOAD_FAILED",
+                    f"HTTP {resp.status_code} from downloadUrl: {resp.text[:200]}",
+                )
+            body, size = read(resp)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Download complete: %d bytes, Content-Type=%s",
+                size,
+                resp.headers.get("Content-Type", "unknown"),
             )
-
-        content_length = len(resp.content)
-        content_type = resp.headers.get("Content-Type", "unknown")
-        logger.info(
-            "Download complete: %d bytes, Content-Type=%s",
-            content_length,
-            content_type,
-        )
-        return resp.content
+        return body
 
     except DownloadError:
         raise
     except requests.Timeout:
         raise DownloadError("TIMEOUT", f"Download timed out after {timeout}s: {_redact_url(url)}")
     except requests.ConnectionError as exc:
+        # requests reports a read timeout while streaming the body as a
+        # ConnectionError wrapping urllib3's ReadTimeoutError.
+        if exc.args and isinstance(exc.args[0], ReadTimeoutError):
+            raise DownloadError("TIMEOUT", f"Download timed out after {timeout}s: {_redact_url(url)}")
         raise DownloadError("DOWNLOAD_FAILED", f"Connection error: {exc}")
     except Exception as exc:
         raise DownloadError("DOWNLOAD_FAILED", f"Download failed: {exc}")
 
 
+def _declared_size(resp: requests.Response) -> int:
+    """Content-Length of *resp* (-1 if absent), rejecting bodies over MAX_DOWNLOAD_SIZE."""
+    # Content-Length is only the decoded size when no Content-Encoding
+    # applies; otherwise it is just a starting capacity.
+    try:
+        expected = int(resp.headers.get("Content-Length", ""))
+    except ValueError:
+        expected = -1
+    if expected > MAX_DOWNLOAD_SIZE:
+        raise DownloadError(
+            "DOWNLOAD_FAILED",
+            f"downloadUrl body too large: {expected} bytes (max {MAX_DOWNLOAD_SIZE})",
+        )
+    return expected
+
+
+def _too_large() -> DownloadError:
+    return DownloadError("DOWNLOAD_FAILED", f"downloadUrl body exceeds {MAX_DOWNLOAD_SIZE} bytes")
+
+
+def _read_body(resp: requests.Response) -> tuple[memoryview, int]:
+    """Stream *resp*'s body into one bytearray, enforcing MAX_DOWNLOAD_SIZE."""
+    expected = _declared_size(resp)
+
+    buf = bytearray(max(expected, 0))
+    off = 0
+    for chunk in resp.iter_content(DOWNLOAD_CHUNK_SIZE):
+        end = off + len(chunk)
+        if end > MAX_DOWNLOAD_SIZE:
+            raise _too_large()
+        # In place while within the preallocation; grows the buffer past it.
+        buf[off:end] = chunk
+        off = end
+    # A view over the filled part rather than trimming the spare capacity,
+    # which would resize (and may copy) the buffer.
+    return memoryview(buf)[:off], off
+
+
+def _spool_body(resp: requests.Response) -> tuple[IO[bytes], int]:
+    """Stream *resp*'s body into a SpooledTemporaryFile, enforcing MAX_DOWNLOAD_SIZE."""
+    _declared_size(resp)
+    spool = tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_SIZE)
+    try:
+        size = 0
+        for chunk in resp.iter_content(DOWNLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_DOWNLOAD_SIZE:
+                raise _too_large()
+            spool.write(chunk)
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+    return spool, size
+
+
 def _redact_url(url: str) -> str:
     """Redact query parameters for safe logging (may contain tokens)."""
-    if "?" in url:
-        return url.split("?")[0] + "?..."
-    return url
+    idx = url.find("?")
+    return url if idx < 0 else url[:idx] + "?..."
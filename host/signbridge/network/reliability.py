@@ -0,0 +1,136 @@
+"""
+Per-host circuit breakers and bulkheads for the upload and callback stages.
+
+A request can fan out to hundreds of objects that all upload to (and call
+back) the same host.  When that host is down, every object would otherwise
+spend its full timeout and retry budget before failing.  A
+:class:`CircuitBreaker` trips after consecutive transient failures and makes
+further calls fail immediately until a cooldown has passed; a
+:class:`Bulkhead` caps the calls in flight to one host so a slow endpoint
+cannot tie up every worker connection.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+from signbridge.config import CIRCUIT_COOLDOWN, CIRCUIT_FAILURE_THRESHOLD, HOST_MAX_CONCURRENT
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit is open."""
+
+    def __init__(self, host: str) -> None:
+        super().__init__(f"{host} unavailable (circuit open after repeated failures)")
+        self.host = host
+
+
+# ─── Circuit breaker ────────────────────────────────────────────────────────
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    CLOSED: calls pass; *failure_threshold* failures in a row open it.
+    OPEN: calls are refused until *cooldown* seconds have passed.
+    HALF_OPEN: one trial call passes; its outcome closes or re-opens it.
+
+    Callers check :meth:`allow` before a call and must then report its
+    outcome with :meth:`record_success` or :meth:`record_failure`.
+    """
+
+    __slots__ = ("_threshold", "_cooldown", "_lock", "state", "_failures", "_opened_at")
+
+    def __init__(self, failure_threshold: int, cooldown: float) -> None:
+        self._threshold = failure_threshold
+        self._cooldown = cooldown
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Return True if a call may go ahead now."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self._cooldown:
+                self.state = HALF_OPEN  # this caller makes the trial call
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == HALF_OPEN or self._failures >= self._threshold:
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+
+# ─── Bulkhead ───────────────────────────────────────────────────────────────
+
+class Bulkhead:
+    """Context manager bounding the number of concurrent calls (blocks when full)."""
+
+    __slots__ = ("_slots",)
+
+    def __init__(self, max_concurrent: int) -> None:
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+
+    def __enter__(self) -> Bulkhead:
+        self._slots.acquire()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._slots.release()
+
+
+# ─── Per-host registry ──────────────────────────────────────────────────────
+
+class HostGuards:
+    """
+    Lazily-created (CircuitBreaker, Bulkhead) pair per URL host.
+
+    Each network stage keeps its own registry, so a failing upload endpoint
+    does not trip the callbacks to the same host (or vice versa).
+    """
+
+    __slots__ = ("_threshold", "_cooldown", "_max_concurrent", "_lock", "_guards")
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN,
+        max_concurrent: int = HOST_MAX_CONCURRENT,
+    ) -> None:
+        self._threshold = failure_threshold
+        self._cooldown = cooldown
+        self._max_concurrent = max_concurrent
+        self._lock = threading.Lock()
+        self._guards: dict[str, tuple[CircuitBreaker, Bulkhead]] = {}
+
+    def for_url(self, url: str) -> tuple[str, CircuitBreaker, Bulkhead]:
+        """Return ``(host, breaker, bulkhead)`` for *url*'s host."""
+        host = urlsplit(url).netloc
+        guards = self._guards.get(host)
+        if guards is None:
+            with self._lock:
+                guards = self._guards.get(host)
+                if guards is None:
+                    guards = self._guards[host] = (
+                        CircuitBreaker(self._threshold, self._cooldown),
+                        Bulkhead(self._max_concurrent),
+                    )
+        return host, guards[0], guards[1]
@@ -0,0 +1,33 @@
+"""
+Pooled HTTP sessions for the network stages.
+
+Each stage (download, upload, callbacks) keeps one module-level
+requests.Session so TCP and TLS setup is paid once per host rather than once
+per call.  requests.Session is safe to share for plain requests like these
+(urllib3's connection pool is thread-safe).
+"""
+
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+
+def make_session(pool_size: int, retries: Retry | int = 0) -> requests.Session:
+    """
+    Create a keep-alive session with *pool_size* connections per host.
+
+    Parameters
+    ----------
+    pool_size : int
+        Connection pools kept (one per host) and connections kept per pool;
+        should be at least the number of threads sharing the session.
+    retries : Retry | int
+        urllib3 retry policy mounted on both schemes (default: none).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -7,15 +7,69 @@ Content-Type is determined by signedContentType.
 
 from __future__ import annotations
 
-from typing import Any
+import logging
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import IO, Any, Mapping
 
 import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
 
-from signbridge.config import HTTP_TIMEOUT_UPLOAD, SIGNED_CONTENT_TYPE_MAP
+from signbridge.config import (
+    HTTP_TIMEOUT_UPLOAD,
+    SIGNED_CONTENT_TYPE_MAP,
+    UPLOAD_BACKOFF_BASE,
+    UPLOAD_BACKOFF_CAP,
+    UPLOAD_MAX_RETRIES,
+)
+from signbridge.network.reliability import CircuitOpenError, HostGuards
+from signbridge.network.session import make_session
 from signbridge.utils.logging_setup import get_logger
 
 logger = get_logger("network.uploader")
 
+# Keep-alive session for uploadUrl requests, sized above ENGINE_MAX_WORKERS
+# so concurrent objects never wait for a connection.  No urllib3 retries: an
+# upload is not idempotent, so _request_with_retries only resends when the
+# request never reached the server (connect failure) or the server answered
+# with a status in _RETRY_STATUSES.
+_SESSION = make_session(16)
+
+# Statuses worth another attempt (timeouts, rate limiting, gateway and
+# overload errors).  Anything else — notably 4xx auth/validation — is final.
+_RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class _WithDefault(dict):
+    """dict whose missing keys read as *default* (without being stored)."""
+
+    __slots__ = ("default",)
+
+    def __init__(self, default: Any, items: dict) -> None:
+        super().__init__(items)
+        self.default = default
+
+    def __missing__(self, key: str) -> Any:
+        return self.default
+
+
+# signedContentType → ready-made {"Content-Type": …} header dict, shared by
+# every upload with no caller headers (requests copies, never mutates, it).
+# Unknown types fall back to application/octet-stream.
+_CONTENT_TYPE_HEADERS = _WithDefault(
+    {"Content-Type": "application/octet-stream"},
+    {key: {"Content-Type": ct} for key, ct in SIGNED_CONTENT_TYPE_MAP.items()},
+)
+
+# Most of the endpoint's response body kept in UploadResult (Standard §8.5).
+_RESPONSE_BODY_LIMIT = 4096
+
+# Circuit breaker + bulkhead per upload host: once a host keeps failing,
+# the remaining objects fail fast instead of each waiting out its retries.
+_GUARDS = HostGuards()
+
 
 class UploadError(Exception):
     """Raised when an upload fails."""
@@ -38,25 +92,35 @@ class UploadResult:
 
 def upload_signed_content(
     url: str,
-    data: bytes,
+    data: bytes | IO[bytes],
     signed_content_type: str,
     method: str = "POST",
-    headers: dict[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
     timeout: int = HTTP_TIMEOUT_UPLOAD,
 ) -> UploadResult:
     """
     Upload signed content as raw bytes to the upload endpoint.
 
+    A binary file object (e.g. a spooled temporary file) is streamed from
+    its current position in blocks rather than read into memory first;
+    Content-Length is still sent, taken from the file's size.
+
+    Failures to connect and the statuses in ``_RETRY_STATUSES`` are
+    retried up to UPLOAD_MAX_RETRIES times with jittered exponential
+    backoff (or the server's Retry-After), both capped at UPLOAD_BACKOFF_CAP.
+    After CIRCUIT_FAILURE_THRESHOLD such failures in a row, uploads to the
+    same host fail immediately until CIRCUIT_COOLDOWN has passed.
+
     Parameters
     ----------
     url : str
         The upload URL (with <objectId> already substituted).
-    data : bytes
+    data : bytes | binary file object
         The raw signed content.
     signed_content_type : str
         One of: string, pdf, xml, binary → determines Content-Type header.
     method : str
-        HTTP method (default POST).
+        HTTP method, upper-case (default POST).
     headers : dict | None
         Authentication / custom headers.
     timeout : int
@@ -72,38 +136,33 @@ def upload_signed_content(
     UploadError
         On any failure.
     """
-    content_type = SIGNED_CONTENT_TYPE_MAP.get(signed_content_type, "application/octet-stream")
-
-    # Merge caller headers with Content-Type
-    req_headers = dict(headers or {})
-    req_headers["Content-Type"] = content_type
+    ct_header = _CONTENT_TYPE_HEADERS[signed_content_type]
+    content_type = ct_header["Content-Type"]
 
-    logger.info(
-        "Uploading signed content: %s %s (%d bytes, %s)",
-        method,
-        _redact_url(url),
-        len(data),
-        content_type,
-    )
+    # Merge caller headers with Content-Type (the shared dict when there are none)
+    req_headers = {**headers, **ct_header} if headers else ct_header
+    redacted = _redact_url(url)
 
-    try:
-        resp = requests.request(
-            method=method.upper(),
-            url=url,
-            headers=req_headers,
-            data=data,
-            timeout=timeout,
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Uploading signed content: %s %s (%d bytes, %s)",
+            method,
+            redacted,
+            _payload_size(data),
+            content_type,
         )
 
-        result = UploadResult(
-            status_code=resp.status_code,
-            response_body=resp.text[:4096],  # cap response body size
-        )
+    try:
+        with _guarded_request(method, url, req_headers, data, timeout) as resp:
+            result = UploadResult(
+                status_code=resp.status_code,
+                response_body=_read_head(resp, _RESPONSE_BODY_LIMIT),
+            )
 
         if resp.status_code < 200 or resp.status_code >= 300:
             raise UploadError(
                 "UPLOAD_FAILED",
-                f"Upload returned HTTP {resp.status_code}: {resp.text[:200]}",
+                f"Upload returned HTTP {resp.status_code}: {result.response_body[:200]}",
             )
 
         logger.info("Upload complete: HTTP %d", resp.status_code)
@@ -111,14 +170,140 @@ def upload_signed_content(
 
     except UploadError:
         raise
+    except CircuitOpenError as exc:
+        raise UploadError("UPLOAD_FAILED", f"Upload endpoint {exc}")
     except requests.Timeout:
-        raise UploadError("TIMEOUT", f"Upload timed out after {timeout}s: {_redact_url(url)}")
+        raise UploadError("TIMEOUT", f"Upload timed out after {timeout}s: {redacted}")
     except requests.ConnectionError as exc:
         raise UploadError("UPLOAD_FAILED", f"Connection error: {exc}")
     except Exception as exc:
         raise UploadError("UPLOAD_FAILED", f"Upload failed: {exc}")
 
 
+def _guarded_request(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    data: bytes | IO[bytes],
+    timeout: int,
+) -> requests.Response:
+    """:func:`_request_with_retries` behind the host's circuit breaker and bulkhead."""
+    host, breaker, bulkhead = _GUARDS.for_url(url)
+    if not breaker.allow():
+        raise CircuitOpenError(host)
+    with bulkhead:
+        try:
+            resp = _request_with_retries(method, url, headers, data, timeout)
+        except Exception:
+            breaker.record_failure()
+            raise
+    if resp.status_code in _RETRY_STATUSES:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return resp
+
+
+def _request_with_retries(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    data: bytes | IO[bytes],
+    timeout: int,
+) -> requests.Response:
+    """
+    Send the upload, retrying transient failures.
+
+    Returns the last response (which may still be a retriable status once
+    the attempts run out) or re-raises the last Timeout / ConnectionError.
+    Only errors raised before the request went out are retried: after a
+    read timeout or a dropped connection the server may already have
+    stored the upload.
+    """
+    start = None if isinstance(data, bytes) else data.tell()
+    attempt = 0
+    while True:
+        try:
+            resp = _SESSION.request(
+                method=method,
+                url=url,
+                headers=headers,
+                data=data,
+                timeout=timeout,
+                stream=True,  # body read (bounded) by the caller
+            )
+        except (requests.Timeout, requests.ConnectionError) as exc:
+            if attempt >= UPLOAD_MAX_RETRIES or not _not_sent(exc):
+                raise
+            delay = _backoff(attempt)
+            # The exception text can echo the full URL — log only its type.
+            logger.warning(
+                "Upload attempt %d failed (%s); retrying in %.1fs",
+                attempt + 1, type(exc).__name__, delay,
+            )
+        else:
+            if resp.status_code not in _RETRY_STATUSES or attempt >= UPLOAD_MAX_RETRIES:
+                return resp
+            delay = _retry_after(resp)
+            if delay is None:
+                delay = _backoff(attempt)
+            logger.warning(
+                "Upload attempt %d returned HTTP %d; retrying in %.1fs",
+                attempt + 1, resp.status_code, delay,
+            )
+            resp.close()
+
+        time.sleep(delay)
+        if start is not None:
+            data.seek(start)  # type: ignore[union-attr]
+        attempt += 1
+
+
+def _not_sent(exc: requests.RequestException) -> bool:
+    """True if *exc* means no connection was made, so nothing was sent."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    # requests wraps a refused/unresolvable connection as a ConnectionError
+    # around urllib3's MaxRetryError(reason=NewConnectionError).
+    cause = exc.args[0] if exc.args else None
+    return isinstance(cause, MaxRetryError) and isinstance(cause.reason, NewConnectionError)
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff for retry *attempt* (0-based), capped, ±50% jitter."""
+    return min(UPLOAD_BACKOFF_CAP, UPLOAD_BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def _retry_after(resp: requests.Response) -> float | None:
+    """Seconds from a Retry-After header (delta or HTTP-date), capped; None if absent/invalid."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), UPLOAD_BACKOFF_CAP)
+
+
+def _read_head(resp: requests.Response, limit: int) -> str:
+    """
+    Decode at most *limit* bytes of *resp*'s streamed body.
+
+    Unlike ``resp.text[:limit]`` the rest of a large body is never read
+    into memory or run through charset detection.
+    """
+    head = bytearray()
+    for chunk in resp.iter_content(limit):
+        head += chunk
+        if len(head) >= limit:
+            break
+    return head[:limit].decode(resp.encoding or "utf-8", errors="replace")
+
+
 def substitute_object_id(url_template: str, object_id: str) -> str:
     """
     Replace the <objectId> placeholder in a URL template.
@@ -129,7 +314,17 @@ def substitute_object_id(url_template: str, object_id: str) -> str:
     return url_template.replace("<objectId>", object_id)
 
 
+def _payload_size(data: bytes | IO[bytes]) -> int:
+    """Bytes left to send from *data* (the rest of the file for file objects)."""
+    if isinstance(data, bytes):
+        return len(data)
+    pos = data.tell()
+    end = data.seek(0, os.SEEK_END)
+    data.seek(pos)
+    return end - pos
+
+
 def _redact_url(url: str) -> str:
-    if "?" in url:
-        return url.split("?")[0] + "?..."
-    return url
+    """Redact query parameters for safe logging (may contain tokens)."""
+    head, sep, _ = url.partition("?")
+    return head + "?..." if sep else url
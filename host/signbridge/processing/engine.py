@@ -2,7 +2,9 @@
 Processing engine — the main orchestration loop.
 
 For each resolved object:  download → sign → upload → callback.
-Accumulates results/errors and builds the final response.
+Objects are processed concurrently on a small thread pool; only the
+signing step is serialised, since a PKCS#11 session is not thread-safe.
+Accumulates results/errors (in request order) and builds the final response.
 
 This module is GUI-agnostic. The GUI subscribes to progress via a
 callback function.
@@ -10,10 +12,15 @@ callback function.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+import itertools
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import IO, Any, Callable, Mapping, Optional
 
 import pkcs11
 
+from signbridge.config import ENGINE_MAX_WORKERS
 from signbridge.messaging.request_parser import SignRequest
 from signbridge.messaging.response_builder import (
     ResponseBuilder,
@@ -21,15 +28,16 @@ from signbridge.messaging.response_builder import (
     ObjectError,
 )
 from signbridge.processing.object_resolver import ResolvedObject, resolve_objects
-from signbridge.network.downloader import download_content, DownloadError
+from signbridge.network.downloader import download_content, download_to_file, DownloadError
 from signbridge.network.uploader import upload_signed_content, UploadResult, UploadError
 from signbridge.network.callbacks import (
+    progress_body_prefix,
     send_progress,
     send_success,
     send_error as send_error_callback,
     CallbackError,
 )
-from signbridge.crypto.signer import sign_content, SigningError
+from signbridge.crypto.signer import sign_binary_stream, sign_content, SigningError
 from signbridge.crypto.certificate import CertificateInfo
 from signbridge.utils.logging_setup import get_logger
 
@@ -39,6 +47,29 @@ logger = get_logger("processing.engine")
 # Called as: progress_fn(object_id, percent, message)
 ProgressCallback = Callable[[str, int, str], None]
 
+# Per-object reporter handed to the workers: report(object_id, message).
+# The percentage is filled in from the number of finished objects.
+_Reporter = Callable[[str, str], None]
+
+# Per-object error callbacks are fire-and-forget (nothing reads their
+# outcome), so they are posted in the background while the next object is
+# processed; process_request waits for its own before building the response.
+_ERROR_CALLBACK_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="error-cb")
+
+# Progress callbacks are fire-and-forget too (a failed one is only logged).
+# Each object's posts are chained so they arrive in order, and its final
+# success/error callback goes out only after its last progress post.
+_PROGRESS_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="progress-cb")
+
+# (url, method, headers) identifying one download; headers as a frozenset
+# of items (None when there are none) so the key is hashable.
+_DownloadKey = tuple[str, str, Optional[frozenset]]
+
+# dataTypes signed as hash-then-sign over the raw payload, uploading only
+# the signature: their downloads are spooled and hashed in blocks rather
+# than buffered whole.  pdf and xml signers need the complete document.
+_STREAM_SIGNED_TYPES = frozenset({"binary"})
+
 
 def process_request(
     request: SignRequest,
@@ -51,6 +82,10 @@ def process_request(
     """
     Process a complete signing request.
 
+    Up to ENGINE_MAX_WORKERS objects are in flight at once.  *progress_fn*
+    and *cancel_check* are called from the worker threads (never
+    concurrently with each other for progress_fn).
+
     Parameters
     ----------
     request : SignRequest
@@ -72,42 +107,79 @@ def process_request(
         Standard §10 response dict, ready to be sent via native messaging.
     """
     builder = ResponseBuilder(request.request_id, request.metadata)
-    resolved = resolve_objects(request)
-    total = len(resolved)
+    total = request.total_object_count
 
     logger.info("Processing %d object(s) for request %s", total, request.request_id)
-
-    for idx, obj in enumerate(resolved):
-        # ── Check cancellation ──────────────────────────────────────────
-        if cancel_check and cancel_check():
-            logger.info("User cancelled at object %d/%d", idx + 1, total)
-            builder.add_error(ObjectError(
-                obj_id=obj.id,
-                code="CANCELLED_BY_USER",
-                message="User cancelled the operation",
-            ))
-            _try_error_callback(obj, request, "CANCELLED_BY_USER", "User cancelled")
-            break
-
-        overall_pct = int((idx / total) * 100) if total > 0 else 0
-
-        try:
-            _process_single_object(
-                obj=obj,
-                request=request,
-                session=session,
-                private_key=private_key,
-                cert_info=cert_info,
-                builder=builder,
-                progress_fn=progress_fn,
-                object_index=idx,
-                total_objects=total,
-            )
-        except Exception as exc:
-            # Catch-all: should not reach here, but safety net
-            logger.error("Unexpected error processing %s: %s", obj.id, exc, exc_info=True)
-            builder.add_error(ObjectError(obj.id, "INTERNAL_ERROR", str(exc)))
-            _try_error_callback(obj, request, "INTERNAL_ERROR", str(exc))
+    pending_callbacks: list[Future] = []
+    progress_prefix = progress_body_prefix(request.request_id, request.metadata)
+    sign_lock = threading.Lock()
+    downloads = _SharedDownloads()
+
+    # ── Progress reporting shared by the workers ────────────────────────
+    finished = 0
+    report: _Reporter | None = None
+    if progress_fn is not None:
+        gui_progress = progress_fn
+        progress_lock = threading.Lock()
+
+        def _report(obj_id: str, message: str) -> None:
+            with progress_lock:
+                gui_progress(obj_id, finished * 100 // total, message)
+
+        report = _report
+
+    outcomes: list[ObjectResult | ObjectError | None] = [None] * total
+    if total:
+        workers = min(ENGINE_MAX_WORKERS, total)
+        pending_objects = enumerate(resolve_objects(request))
+        in_flight: dict[Future, tuple[int, ResolvedObject]] = {}
+        cancelled = False
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sign-object") as pool:
+            while True:
+                # Resolve and submit only as workers free up, so objects are
+                # built lazily.  After a cancellation nothing new starts, as
+                # the sequential loop used to stop at the cancelled object.
+                if not cancelled:
+                    for idx, obj in itertools.islice(pending_objects, workers - len(in_flight)):
+                        fut = pool.submit(
+                            _process_object_safely,
+                            obj=obj,
+                            request=request,
+                            session=session,
+                            private_key=private_key,
+                            cert_info=cert_info,
+                            report=report,
+                            cancel_check=cancel_check,
+                            sign_lock=sign_lock,
+                            downloads=downloads,
+                            object_index=idx,
+                            total_objects=total,
+                            pending_callbacks=pending_callbacks,
+                            progress_prefix=progress_prefix,
+                        )
+                        in_flight[fut] = (idx, obj)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    idx, obj = in_flight.pop(fut)
+                    outcome = outcomes[idx] = fut.result()
+                    finished += 1
+                    if report is not None:
+                        verb = "Completed" if isinstance(outcome, ObjectResult) else "Failed"
+                        report(obj.id, f"{verb} {obj.id}")
+                if cancel_check and cancel_check():
+                    cancelled = True
+
+    for outcome in outcomes:
+        if isinstance(outcome, ObjectResult):
+            builder.add_result(outcome)
+        elif outcome is not None:
+            builder.add_error(outcome)
+
+    # Error callbacks are delivered before the caller sees the response.
+    wait(pending_callbacks)
 
     # Final progress
     if progress_fn:
@@ -116,115 +188,270 @@ def process_request(
     return builder.build()
 
 
+class _SharedDownloads:
+    """
+    Per-request registry that lets objects with the same download source
+    share one GET.
+
+    The first object to ask for a key downloads it; objects asking while
+    that is in flight, or while an earlier holder still has the content,
+    wait on the same future instead of fetching it again.  Every
+    :meth:`fetch` is paired with a :meth:`release`, and an entry is dropped
+    when its last holder releases it, so a request never keeps more than
+    the in-use payloads alive.
+    """
+
+    __slots__ = ("_lock", "_entries")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # key → [future of the body, number of holders]
+        self._entries: dict[_DownloadKey, list] = {}
+
+    def fetch(self, key: _DownloadKey, download: Callable[[], memoryview]) -> memoryview:
+        """Return the body for *key*, calling *download* only if no one else is."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [Future(), 0]
+                owner = True
+            else:
+                owner = False
+            entry[1] += 1
+        fut: Future = entry[0]
+        if owner:
+            try:
+                # Read-only, since several signers may read it at once.
+                fut.set_result(download().toreadonly())
+            except BaseException as exc:
+                fut.set_exception(exc)
+        return fut.result()
+
+    def release(self, key: _DownloadKey) -> None:
+        with self._lock:
+            entry = self._entries[key]
+            entry[1] -= 1
+            if not entry[1]:
+                del self._entries[key]
+
+
+def _download_key(url: Any, method: Any, headers: Mapping[str, Any]) -> _DownloadKey | None:
+    """
+    Key under which this download may be shared, or None to fetch it alone.
+
+    The parser does not type-check header values, so a request with e.g. a
+    list-valued header is not shared (rather than failing to hash here);
+    requests then rejects it as a normal download failure.
+    """
+    if not isinstance(url, str) or not isinstance(method, str):
+        return None
+    if not headers:
+        return url, method, None
+    if not all(type(v) is str for v in headers.values()):
+        return None
+    return url, method, frozenset(headers.items())
+
+
+def _process_object_safely(obj: ResolvedObject, request: SignRequest, **kwargs: Any) -> ObjectResult | ObjectError:
+    """Worker entry point: :func:`_process_single_object`, never raising."""
+    try:
+        return _process_single_object(obj=obj, request=request, **kwargs)
+    except Exception as exc:
+        # Catch-all: should not reach here, but safety net
+        logger.error("Unexpected error processing %s: %s", obj.id, exc, exc_info=True)
+        _try_error_callback(obj, request, "INTERNAL_ERROR", str(exc), kwargs["pending_callbacks"])
+        return ObjectError(obj.id, "INTERNAL_ERROR", str(exc))
+
+
+def _cancelled(
+    obj: ResolvedObject,
+    request: SignRequest,
+    obj_label: str,
+    pending_callbacks: list[Future],
+    after: Future | None = None,
+) -> ObjectError:
+    """Record a user cancellation for *obj* (error callback included)."""
+    logger.info("%s: user cancelled", obj_label)
+    _try_error_callback(obj, request, "CANCELLED_BY_USER", "User cancelled", pending_callbacks, after)
+    return ObjectError(
+        obj_id=obj.id,
+        code="CANCELLED_BY_USER",
+        message="User cancelled the operation",
+    )
+
+
 def _process_single_object(
     obj: ResolvedObject,
     request: SignRequest,
     session: pkcs11.Session,
     private_key: pkcs11.PrivateKey,
     cert_info: CertificateInfo,
-    builder: ResponseBuilder,
-    progress_fn: ProgressCallback | None,
+    report: _Reporter | None,
+    cancel_check: Callable[[], bool] | None,
+    sign_lock: threading.Lock,
+    downloads: _SharedDownloads,
     object_index: int,
     total_objects: int,
-) -> None:
-    """Process a single resolved object: download → sign → upload → callback."""
+    pending_callbacks: list[Future],
+    progress_prefix: bytes,
+) -> ObjectResult | ObjectError:
+    """
+    Process a single resolved object: download → sign → upload → callback.
 
-    obj_label = f"[{object_index + 1}/{total_objects}] {obj.id}"
+    Runs on a worker thread and returns the object's outcome rather than
+    adding it to the response, so process_request can keep request order.
+    """
+
+    # The "[i/n]" position only helps read the INFO/DEBUG trail; when that
+    # is off, warnings and errors name just the object.
+    if logger.isEnabledFor(logging.INFO):
+        obj_label = f"[{object_index + 1}/{total_objects}] {obj.id}"
+    else:
+        obj_label = obj.id
+    # Checked once per object; the level does not change mid-request.
+    debug = logger.isEnabledFor(logging.DEBUG)
+    ctx = obj.ctx
+
+    # ── Check cancellation ──────────────────────────────────────────────
+    if cancel_check and cancel_check():
+        return _cancelled(obj, request, obj_label, pending_callbacks)
 
     # ── Step 1: Progress — starting ─────────────────────────────────────
-    if progress_fn:
-        pct = int((object_index / total_objects) * 100)
-        progress_fn(obj.id, pct, f"Processing {obj.id}...")
+    if report:
+        report(obj.id, f"Processing {obj.id}...")
 
-    _try_progress_callback(obj, request, "signing", 0, f"Starting {obj.id}")
+    posted = _try_progress_callback(
+        obj, request, "signing", 0, f"Starting {obj.id}", progress_prefix, pending_callbacks,
+    )
 
     # ── Step 2: Get content ─────────────────────────────────────────────
     logger.info("%s: acquiring content", obj_label)
 
+    content_bytes: bytes | memoryview = b""
+    content_file: IO[bytes] | None = None
+    download_key: _DownloadKey | None = None
     try:
         if obj.inline_content is not None:
             content_bytes = obj.inline_content.encode("utf-8")
-            logger.debug("%s: inline content, %d bytes", obj_label, len(content_bytes))
-        elif obj.download_url is not None:
-            content_bytes = download_content(
+            if debug:
+                logger.debug("%s: inline content, %d bytes", obj_label, len(content_bytes))
+        elif obj.download_url is not None and ctx.data_type in _STREAM_SIGNED_TYPES:
+            content_file = download_to_file(
                 url=obj.download_url,
-                method=obj.download_method,
-                headers=obj.download_headers,
+                method=ctx.download_method,
+                headers=ctx.download_headers,
             )
-            logger.debug("%s: downloaded %d bytes", obj_label, len(content_bytes))
+        elif obj.download_url is not None:
+            def download() -> memoryview:
+                return download_content(
+                    url=obj.download_url,
+                    method=ctx.download_method,
+                    headers=ctx.download_headers,
+                )
+
+            download_key = _download_key(obj.download_url, ctx.download_method, ctx.download_headers)
+            if download_key is not None:
+                content_bytes = downloads.fetch(download_key, download)
+            else:
+                content_bytes = download()
+            if debug:
+                logger.debug("%s: downloaded %d bytes", obj_label, len(content_bytes))
         else:
             raise ValueError("Object has neither inline content nor download URL")
     except DownloadError as exc:
+        if download_key is not None:
+            downloads.release(download_key)
         logger.error("%s: download failed — %s", obj_label, exc.message)
-        builder.add_error(ObjectError(obj.id, exc.code, exc.message))
-        _try_error_callback(obj, request, exc.code, exc.message)
-        return
+        _try_error_callback(obj, request, exc.code, exc.message, pending_callbacks, posted)
+        return ObjectError(obj.id, exc.code, exc.message)
 
     # ── Step 3: Sign ────────────────────────────────────────────────────
-    logger.info("%s: signing (%s)", obj_label, obj.data_type)
-    _try_progress_callback(obj, request, "signing", 50, f"Signing {obj.id}...")
-
-    if progress_fn:
-        pct = int(((object_index + 0.5) / total_objects) * 100)
-        progress_fn(obj.id, pct, f"Signing {obj.id}...")
-
     try:
-        signed_bytes = sign_content(
-            data=content_bytes,
-            data_type=obj.data_type,
-            private_key=private_key,
-            cert_info=cert_info,
-            session=session,
-            pdf_label=obj.pdf_label,
-            xml_xpath=obj.xml_xpath,
-            xml_id_attribute=obj.xml_id_attribute,
+        if cancel_check and cancel_check():
+            return _cancelled(obj, request, obj_label, pending_callbacks, posted)
+
+        logger.info("%s: signing (%s)", obj_label, ctx.data_type)
+        posted = _try_progress_callback(
+            obj, request, "signing", 50, f"Signing {obj.id}...", progress_prefix, pending_callbacks,
+            after=posted,
         )
-    except SigningError as exc:
-        logger.error("%s: signing failed — %s", obj_label, exc.message)
-        builder.add_error(ObjectError(obj.id, exc.code, exc.message))
-        _try_error_callback(obj, request, exc.code, exc.message)
-        return
+
+        if report:
+            report(obj.id, f"Signing {obj.id}...")
+
+        try:
+            # One token operation at a time; other objects keep downloading
+            # and uploading meanwhile.
+            with sign_lock:
+                if content_file is not None:
+                    signed_bytes = sign_binary_stream(content_file, private_key)
+                else:
+                    signed_bytes = sign_content(
+                        data=content_bytes,
+                        data_type=ctx.data_type,
+                        private_key=private_key,
+                        cert_info=cert_info,
+                        session=session,
+                        pdf_label=ctx.pdf_label,
+                        xml_xpath=ctx.xml_xpath,
+                        xml_id_attribute=ctx.xml_id_attribute,
+                    )
+        except SigningError as exc:
+            logger.error("%s: signing failed — %s", obj_label, exc.message)
+            _try_error_callback(obj, request, exc.code, exc.message, pending_callbacks, posted)
+            return ObjectError(obj.id, exc.code, exc.message)
+    finally:
+        if content_file is not None:
+            content_file.close()
+        if download_key is not None:
+            downloads.release(download_key)
 
     # ── Step 4: Upload ──────────────────────────────────────────────────
+    if cancel_check and cancel_check():
+        return _cancelled(obj, request, obj_label, pending_callbacks, posted)
+
     logger.info("%s: uploading signed content (%d bytes)", obj_label, len(signed_bytes))
-    _try_progress_callback(obj, request, "uploading", 75, f"Uploading {obj.id}...")
+    posted = _try_progress_callback(
+        obj, request, "uploading", 75, f"Uploading {obj.id}...", progress_prefix, pending_callbacks,
+        after=posted,
+    )
 
     try:
         upload_result = upload_signed_content(
             url=obj.upload_url,
             data=signed_bytes,
-            signed_content_type=obj.signed_content_type,
-            method=obj.upload_method,
-            headers=obj.upload_headers,
+            signed_content_type=ctx.signed_content_type,
+            method=ctx.upload_method,
+            headers=ctx.upload_headers,
         )
     except UploadError as exc:
         logger.error("%s: upload failed — %s", obj_label, exc.message)
-        builder.add_error(ObjectError(obj.id, exc.code, exc.message))
-        _try_error_callback(obj, request, exc.code, exc.message)
-        return
+        _try_error_callback(obj, request, exc.code, exc.message, pending_callbacks, posted)
+        return ObjectError(obj.id, exc.code, exc.message)
 
     # ── Step 5: Success callback ────────────────────────────────────────
     logger.info("%s: calling success callback", obj_label)
+    if posted is not None:
+        posted.result()  # progress posts first; never raises
     timestamp = send_success(
-        url=obj.callback_on_success,
+        url=ctx.callback_on_success,
         object_id=obj.id,
         request_id=request.request_id,
         upload_status_code=upload_result.status_code,
         upload_response_body=upload_result.response_body,
         metadata=request.metadata,
-        headers=obj.callback_headers,
+        headers=ctx.callback_headers,
     )
 
     # ── Step 6: Record result ───────────────────────────────────────────
-    builder.add_result(ObjectResult(
+    logger.info("%s: completed successfully", obj_label)
+    return ObjectResult(
         obj_id=obj.id,
         upload_status_code=upload_result.status_code,
         upload_response_body=upload_result.response_body,
         callback_endpoint="onSuccess",
         callback_timestamp=timestamp,
-    ))
-
-    logger.info("%s: completed successfully", obj_label)
+    )
 
 
 # ─── Safe callback helpers (never raise) ────────────────────────────────────
@@ -235,25 +462,51 @@ def _try_progress_callback(
     status: str,
     percent: int,
     message: str,
-) -> bool:
-    """Send a progress callback, catching errors. Returns False on failure."""
-    if not obj.callback_progress:
-        return True
+    body_prefix: bytes | None,
+    pending: list[Future],
+    after: Future | None = None,
+) -> Future | None:
+    """
+    Queue a progress callback in the background, to be sent once *after*
+    (the object's previous post) is done.  Returns the future to chain the
+    next post on — *after* itself if there is no progress endpoint.
+    """
+    if not obj.ctx.callback_progress:
+        return after
+    fut = _PROGRESS_POOL.submit(
+        _send_progress_safely, after, obj, request, status, percent, message, body_prefix
+    )
+    pending.append(fut)
+    return fut
+
+
+def _send_progress_safely(
+    after: Future | None,
+    obj: ResolvedObject,
+    request: SignRequest,
+    status: str,
+    percent: int,
+    message: str,
+    body_prefix: bytes | None,
+) -> None:
+    """Send a progress callback (after *after*), logging any failure."""
+    if after is not None:
+        after.result()  # submitted earlier, so already running or done
+    ctx = obj.ctx
     try:
         send_progress(
-            url=obj.callback_progress,
+            url=ctx.callback_progress,
             object_id=obj.id,
             request_id=request.request_id,
             status=status,
             percent_complete=percent,
             message=message,
             metadata=request.metadata,
-            headers=obj.callback_headers,
+            headers=ctx.callback_headers,
+            body_prefix=body_prefix,
         )
-        return True
     except CallbackError as exc:
         logger.warning("Progress callback failed for %s: %s", obj.id, exc.message)
-        return False
 
 
 def _try_error_callback(
@@ -261,17 +514,35 @@ def _try_error_callback(
     request: SignRequest,
     error_code: str,
     error_message: str,
+    pending: list[Future],
+    after: Future | None = None,
+) -> None:
+    """Queue an error callback in the background (appended to *pending*),
+    sent once *after* (the object's last progress post) is done."""
+    pending.append(_ERROR_CALLBACK_POOL.submit(
+        _send_error_callback_safely, after, obj, request, error_code, error_message
+    ))
+
+
+def _send_error_callback_safely(
+    after: Future | None,
+    obj: ResolvedObject,
+    request: SignRequest,
+    error_code: str,
+    error_message: str,
 ) -> None:
     """Send an error callback, swallowing any failure."""
+    if after is not None:
+        after.result()
     try:
         send_error_callback(
-            url=obj.callback_on_error,
+            url=obj.ctx.callback_on_error,
             object_id=obj.id,
             request_id=request.request_id,
             error_code=error_code,
             error_message=error_message,
             metadata=request.metadata,
-            headers=obj.callback_headers,
+            headers=obj.ctx.callback_headers,
         )
     except Exception as exc:
         logger.warning("Error callback failed for %s: %s", obj.id, exc)
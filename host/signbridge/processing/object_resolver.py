@@ -4,17 +4,24 @@ a uniform list of ResolvedObject instances.
 
 This is the single normalisation point: everything downstream works with
 ResolvedObjects regardless of whether the request used objects or objectGroups.
+
+Settings shared by every object of a group (data type, upload/callback
+configuration, signing options) live in one GroupContext that the group's
+ResolvedObjects reference; each ResolvedObject carries only what differs
+per object.
 """
 
 from __future__ import annotations
 
 import dataclasses as dc
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping
 
 from signbridge.messaging.request_parser import (
     SignRequest,
     SignObject,
     ObjectGroup,
+    OBJECT_ID_PLACEHOLDER,
     ContentInline,
     ContentRemote,
     GroupInlineObject,
@@ -28,35 +35,41 @@ from signbridge.utils.logging_setup import get_logger
 
 logger = get_logger("processing.object_resolver")
 
+# Shared read-only stand-in for every absent or empty header set, so a
+# request of standalone objects does not carry an empty dict per object.
+_EMPTY: Mapping[str, str] = MappingProxyType({})
 
-@dc.dataclass
-class ResolvedObject:
-    """
-    A fully-resolved signable item with all URLs/content/options computed.
+# Default callback POST headers (contexts built here always pass the
+# parser's merged set).
+_JSON_HEADERS: Mapping[str, str] = MappingProxyType({"Content-Type": "application/json"})
 
-    Regardless of whether the original request used `objects` or `objectGroups`,
-    every object is normalised into this structure.
+
+@dc.dataclass(frozen=True, slots=True)
+class GroupContext:
+    """
+    Settings shared by every object of one objectGroup (or, for `objects[]`,
+    of a single object).  The header mappings are the parser's own dicts (or
+    the shared empty one) and must be treated as read-only.
     """
-    id: str
     data_type: str
 
-    # Content — exactly one of these is set:
-    inline_content: str | None = None      # UTF-8 text (for inline mode)
-    download_url: str | None = None        # Final URL (for remote mode)
+    # Download (remote mode)
     download_method: str = "GET"
-    download_headers: dict[str, str] = dc.field(default_factory=dict)
+    # (mappingproxy is unhashable, so dataclasses wants these as factories)
+    download_headers: Mapping[str, str] = dc.field(default_factory=lambda: _EMPTY)
 
     # Upload
-    upload_url: str = ""                   # Final URL (with <objectId> substituted)
     upload_method: str = "POST"
-    upload_headers: dict[str, str] = dc.field(default_factory=dict)
+    upload_headers: Mapping[str, str] = dc.field(default_factory=lambda: _EMPTY)
     signed_content_type: str = "string"
 
     # Callbacks
     callback_on_success: str = ""
     callback_on_error: str = ""
     callback_progress: str | None = None
-    callback_headers: dict[str, str] = dc.field(default_factory=dict)
+    # Complete POST headers (Content-Type included) — the parser's merged
+    # CallbacksConfig.post_headers.
+    callback_headers: Mapping[str, str] = dc.field(default_factory=lambda: _JSON_HEADERS)
 
     # Type-specific options
     pdf_label: str | None = None
@@ -64,12 +77,46 @@ class ResolvedObject:
     xml_id_attribute: str | None = None
 
 
-def resolve_objects(request: SignRequest) -> list[ResolvedObject]:
+class ResolvedObject:
+    """
+    A fully-resolved signable item with all URLs/content computed.
+
+    Regardless of whether the original request used `objects` or `objectGroups`,
+    every object is normalised into this structure; its shared settings are
+    in :attr:`ctx`.  One is built per object, so it is a plain slotted class
+    with a hand-written ``__init__`` rather than a dataclass.
     """
-    Resolve all objects from a parsed SignRequest into a flat list.
+
+    __slots__ = ("id", "ctx", "inline_content", "download_url", "upload_url")
+
+    def __init__(
+        self,
+        id: str,
+        ctx: GroupContext,
+        inline_content: str | None = None,
+        download_url: str | None = None,
+        upload_url: str = "",
+    ) -> None:
+        self.id = id
+        self.ctx = ctx
+        # Content — exactly one of these is set:
+        self.inline_content = inline_content    # UTF-8 text (for inline mode)
+        self.download_url = download_url        # Final URL (for remote mode)
+        self.upload_url = upload_url            # Final URL (with <objectId> substituted)
+
+    def __repr__(self) -> str:
+        return f"ResolvedObject(id={self.id!r}, upload_url={self.upload_url!r})"
+
+
+def resolve_objects(request: SignRequest) -> Iterator[ResolvedObject]:
+    """
+    Resolve all objects from a parsed SignRequest, lazily and in order.
 
     Handles both `request.objects` (Standard §6) and
-    `request.object_groups` (Standard §7).
+    `request.object_groups` (Standard §7).  Objects are built as they are
+    consumed, so a large request is never held resolved all at once; wrap
+    in ``list()`` for random access, and use
+    ``request.total_object_count`` for the total.
     """
     if request.objects is not None:
         return _resolve_from_objects(request.objects)
@@ -77,88 +124,112 @@ def resolve_objects(request: SignRequest) -> list[ResolvedObject]:
         return _resolve_from_groups(request.object_groups)
     else:
         # Should never happen — parser already validates this
-        return []
+        return iter(())
 
 
-def _resolve_from_objects(objects: list[SignObject]) -> list[ResolvedObject]:
+def _resolve_from_objects(objects: list[SignObject]) -> Iterator[ResolvedObject]:
     """Resolve from the top-level objects[] array."""
-    resolved: list[ResolvedObject] = []
+    logger.info("Resolving %d object(s) from objects[]", len(objects))
 
     for obj in objects:
-        ro = ResolvedObject(
-            id=obj.id,
-            data_type=obj.data_type,
-            # Upload
-            upload_url=_sub_id(obj.upload.upload_url, obj.id),
-            upload_method=obj.upload.http_method,
-            upload_headers=obj.upload.headers,
-            signed_content_type=obj.upload.signed_content_type,
-            # Callbacks
-            callback_on_success=obj.callbacks.on_success,
-            callback_on_error=obj.callbacks.on_error,
-            callback_progress=obj.callbacks.progress,
-            callback_headers=obj.callbacks.headers,
-            # PDF/XML options
-            pdf_label=obj.pdf_options.label if obj.pdf_options else None,
-            xml_xpath=obj.xml_options.xpath if obj.xml_options else None,
-            xml_id_attribute=obj.xml_options.id_attribute if obj.xml_options else None,
+        remote = obj.content if isinstance(obj.content, ContentRemote) else None
+        ctx = _context(
+            obj.data_type, obj.upload, obj.callbacks, obj.pdf_options, obj.xml_options,
+            download_method=remote.http_method if remote else "GET",
+            download_headers=remote.headers if remote else None,
+        )
+        yield ResolvedObject(
+            obj.id,
+            ctx,
+            # Content
+            obj.content.content if isinstance(obj.content, ContentInline) else None,
+            remote.download_url if remote is not None else None,
+            _sub_id(obj.upload.upload_url, obj.id),
         )
-
-        # Content
-        if isinstance(obj.content, ContentInline):
-            ro.inline_content = obj.content.content
-        elif isinstance(obj.content, ContentRemote):
-            ro.download_url = obj.content.download_url
-            ro.download_method = obj.content.http_method
-            ro.download_headers = obj.content.headers
-
-        resolved.append(ro)
-
-    logger.info("Resolved %d object(s) from objects[]", len(resolved))
-    return resolved
 
 
-def _resolve_from_groups(groups: list[ObjectGroup]) -> list[ResolvedObject]:
+def _resolve_from_groups(groups: list[ObjectGroup]) -> Iterator[ResolvedObject]:
     """Resolve from objectGroups[] with <objectId> template substitution."""
-    resolved: list[ResolvedObject] = []
+    logger.info(
+        "Resolving %d object(s) from %d objectGroup(s)",
+        sum(len(group.objects) for group in groups),
+        len(groups),
+    )
 
     for group in groups:
+        # Split the upload template once per group; each object's URL is
+        # then a concatenation.  A template repeating the placeholder keeps
+        # full substitution.
+        upload_template = group.upload.upload_url
+        up_pre, up_sep, up_suf = upload_template.partition(OBJECT_ID_PLACEHOLDER)
+        up_split = bool(up_sep) and OBJECT_ID_PLACEHOLDER not in up_suf
+
+        # One context for the whole group.
+        ctx = _context(
+            group.data_type, group.upload, group.callbacks, group.pdf_options, group.xml_options,
+            download_headers=group.download_headers,
+        )
+
         for obj in group.objects:
             obj_id = obj.id
-
-            ro = ResolvedObject(
-                id=obj_id,
-                data_type=group.data_type,
-                # Upload (substitute <objectId>)
-                upload_url=_sub_id(group.upload.upload_url, obj_id),
-                upload_method=group.upload.http_method,
-                upload_headers=group.upload.headers,
-                signed_content_type=group.upload.signed_content_type,
-                # Callbacks
-                callback_on_success=group.callbacks.on_success,
-                callback_on_error=group.callbacks.on_error,
-                callback_progress=group.callbacks.progress,
-                callback_headers=group.callbacks.headers,
-                # PDF/XML options
-                pdf_label=group.pdf_options.label if group.pdf_options else None,
-                xml_xpath=group.xml_options.xpath if group.xml_options else None,
-                xml_id_attribute=group.xml_options.id_attribute if group.xml_options else None,
-            )
+            inline_content = download_url = None
 
             if group.mode == "inline" and isinstance(obj, GroupInlineObject):
-                ro.inline_content = obj.value
+                inline_content = obj.value
             elif group.mode == "remote":
                 assert group.download_url is not None
-                ro.download_url = _sub_id(group.download_url, obj_id)
-                ro.download_method = "GET"
-                ro.download_headers = group.download_headers
+                if group.download_url_prefix is not None:
+                    download_url = group.download_url_prefix + obj_id + group.download_url_suffix
+                else:
+                    download_url = _sub_id(group.download_url, obj_id)
+
+            yield ResolvedObject(
+                obj_id,
+                ctx,
+                inline_content,
+                download_url,
+                # Upload (substitute <objectId>)
+                up_pre + obj_id + up_suf if up_split else _sub_id(upload_template, obj_id),
+            )
 
-            resolved.append(ro)
 
-    logger.info("Resolved %d object(s) from %d objectGroup(s)", len(resolved), len(groups))
-    return resolved
+def _context(
+    data_type: str,
+    upload: UploadConfig,
+    callbacks: CallbacksConfig,
+    pdf_options: PdfOptions | None,
+    xml_options: XmlOptions | None,
+    download_method: str = "GET",
+    download_headers: dict[str, str] | None = None,
+) -> GroupContext:
+    """Build the GroupContext for one object's or group's configuration."""
+    return GroupContext(
+        data_type=data_type,
+        # HTTP methods are upper-cased here, once per context, rather than
+        # by the network calls for every object.
+        download_method=_upper(download_method),
+        download_headers=download_headers or _EMPTY,
+        # Upload
+        upload_method=_upper(upload.http_method),
+        upload_headers=upload.headers or _EMPTY,
+        signed_content_type=upload.signed_content_type,
+        # Callbacks
+        callback_on_success=callbacks.on_success,
+        callback_on_error=callbacks.on_error,
+        callback_progress=callbacks.progress,
+        callback_headers=callbacks.post_headers,
+        # PDF/XML options
+        pdf_label=pdf_options.label if pdf_options else None,
+        xml_xpath=xml_options.xpath if xml_options else None,
+        xml_id_attribute=xml_options.id_attribute if xml_options else None,
+    )
+
+
+def _upper(method: Any) -> Any:
+    """Upper-case an HTTP method (non-str values pass through, for the request to reject)."""
+    return method.upper() if isinstance(method, str) else method
 
 
 def _sub_id(template: str, object_id: str) -> str:
     """Substitute <objectId> placeholder in a URL template."""
-    return template.replace("<objectId>", object_id)
+    return template.replace(OBJECT_ID_PLACEHOLDER, object_id)
@@ -0,0 +1,35 @@
+"""
+JSON codec shared by native messaging and the HTTP callbacks.
+
+Both sides speak compact UTF-8 JSON bytes.  orjson, when installed, parses
+straight from bytes (or any buffer) and serialises straight to UTF-8 bytes,
+skipping the str round-trip; otherwise the stdlib json module is used with
+equivalent output.  orjson's JSONDecodeError subclasses
+json.JSONDecodeError, so callers catch one type whichever codec is active.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional accelerator — stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+    def json_loads(data: bytes) -> Any:
+        """Parse UTF-8 JSON from *data* (bytes, bytearray or memoryview)."""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialise *obj* to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+else:
+    def json_loads(data: bytes) -> Any:
+        """Parse UTF-8 JSON from *data* (bytes, bytearray or memoryview)."""
+        return json.loads(str(data, "utf-8"))
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialise *obj* to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
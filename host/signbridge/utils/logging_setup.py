@@ -2,17 +2,24 @@
 Logging configuration for SignBridge.
 
 Writes to both a rotating file log and stderr (never stdout, which is
-reserved for native messaging).
+reserved for native messaging).  Both handlers run on a QueueListener
+thread: a log call only enqueues the record, so disk writes (and log
+rotation) never block the engine or GUI threads.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from signbridge.config import LOG_DIR, LOG_FILE, LOG_MAX_BYTES, LOG_BACKUP_COUNT, APP_NAME
 
 _initialised = False
 
+# get_logger() results by short name.
+_loggers: dict[str, logging.Logger] = {}
+
 
 def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
     """
@@ -43,13 +50,18 @@ def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
     )
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(fmt)
-    logger.addHandler(fh)
 
     # ── Stderr handler (never stdout — that's native messaging) ─────────
     sh = logging.StreamHandler(sys.stderr)
     sh.setLevel(logging.WARNING)
     sh.setFormatter(fmt)
-    logger.addHandler(sh)
+
+    # ── Queue in front of both ──────────────────────────────────────────
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(records, fh, sh, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # drains what is still queued
+    logger.addHandler(QueueHandler(records))
 
     _initialised = True
     return logger
@@ -57,4 +69,7 @@ def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
 
 def get_logger(name: str) -> logging.Logger:
     """Return a child logger under the signbridge namespace."""
-    return logging.getLogger(f"{APP_NAME}.{name}")
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = logging.getLogger(f"{APP_NAME}.{name}")
+    return logger